@@ -0,0 +1,96 @@
+"""This series of tests illustrates the flush of a large number of objects
+in a self-referential, adjacency list relationship, where the unit of work
+sorts individual rows by dependency rather than whole tables.
+
+
+"""
+from sqlalchemy import Column
+from sqlalchemy import create_engine
+from sqlalchemy import ForeignKey
+from sqlalchemy import Integer
+from sqlalchemy import String
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session
+from sqlalchemy.util import topological
+from . import Profiler
+
+
+Base = declarative_base()
+engine = None
+
+
+class Node(Base):
+    __tablename__ = "node"
+    id = Column(Integer, primary_key=True)
+    parent_id = Column(Integer, ForeignKey("node.id"))
+    data = Column(String(255))
+    children = relationship("Node")
+
+
+Profiler.init("adjacency_list_flush", num=10000)
+
+
+@Profiler.setup
+def setup_database(dburl, echo, num):
+    global engine
+    engine = create_engine(dburl, echo=echo)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+
+def _chain(n):
+    root = node = Node(data="node 0")
+    for i in range(1, n):
+        child = Node(data="node %d" % i)
+        node.children.append(child)
+        node = child
+    return root
+
+
+@Profiler.profile
+def test_topological_sort(n):
+    """Sort a chain of nodes directly using util.topological."""
+    tuples = [(i, i + 1) for i in range(n - 1)]
+    for node in topological.sort(tuples, range(n), deterministic_order=True):
+        pass
+
+
+@Profiler.profile
+def test_flush_chain(n):
+    """INSERT a single chain of nodes, each the parent of the next."""
+    session = Session(bind=engine)
+    session.add(_chain(n))
+    session.commit()
+
+
+@Profiler.profile
+def test_flush_wide_tree(n):
+    """INSERT a tree of nodes, each with up to ten children."""
+    session = Session(bind=engine)
+    nodes = [Node(data="node 0")]
+    for i in range(1, n):
+        node = Node(data="node %d" % i)
+        nodes[(i - 1) // 10].children.append(node)
+        nodes.append(node)
+    session.add(nodes[0])
+    session.commit()
+
+
+@Profiler.profile
+def test_delete_chain(n):
+    """DELETE a single chain of nodes, each the parent of the next."""
+    session = Session(bind=engine)
+    root = _chain(n)
+    session.add(root)
+    session.flush()
+
+    node = root
+    while node is not None:
+        session.delete(node)
+        node = node.children[0] if node.children else None
+    session.commit()
+
+
+if __name__ == "__main__":
+    Profiler.main()
@@ -76,6 +76,31 @@ def test_orm_full_objects_chunks(n):
         pass
 
 
+@Profiler.profile
+def test_orm_full_objects_compiled_populators(n):
+    """Load fully tracked ORM objects using generated row population
+    functions."""
+
+    sess = Session(engine)
+    list(
+        sess.query(Customer)
+        .execution_options(compile_populators=True)
+        .limit(n)
+    )
+
+
+@Profiler.profile
+def test_orm_readonly_entities(n):
+    """Load ORM objects without session state using readonly_entities."""
+
+    sess = Session(engine)
+    list(
+        sess.query(Customer)
+        .execution_options(readonly_entities=True)
+        .limit(n)
+    )
+
+
 @Profiler.profile
 def test_orm_bundles(n):
     """Load lightweight "bundle" objects using the ORM."""
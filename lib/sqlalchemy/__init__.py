@@ -144,6 +144,7 @@ def __go(lcls):
     )
 
     _sa_util.dependencies.resolve_all("sqlalchemy")
+    _sa_util.preloaded.import_prefix("sqlalchemy")
 
 
 __go(locals())
@@ -2337,6 +2337,8 @@ class MSDialect(default.DefaultDialect):
             and "implicit_returning" not in self.__dict__
         ):
             self.implicit_returning = True
+        if self.server_version_info >= MS_2005_VERSION:
+            self.full_returning = True
         if self.server_version_info >= MS_2008_VERSION:
             self.supports_multivalues_insert = True
         if self.deprecate_large_types is None:
@@ -2100,6 +2100,7 @@ class MySQLDialect(default.DefaultDialect):
     supports_sane_rowcount = True
     supports_sane_multi_rowcount = False
     supports_multivalues_insert = True
+    supports_tuple_in = True
 
     supports_comments = True
     inline_comments = True
@@ -1131,6 +1131,7 @@ class OracleDialect(default.DefaultDialect):
     supports_comments = True
     supports_default_values = False
     supports_empty_insert = False
+    supports_tuple_in = True
 
     statement_compiler = OracleCompiler
     ddl_compiler = OracleDDLCompiler
@@ -2358,6 +2358,7 @@ class PGDialect(default.DefaultDialect):
     supports_default_values = True
     supports_empty_insert = False
     supports_multivalues_insert = True
+    supports_tuple_in = True
     default_paramstyle = "pyformat"
     ischema_names = ischema_names
     colspecs = colspecs
@@ -2419,6 +2420,7 @@ class PGDialect(default.DefaultDialect):
             8,
             2,
         ) and self.__dict__.get("implicit_returning", True)
+        self.full_returning = self.server_version_info > (8, 2)
         self.supports_native_enum = self.server_version_info >= (8, 3)
         if not self.supports_native_enum:
             self.colspecs = self.colspecs.copy()
@@ -1394,6 +1394,7 @@ class SQLiteDialect(default.DefaultDialect):
     supports_empty_insert = False
     supports_cast = True
     supports_multivalues_insert = True
+    supports_tuple_in = True
     tuple_in_values = True
 
     default_paramstyle = "qmark"
@@ -1486,6 +1487,12 @@ class SQLiteDialect(default.DefaultDialect):
                 self.dbapi.sqlite_version_info
                 >= (3, 7, 11)
             )
+            # row values, http://www.sqlite.org/releaselog/3_15_0.html
+            self.supports_tuple_in = self.dbapi.sqlite_version_info >= (
+                3,
+                15,
+                0,
+            )
             # see http://www.sqlalchemy.org/trac/ticket/2568
             # as well as http://www.sqlite.org/src/info/600482d161
             self._broken_fk_pragma_quotes = self.dbapi.sqlite_version_info < (
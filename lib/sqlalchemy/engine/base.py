@@ -7,7 +7,9 @@
 from __future__ import with_statement
 
 import contextlib
+import itertools
 import sys
+import time
 
 from .interfaces import Connectable
 from .interfaces import ExceptionContext
@@ -1221,10 +1223,13 @@ class Connection(Connectable):
                 )
 
         if self._echo:
-            self.engine.logger.info(statement)
-            self.engine.logger.info(
-                "%r", sql_util._repr_params(parameters, batches=10)
-            )
+            if self.engine._echo_threshold is not None:
+                echo_start = time.time()
+            elif self.engine._echo_sampled():
+                self.engine.logger.info(statement)
+                self.engine.logger.info(
+                    "%r", sql_util._repr_params(parameters, batches=10)
+                )
 
         evt_handled = False
         try:
@@ -1262,6 +1267,15 @@ class Connection(Connectable):
             self._handle_dbapi_exception(
                 e, statement, parameters, cursor, context
             )
+        finally:
+            # a statement which fails, such as due to a timeout, is
+            # logged as well
+            if self._echo and self.engine._echo_threshold is not None:
+                self._log_slow_statement(
+                    statement,
+                    sql_util._repr_params(parameters, batches=10),
+                    time.time() - echo_start,
+                )
 
         if self._has_events or self.engine._has_events:
             self.dispatch.after_cursor_execute(
@@ -1317,8 +1331,11 @@ class Connection(Connectable):
                 )
 
         if self._echo:
-            self.engine.logger.info(statement)
-            self.engine.logger.info("%r", parameters)
+            if self.engine._echo_threshold is not None:
+                echo_start = time.time()
+            elif self.engine._echo_sampled():
+                self.engine.logger.info(statement)
+                self.engine.logger.info("%r", parameters)
         try:
             for fn in (
                 ()
@@ -1333,12 +1350,30 @@ class Connection(Connectable):
             self._handle_dbapi_exception(
                 e, statement, parameters, cursor, context
             )
+        finally:
+            if self._echo and self.engine._echo_threshold is not None:
+                self._log_slow_statement(
+                    statement, parameters, time.time() - echo_start
+                )
 
         if self._has_events or self.engine._has_events:
             self.dispatch.after_cursor_execute(
                 self, cursor, statement, parameters, context, False
             )
 
+    def _log_slow_statement(self, statement, parameters, elapsed):
+        """Log a statement which was deferred until after execution
+        due to the :paramref:`.create_engine.echo_threshold` setting.
+
+        The ``parameters`` object is passed to the logger as an argument
+        so that its ``repr()`` is only rendered if the record is emitted.
+
+        """
+        engine = self.engine
+        if elapsed >= engine._echo_threshold and engine._echo_sampled():
+            engine.logger.info(statement)
+            engine.logger.info("%r [%.5fs elapsed]", parameters, elapsed)
+
     def _safe_close_cursor(self, cursor):
         """Close the given cursor, catching exceptions
         and turning into log warnings.
@@ -1878,6 +1913,8 @@ class Engine(Connectable, log.Identified):
     _execution_options = util.immutabledict()
     _has_events = False
     _connection_cls = Connection
+    _echo_sample = None
+    _echo_threshold = None
 
     schema_for_object = schema._schema_getter(None)
     """Return the ".schema" attribute for an object.
@@ -1904,6 +1941,8 @@ class Engine(Connectable, log.Identified):
         echo=None,
         proxy=None,
         execution_options=None,
+        echo_sample=None,
+        echo_threshold=None,
     ):
         self.pool = pool
         self.url = url
@@ -1912,6 +1951,16 @@ class Engine(Connectable, log.Identified):
             self.logging_name = logging_name
         self.echo = echo
         log.instance_logger(self, echoflag=echo)
+        if echo_sample is not None:
+            echo_sample = int(echo_sample)
+            if echo_sample < 1:
+                raise exc.ArgumentError(
+                    "echo_sample must be a positive integer"
+                )
+            self._echo_sample = echo_sample
+            self._echo_counter = itertools.count()
+        if echo_threshold is not None:
+            self._echo_threshold = float(echo_threshold)
         if proxy:
             interfaces.ConnectionProxy._adapt_listener(self, proxy)
         if execution_options:
@@ -2037,6 +2086,15 @@ class Engine(Connectable, log.Identified):
 
     echo = log.echo_property()
 
+    def _echo_sampled(self):
+        """Return True if the current statement should be logged, given
+        the :paramref:`.create_engine.echo_sample` setting."""
+
+        return (
+            self._echo_sample is None
+            or next(self._echo_counter) % self._echo_sample == 0
+        )
+
     def __repr__(self):
         return "Engine(%r)" % self.url
 
@@ -2340,6 +2398,10 @@ class OptionEngine(Engine):
         self.logging_name = proxied.logging_name
         self.echo = proxied.echo
         log.instance_logger(self, echoflag=self.echo)
+        self._echo_sample = proxied._echo_sample
+        self._echo_threshold = proxied._echo_threshold
+        if proxied._echo_sample is not None:
+            self._echo_counter = proxied._echo_counter
 
         # note: this will propagate events that are assigned to the parent
         # engine after this OptionEngine is created.   Since we share
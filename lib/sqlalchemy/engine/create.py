@@ -116,6 +116,22 @@ def create_engine(url, **kwargs):
             :ref:`dbengine_logging` - further detail on how to configure
             logging.
 
+    :param echo_sample=None: when statement logging is enabled, either via
+        the ``echo`` flag or via the ``sqlalchemy.engine`` logger, log only
+        one out of every N statements, where N is the integer value given.
+        The first statement is always logged.  When combined with
+        :paramref:`.create_engine.echo_threshold`, the sampling applies
+        only to those statements which exceed the threshold.
+
+        .. versionadded:: 1.4
+
+    :param echo_threshold=None: when statement logging is enabled, defer
+        logging of each statement until after it has been executed, and
+        log it only if its execution time, in seconds, was at least the
+        given value.  The elapsed time is included in the logged output.
+
+        .. versionadded:: 1.4
+
     :param echo_pool=False: if True, the connection pool will log
         informational output such as when connections are invalidated
         as well as when connections are recycled to the default log handler,
@@ -64,6 +64,7 @@ class DefaultDialect(interfaces.Dialect):
     preexecute_autoincrement_sequences = False
     postfetch_lastrowid = True
     implicit_returning = False
+    full_returning = False
 
     supports_right_nested_joins = True
     cte_follows_insert = False
@@ -124,6 +125,7 @@ class DefaultDialect(interfaces.Dialect):
     supports_default_values = False
     supports_empty_insert = True
     supports_multivalues_insert = False
+    supports_tuple_in = False
 
     supports_server_side_cursors = False
 
@@ -109,6 +109,11 @@ class Dialect(object):
       the "implicit" functionality is not used and inserted_primary_key
       will not be available.
 
+    full_returning
+      True if the dialect supports RETURNING or equivalent for UPDATE and
+      DELETE statements which affect multiple rows, returning a row for
+      each.
+
     colspecs
       A dictionary of TypeEngine classes from sqlalchemy.types mapped
       to subclasses that are specific to the dialect class.  This
@@ -119,6 +124,10 @@ class Dialect(object):
       Indicates if the construct ``INSERT INTO tablename DEFAULT
       VALUES`` is supported
 
+    supports_tuple_in
+      Indicates if the construct ``(x, y) IN ((x1, y1), (x2, y2), ...)``
+      is supported.
+
     supports_sequences
       Indicates if the dialect supports CREATE SEQUENCE or similar.
 
@@ -15,13 +15,32 @@ the source distribution.
 
 """
 
+import bisect
+import copy
+import heapq
+import itertools
+import zlib
+
+from .. import exc
 from .. import inspect
 from .. import util
+from ..orm.base import instance_str
+from ..orm.query import _ColumnEntity
+from ..orm.query import _MapperEntity
 from ..orm.query import Query
 from ..orm.session import Session
+from ..sql import elements
+from ..sql import operators
 
 
-__all__ = ["ShardedSession", "ShardedQuery"]
+__all__ = [
+    "ShardedSession",
+    "ShardedQuery",
+    "ShardMap",
+    "ListShardMap",
+    "RangeShardMap",
+    "HashShardMap",
+]
 
 
 class ShardedQuery(Query):
@@ -54,14 +73,97 @@ class ShardedQuery(Query):
             return iter_for_shard(context.identity_token)
         elif self._shard_id is not None:
             return iter_for_shard(self._shard_id)
+
+        shard_ids = list(self.query_chooser(self))
+        if len(shard_ids) == 1:
+            return iter_for_shard(shard_ids[0])
         else:
-            partial = []
-            for shard_id in self.query_chooser(self):
-                partial.extend(iter_for_shard(shard_id))
+            return self._execute_for_shards(context, shard_ids)
+
+    def _execute_for_shards(self, context, shard_ids):
+        """Execute the given context against multiple shards, merging
+        the results into a single iterator.
+
+        The statement is emitted for each shard up front, concurrently
+        if the :class:`.ShardedSession` was given an ``executor``; rows
+        are then converted into ORM results for each shard individually
+        and merged lazily according to the ORDER BY of the query.
+        LIMIT and OFFSET are applied to the merged results.
+
+        """
+        query = self
+        limit, offset = self._limit, self._offset
+        ordering = _merge_ordering(self)
+        if ordering is not None:
+            # the ORDER BY columns are added to the result, so that rows
+            # are merged on the values the database sorted them by, rather
+            # than on those of possibly modified objects in the identity map
+            query = self.add_columns(*[column for column, d, n in ordering])
+        if limit is not None or offset is not None:
+            # each shard needs to return enough rows to satisfy the
+            # LIMIT / OFFSET as applied to the merged results
+            query = query._clone()
+            if limit is not None:
+                query._limit = limit + (offset or 0)
+            query._offset = None
+        if query is not self:
+            context = query._compile_context()
+            context.statement.use_labels = True
+
+        contexts = []
+        connections = []
+        for shard_id in shard_ids:
+            shard_context = copy.copy(context)
+            shard_context.attributes = context.attributes.copy()
+            shard_context.attributes["shard_id"] = shard_id
+            shard_context.identity_token = shard_id
+            contexts.append(shard_context)
+
+            # connections are acquired up front, as the Session is
+            # not threadsafe; only statement execution is handed off
+            # to the executor.
+            connections.append(
+                query._connection_from_session(
+                    mapper=query._bind_mapper(), shard_id=shard_id
+                )
+            )
 
-            # if some kind of in memory 'sorting'
-            # were done, this is where it would happen
-            return iter(partial)
+        executor = self.session.executor
+        if executor is not None:
+            futures = [
+                executor.submit(conn.execute, context.statement, query._params)
+                for conn in connections
+            ]
+            results = [future.result() for future in futures]
+        else:
+            results = [
+                conn.execute(context.statement, query._params)
+                for conn in connections
+            ]
+
+        iterators = [
+            query.instances(result, shard_context)
+            for result, shard_context in zip(results, contexts)
+        ]
+
+        if ordering is not None:
+            num_entities = len(self._entities)
+            merged = _strip_columns(
+                _merge(iterators, _merge_sort_key(ordering, num_entities)),
+                num_entities,
+                not self._only_return_tuples
+                and num_entities == 1
+                and self._entities[0].supports_single_entity,
+            )
+        else:
+            merged = itertools.chain(*iterators)
+
+        if limit is not None or offset is not None:
+            offset = offset or 0
+            merged = itertools.islice(
+                merged, offset, offset + limit if limit is not None else None
+            )
+        return merged
 
     def _execute_crud(self, stmt, mapper):
         def exec_for_shard(shard_id):
@@ -86,6 +188,11 @@ class ShardedQuery(Query):
 
             return ShardedResult(results, rowcount)
 
+    def _crud_returning_supported(self, mapper, table):
+        # rows returned by each shard would need to be associated with
+        # the shard's identity token; use a SELECT per shard instead
+        return False
+
     def _identity_lookup(
         self,
         mapper,
@@ -153,6 +260,152 @@ class ShardedQuery(Query):
         )
 
 
+class _Reversed(object):
+    """Invert the comparison of a value, for DESC ordering."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
+def _merge(iterators, sort_key):
+    """Lazily merge already-sorted ORM result iterators."""
+
+    def decorate(idx, iterator):
+        for seq, row in enumerate(iterator):
+            yield sort_key(row), idx, seq, row
+
+    for item in heapq.merge(
+        *[decorate(idx, iterator) for idx, iterator in enumerate(iterators)]
+    ):
+        yield item[3]
+
+
+def _merge_ordering(query):
+    """Return a list of ``(column, descending, nulls_first)`` tuples
+    corresponding to the ORDER BY criterion of the given query.
+
+    Returns None if the query is not ordered, if any of the ORDER BY
+    expressions can't be located within the entities of the query, or
+    if an expression which may be NULL doesn't state NULLS FIRST /
+    NULLS LAST, as the position of NULL values otherwise varies by
+    backend.
+
+    """
+    if not query._order_by:
+        return None
+
+    ordering = []
+    for element in query._order_by:
+        descending = False
+        nulls_first = None
+        while isinstance(
+            element, elements.UnaryExpression
+        ) and operators.is_ordering_modifier(element.modifier):
+            if element.modifier is operators.desc_op:
+                descending = True
+            elif element.modifier is operators.nullsfirst_op:
+                nulls_first = True
+            elif element.modifier is operators.nullslast_op:
+                nulls_first = False
+            element = element.element
+        if isinstance(element, elements._label_reference):
+            element = element.element
+
+        column = _order_by_column(query, element)
+        if column is None:
+            return None
+
+        if nulls_first is None:
+            if getattr(column, "nullable", True):
+                return None
+            nulls_first = False
+        ordering.append((column, descending, nulls_first))
+
+    return ordering
+
+
+def _order_by_column(query, element):
+    """Return the column expression corresponding to the given ORDER BY
+    expression within the entities of the query, or None."""
+
+    if isinstance(element, elements._textual_label_reference):
+        for entity in query._entities:
+            if (
+                isinstance(entity, _ColumnEntity)
+                and entity._label_name == element.element
+            ):
+                column = entity.column
+                break
+        else:
+            return None
+    else:
+        column = element
+
+    while isinstance(column, elements.Label):
+        column = column.element
+    column = column._deannotate()
+
+    for entity in query._entities:
+        if isinstance(entity, _MapperEntity):
+            if (
+                not entity.is_aliased_class
+                and column in entity.mapper._columntoproperty
+            ):
+                return column
+        elif isinstance(entity, _ColumnEntity):
+            entity_column = entity.column
+            while isinstance(entity_column, elements.Label):
+                entity_column = entity_column.element
+            if entity_column._deannotate() is column:
+                return column
+    return None
+
+
+def _merge_sort_key(ordering, offset):
+    """Return a function which produces a sort key for result rows, given
+    the ORDER BY columns as located in each row starting at ``offset``."""
+
+    getters = [
+        (offset + idx, descending, -1 if nulls_first is not descending else 1)
+        for idx, (column, descending, nulls_first) in enumerate(ordering)
+    ]
+
+    def sort_key(row):
+        key = []
+        for idx, descending, null_rank in getters:
+            value = row[idx]
+            value = (null_rank, None) if value is None else (0, value)
+            key.append(_Reversed(value) if descending else value)
+        return key
+
+    return sort_key
+
+
+def _strip_columns(rows, num_entities, single_entity):
+    """Remove the trailing ORDER BY columns added for merging from
+    ORM result rows."""
+
+    if single_entity:
+        for row in rows:
+            yield row[0]
+    else:
+        keyed_tuple = None
+        for row in rows:
+            if keyed_tuple is None:
+                keyed_tuple = util.lightweight_named_tuple(
+                    "result", row._real_fields[0:num_entities]
+                )
+            yield keyed_tuple(row[0:num_entities])
+
+
 class ShardedResult(object):
     """A value object that represents multiple :class:`.ResultProxy` objects.
 
@@ -177,14 +430,400 @@ class ShardedResult(object):
         return self.aggregate_rowcount
 
 
+class ShardMap(object):
+    """Describe how rows are distributed among shards based on the value
+    of a single column.
+
+    A :class:`.ShardMap` passed to :class:`.ShardedSession` provides default
+    implementations of the ``shard_chooser``, ``id_chooser`` and
+    ``query_chooser`` functions.  The WHERE criterion of a :class:`.Query`
+    is analyzed for comparisons of the column against literal values,
+    including equality, IN, BETWEEN and range comparisons combined with
+    AND and OR, and only those shards which could contain matching rows are
+    queried.  Criteria which can't be analyzed result in all shards being
+    queried.
+
+    The concrete implementations are :class:`.ListShardMap`,
+    :class:`.RangeShardMap` and :class:`.HashShardMap`.
+
+    .. versionadded:: 1.4
+
+    """
+
+    def __init__(self, column, shard_ids):
+        self.column = column
+        self.shard_ids = list(shard_ids)
+
+    def shards_for_value(self, value):
+        """Return the list of shard ids which may contain rows where the
+        column has the given value."""
+
+        raise NotImplementedError()
+
+    def shards_for_range(self, lower, lower_inclusive, upper, upper_inclusive):
+        """Return the list of shard ids which may contain rows where the
+        column lies within the given range.
+
+        ``lower`` or ``upper`` are None when the range is unbounded on that
+        side.  The default implementation returns all shard ids.
+
+        """
+        return list(self.shard_ids)
+
+    def query_chooser(self, query):
+        """A ``query_chooser`` function which returns the shards that
+        may contain rows matching the WHERE criterion of the given query."""
+
+        if query._criterion is None:
+            return list(self.shard_ids)
+        shards = _ShardCriteria(self, query._params).shards_for_clause(
+            query._criterion
+        )
+        return self._ordered(shards)
+
+    def id_chooser(self, query, ident):
+        """An ``id_chooser`` function which returns the shards that may
+        contain the given primary key identity, if the column is part of
+        the primary key of the queried mapper."""
+
+        mapper = query._mapper_zero()
+        for column, value in zip(mapper.primary_key, ident):
+            if column.shares_lineage(self.column):
+                return self.shards_for_value(value)
+        return list(self.shard_ids)
+
+    def shard_chooser(self, mapper, instance, clause=None):
+        """A ``shard_chooser`` function which returns the shard for the
+        given instance, based on the value of the column on the instance.
+
+        Instances of classes which don't map the column can't be assigned
+        to a shard by the :class:`.ShardMap`; an explicit ``shard_chooser``
+        needs to be passed to :class:`.ShardedSession` in this case.
+
+        """
+        shards = None
+        if instance is not None:
+            if mapper._columntoproperty.get(self.column) is not None:
+                state = inspect(instance)
+                shards = self.shards_for_value(
+                    mapper._get_state_attr_by_column(
+                        state, state.dict, self.column
+                    )
+                )
+            subject = "instance %s" % instance_str(instance)
+        else:
+            whereclause = getattr(clause, "_whereclause", None)
+            if whereclause is not None:
+                shards = self._ordered(
+                    _ShardCriteria(self, {}).shards_for_clause(whereclause)
+                )
+            subject = "statement"
+
+        if not shards or len(shards) > 1:
+            raise exc.InvalidRequestError(
+                "Could not determine a single shard for %s based on column "
+                "%s; pass a shard_chooser function to ShardedSession to "
+                "handle this case" % (subject, self.column)
+            )
+        return shards[0]
+
+    def _ordered(self, shards):
+        if shards is None:
+            return list(self.shard_ids)
+        else:
+            return [
+                shard_id for shard_id in self.shard_ids if shard_id in shards
+            ]
+
+
+class ListShardMap(ShardMap):
+    """A :class:`.ShardMap` which assigns each distinct value of the column
+    to a shard.
+
+    E.g.::
+
+        shard_map = ListShardMap(
+            WeatherLocation.__table__.c.continent,
+            {
+                "North America": "north_america",
+                "South America": "south_america",
+                "Asia": "asia",
+                "Europe": "europe",
+            },
+        )
+
+    :param column: the :class:`.Column` on which rows are sharded.
+
+    :param mapping: dictionary of column values to shard ids.
+
+    :param default: optional shard id for values not present in
+     ``mapping``.
+
+    .. versionadded:: 1.4
+
+    """
+
+    def __init__(self, column, mapping, default=None):
+        shard_ids = util.unique_list(
+            list(mapping.values())
+            + ([default] if default is not None else [])
+        )
+        super(ListShardMap, self).__init__(column, shard_ids)
+        self.mapping = mapping
+        self.default = default
+
+    def shards_for_value(self, value):
+        if value in self.mapping:
+            return [self.mapping[value]]
+        elif self.default is not None:
+            return [self.default]
+        else:
+            return []
+
+
+class RangeShardMap(ShardMap):
+    """A :class:`.ShardMap` which assigns contiguous ranges of the column's
+    values to shards.
+
+    E.g.::
+
+        shard_map = RangeShardMap(
+            Order.__table__.c.id,
+            ["shard1", "shard2", "shard3"],
+            [1000000, 2000000],
+        )
+
+    places ids below 1000000 in ``"shard1"``, ids from 1000000 up to but
+    not including 2000000 in ``"shard2"``, and the remainder in
+    ``"shard3"``.
+
+    :param column: the :class:`.Column` on which rows are sharded.
+
+    :param shard_ids: sequence of shard ids, in order of the ranges they
+     hold.
+
+    :param boundaries: sorted sequence of values, one fewer than the number
+     of shard ids, each of which is the lowest value held by the
+     corresponding shard after the first.
+
+    .. versionadded:: 1.4
+
+    """
+
+    def __init__(self, column, shard_ids, boundaries):
+        super(RangeShardMap, self).__init__(column, shard_ids)
+        self.boundaries = list(boundaries)
+        if len(self.boundaries) != len(self.shard_ids) - 1:
+            raise exc.ArgumentError(
+                "Expected %d boundaries for %d shard ids; got %d"
+                % (
+                    len(self.shard_ids) - 1,
+                    len(self.shard_ids),
+                    len(self.boundaries),
+                )
+            )
+
+    def shards_for_value(self, value):
+        if value is None:
+            return []
+        return [self.shard_ids[bisect.bisect_right(self.boundaries, value)]]
+
+    def shards_for_range(self, lower, lower_inclusive, upper, upper_inclusive):
+        start = (
+            bisect.bisect_right(self.boundaries, lower)
+            if lower is not None
+            else 0
+        )
+        if upper is None:
+            end = len(self.boundaries)
+        elif upper_inclusive:
+            end = bisect.bisect_right(self.boundaries, upper)
+        else:
+            end = bisect.bisect_left(self.boundaries, upper)
+        return self.shard_ids[start : end + 1]
+
+
+class HashShardMap(ShardMap):
+    """A :class:`.ShardMap` which assigns rows to shards based on a hash of
+    the column's value.
+
+    :param column: the :class:`.Column` on which rows are sharded.
+
+    :param shard_ids: sequence of shard ids.  A row is assigned to the
+     shard at the position of its hash value modulo the number of shards.
+
+    :param hash_fn: optional function which returns an integer hash for a
+     value.  The default uses integer values directly, and the CRC32
+     checksum of the string form of other values; Python's ``hash()``
+     function is not suitable as it isn't stable across processes for
+     strings.
+
+    .. versionadded:: 1.4
+
+    """
+
+    def __init__(self, column, shard_ids, hash_fn=None):
+        super(HashShardMap, self).__init__(column, shard_ids)
+        self.hash_fn = hash_fn or _default_hash
+
+    def shards_for_value(self, value):
+        if value is None:
+            return []
+        return [self.shard_ids[self.hash_fn(value) % len(self.shard_ids)]]
+
+
+def _default_hash(value):
+    if isinstance(value, util.int_types):
+        return value
+    else:
+        return zlib.crc32(util.text_type(value).encode("utf-8")) & 0xFFFFFFFF
+
+
+class _ShardCriteria(object):
+    """Determine the set of shards which may match a WHERE clause.
+
+    Methods return a set of shard ids, or None if the clause doesn't
+    constrain the shards.
+
+    """
+
+    _range_ops = {
+        operators.lt: (False, False),
+        operators.le: (False, True),
+        operators.gt: (True, False),
+        operators.ge: (True, True),
+    }
+
+    _reversed_ops = {
+        operators.lt: operators.gt,
+        operators.le: operators.ge,
+        operators.gt: operators.lt,
+        operators.ge: operators.le,
+    }
+
+    def __init__(self, shard_map, params):
+        self.shard_map = shard_map
+        self.params = params
+
+    def shards_for_clause(self, clause):
+        if isinstance(clause, elements.Grouping):
+            return self.shards_for_clause(clause.element)
+        elif isinstance(clause, elements.BooleanClauseList):
+            return self._shards_for_boolean(clause)
+        elif isinstance(clause, elements.BinaryExpression):
+            return self._shards_for_binary(clause)
+        else:
+            return None
+
+    def _shards_for_boolean(self, clause):
+        if clause.operator is operators.and_:
+            shards = None
+            for elem in clause.clauses:
+                elem_shards = self.shards_for_clause(elem)
+                if elem_shards is None:
+                    continue
+                elif shards is None:
+                    shards = elem_shards
+                else:
+                    shards = shards.intersection(elem_shards)
+            return shards
+        elif clause.operator is operators.or_:
+            shards = set()
+            for elem in clause.clauses:
+                elem_shards = self.shards_for_clause(elem)
+                if elem_shards is None:
+                    return None
+                shards.update(elem_shards)
+            return shards
+        else:
+            return None
+
+    def _shards_for_binary(self, binary):
+        left, op, right = binary.left, binary.operator, binary.right
+        if not self._is_column(left):
+            if not self._is_column(right) or op not in (
+                operators.eq,
+                operators.lt,
+                operators.le,
+                operators.gt,
+                operators.ge,
+            ):
+                return None
+            left, right = right, left
+            op = self._reversed_ops.get(op, op)
+
+        if isinstance(right, elements.Grouping):
+            right = right.element
+
+        shard_map = self.shard_map
+        try:
+            if op is operators.eq:
+                return set(shard_map.shards_for_value(self._value(right)))
+            elif op is operators.in_op:
+                shards = set()
+                for value in self._values(right):
+                    shards.update(shard_map.shards_for_value(value))
+                return shards
+            elif op is operators.between_op:
+                lower, upper = self._values(right)
+                return set(
+                    shard_map.shards_for_range(lower, True, upper, True)
+                )
+            elif op in self._range_ops:
+                is_lower, inclusive = self._range_ops[op]
+                value = self._value(right)
+                if is_lower:
+                    shards = shard_map.shards_for_range(
+                        value, inclusive, None, False
+                    )
+                else:
+                    shards = shard_map.shards_for_range(
+                        None, False, value, inclusive
+                    )
+                return set(shards)
+        except _NoValue:
+            pass
+        return None
+
+    def _is_column(self, element):
+        return isinstance(
+            element, elements.ColumnElement
+        ) and element.shares_lineage(self.shard_map.column)
+
+    def _value(self, element):
+        if not isinstance(element, elements.BindParameter):
+            raise _NoValue()
+        elif element.key in self.params:
+            return self.params[element.key]
+        else:
+            return element.effective_value
+
+    def _values(self, element):
+        if isinstance(element, elements.BindParameter):
+            value = self._value(element)
+            if not isinstance(value, (list, tuple)):
+                raise _NoValue()
+            return value
+        elif isinstance(element, elements.ClauseList):
+            return [self._value(elem) for elem in element.clauses]
+        else:
+            raise _NoValue()
+
+
+class _NoValue(Exception):
+    pass
+
+
 class ShardedSession(Session):
     def __init__(
         self,
-        shard_chooser,
-        id_chooser,
-        query_chooser,
+        shard_chooser=None,
+        id_chooser=None,
+        query_chooser=None,
         shards=None,
         query_cls=ShardedQuery,
+        executor=None,
+        shard_map=None,
         **kwargs
     ):
         """Construct a ShardedSession.
@@ -202,16 +841,51 @@ class ShardedSession(Session):
 
         :param query_chooser: For a given Query, returns the list of shard_ids
           where the query should be issued.  Results from all shards returned
-          will be combined together into a single listing.
+          will be combined together into a single listing; if the query
+          has an ORDER BY that refers to columns present in the result, the
+          listing is produced by merging the already-sorted results of each
+          shard, and LIMIT / OFFSET are applied to the merged listing.
 
         :param shards: A dictionary of string shard names
           to :class:`~sqlalchemy.engine.Engine` objects.
 
+        :param executor: optional ``concurrent.futures.Executor``, such
+          as a ``ThreadPoolExecutor``, which will be used to execute
+          a query against all of the shards returned by ``query_chooser``
+          concurrently.  Connections are procured by the session itself and
+          only the execution of the statement takes place within the
+          executor; each shard must therefore be served by its own
+          connection, and the DBAPI in use must allow a connection to be
+          used from a thread other than the one that created it.  When
+          omitted, shards are queried one after the other.
+
+          .. versionadded:: 1.4
+
+        :param shard_map: optional :class:`.ShardMap` describing how rows
+          are distributed among shards based on the value of a column.
+          When present, it provides the ``shard_chooser``, ``id_chooser``
+          and ``query_chooser`` functions which aren't otherwise given,
+          routing queries to only those shards which could match the
+          query's criteria.
+
+          .. versionadded:: 1.4
+
         """
+        if shard_map is not None:
+            shard_chooser = shard_chooser or shard_map.shard_chooser
+            id_chooser = id_chooser or shard_map.id_chooser
+            query_chooser = query_chooser or shard_map.query_chooser
+        if None in (shard_chooser, id_chooser, query_chooser):
+            raise exc.ArgumentError(
+                "shard_chooser, id_chooser and query_chooser are required "
+                "unless a shard_map is given"
+            )
         super(ShardedSession, self).__init__(query_cls=query_cls, **kwargs)
         self.shard_chooser = shard_chooser
         self.id_chooser = id_chooser
         self.query_chooser = query_chooser
+        self.executor = executor
+        self.shard_map = shard_map
         self.__binds = {}
         self.connection_callable = self.connection
         if shards is not None:
@@ -222,6 +222,51 @@ from within the mutable extension::
     def modified_json(instance):
         print("json value modified:", instance.data)
 
+.. _mutable_json:
+
+Tracking Changes within JSON Structures
+---------------------------------------
+
+:class:`.MutableDict` only tracks changes made to the dictionary itself.
+The :class:`.MutableJSON` type tracks changes made anywhere within a
+structure of nested dictionaries and lists, as is typically stored in
+a :class:`.types.JSON` column::
+
+    from sqlalchemy import JSON
+    from sqlalchemy.ext.mutable import MutableJSON
+
+    class MyDataClass(Base):
+        __tablename__ = 'my_data'
+        id = Column(Integer, primary_key=True)
+        data = Column(MutableJSON.as_mutable(JSON))
+
+:class:`.MutableJSON` additionally records the path of each element which
+has changed since the value was loaded or last flushed.  When the column
+uses the PostgreSQL :class:`.postgresql.JSONB` type, or the
+:class:`.types.JSON` type on MySQL or SQLite, the UPDATE statement emitted
+by the unit of work then modifies only those elements within the stored
+document, using the ``jsonb_set()`` function and ``#-`` operator on
+PostgreSQL and the ``JSON_SET()`` and ``JSON_REMOVE()`` functions on MySQL
+and SQLite, rather than sending the whole document to the database::
+
+    obj = session.query(MyDataClass).first()
+    obj.data["address"]["city"] = "Boston"
+    del obj.data["nickname"]
+
+    # UPDATE my_data SET data=JSON_SET(JSON_REMOVE(my_data.data, ?),
+    #     ?, JSON(?)) WHERE my_data.id = ?
+    # ('$."nickname"', '$."address"."city"', '"Boston"', 1)
+    session.commit()
+
+The whole value is sent when a new value is assigned to the attribute, when
+:meth:`.MutableJSON.clear` or :func:`.attributes.flag_modified` is
+used, for other backends and types, and for changes within dictionaries
+whose keys can't be expressed in a JSON path, such as keys containing
+whitespace or quotes.  Changes to a list other than replacing one of its
+elements update the list as a whole.
+
+.. versionadded:: 1.4
+
 .. _mutable_composites:
 
 Establishing Mutability on Composites
@@ -354,14 +399,20 @@ pickling process of the parent's object-relational state so that the
 :meth:`MutableBase._parents` collection is restored to all ``Point`` objects.
 
 """
+import re
 import weakref
 
 from .. import event
 from .. import types
+from .. import util
 from ..orm import Mapper
 from ..orm import mapper
 from ..orm import object_mapper
 from ..orm.attributes import flag_modified
+from ..orm.base import NO_VALUE
+from ..sql import bindparam
+from ..sql import cast
+from ..sql import func
 from ..sql.base import SchemaEventTarget
 from ..util import memoized_property
 
@@ -944,3 +995,426 @@ class MutableSet(Mutable, set):
 
     def __reduce_ex__(self, proto):
         return (self.__class__, (list(self),))
+
+
+_json_path_key = re.compile(r'^[^\s"\\{},]+$')
+
+
+class _MutableJSONContainer(object):
+    """Common base for the dictionaries and lists which make up a
+    :class:`.MutableJSON` structure.
+
+    Each nested container refers to the container it's placed in, so that
+    a change anywhere within the structure is reported to the outermost
+    :class:`.MutableJSON` along with the path to the changed element.
+
+    """
+
+    _json_parent = None
+    _json_key = None
+
+    def _json_coerce(self, key, value):
+        # dictionaries and lists are always copied into new containers,
+        # so that a container is only ever present at a single path
+        if isinstance(value, dict):
+            return _MutableJSONDict(value, self, key)
+        elif isinstance(value, list):
+            return _MutableJSONList(value, self, key)
+        else:
+            return value
+
+    def _json_changed(self, *key):
+        """Report a change to the given key of this container, or to
+        the container as a whole if no key is given.
+
+        """
+        path = key if not key or self._json_path_safe(key[0]) else ()
+        node = self
+        while node._json_parent is not None:
+            parent = node._json_parent
+            key = parent._json_find(node)
+            if key is None:
+                # the container was removed from its parent
+                return
+            path = (key,) + path if parent._json_path_safe(key) else ()
+            node = parent
+        node._json_root_changed(path)
+
+    def _json_root_changed(self, path):
+        pass
+
+
+class _MutableJSONDictMixin(_MutableJSONContainer):
+    def _json_populate(self, value):
+        for key, elem in value.items():
+            dict.__setitem__(self, key, self._json_coerce(key, elem))
+
+    def _json_path_safe(self, key):
+        # keys which can't be rendered within a JSON path for all
+        # backends, such as those with quotes or whitespace, mark the
+        # whole dictionary as changed
+        return (
+            isinstance(key, util.string_types)
+            and _json_path_key.match(key) is not None
+            and key.lower() != "null"
+        )
+
+    def _json_find(self, node):
+        key = node._json_key
+        if dict.get(self, key) is node:
+            return key
+        else:
+            return None
+
+    def __setitem__(self, key, value):
+        """Detect dictionary set events and emit change events."""
+        dict.__setitem__(self, key, self._json_coerce(key, value))
+        self._json_changed(key)
+
+    def setdefault(self, key, value=None):
+        if key not in self:
+            self[key] = value
+        return dict.__getitem__(self, key)
+
+    def __delitem__(self, key):
+        """Detect dictionary del events and emit change events."""
+        dict.__delitem__(self, key)
+        self._json_changed(key)
+
+    def update(self, *a, **kw):
+        for key, value in dict(*a, **kw).items():
+            self[key] = value
+
+    def pop(self, key, *arg):
+        changed = key in self
+        result = dict.pop(self, key, *arg)
+        if changed:
+            self._json_changed(key)
+        return result
+
+    def popitem(self):
+        result = dict.popitem(self)
+        self._json_changed(result[0])
+        return result
+
+    def clear(self):
+        dict.clear(self)
+        self._json_changed()
+
+
+class _MutableJSONDict(_MutableJSONDictMixin, dict):
+    def __init__(self, value, parent, key):
+        dict.__init__(self)
+        self._json_parent = parent
+        self._json_key = key
+        self._json_populate(value)
+
+    def __reduce_ex__(self, proto):
+        return (dict, (dict(self),))
+
+
+class _MutableJSONList(_MutableJSONContainer, list):
+    def __init__(self, value, parent, key):
+        list.__init__(self)
+        self._json_parent = parent
+        self._json_key = key
+        list.extend(
+            self,
+            [self._json_coerce(idx, elem) for idx, elem in enumerate(value)],
+        )
+
+    def __reduce_ex__(self, proto):
+        return (list, (list(self),))
+
+    def _json_path_safe(self, index):
+        return True
+
+    def _json_find(self, node):
+        index = node._json_key
+        if index < len(self) and list.__getitem__(self, index) is node:
+            return index
+        # the list was modified since the element was placed; locate
+        # the element's current position
+        for index, elem in enumerate(self):
+            if elem is node:
+                node._json_key = index
+                return index
+        return None
+
+    def _json_coerce_all(self, value):
+        return [self._json_coerce(len(self), elem) for elem in value]
+
+    def __setitem__(self, index, value):
+        """Detect list set events and emit change events."""
+        if isinstance(index, slice):
+            list.__setitem__(self, index, self._json_coerce_all(value))
+            self._json_changed()
+        else:
+            if index < 0:
+                index += len(self)
+            list.__setitem__(self, index, self._json_coerce(index, value))
+            self._json_changed(index)
+
+    def __setslice__(self, start, end, value):
+        """Detect list set events and emit change events."""
+        list.__setslice__(self, start, end, self._json_coerce_all(value))
+        self._json_changed()
+
+    def __delitem__(self, index):
+        """Detect list del events and emit change events."""
+        list.__delitem__(self, index)
+        self._json_changed()
+
+    def __delslice__(self, start, end):
+        """Detect list del events and emit change events."""
+        list.__delslice__(self, start, end)
+        self._json_changed()
+
+    def pop(self, *arg):
+        result = list.pop(self, *arg)
+        self._json_changed()
+        return result
+
+    def append(self, x):
+        list.append(self, self._json_coerce(len(self), x))
+        self._json_changed()
+
+    def extend(self, x):
+        list.extend(self, self._json_coerce_all(x))
+        self._json_changed()
+
+    def __iadd__(self, x):
+        self.extend(x)
+        return self
+
+    def insert(self, i, x):
+        list.insert(self, i, self._json_coerce(i, x))
+        self._json_changed()
+
+    def remove(self, i):
+        list.remove(self, i)
+        self._json_changed()
+
+    def clear(self):
+        del self[:]
+
+    def sort(self, **kw):
+        list.sort(self, **kw)
+        self._json_changed()
+
+    def reverse(self):
+        list.reverse(self)
+        self._json_changed()
+
+
+class MutableJSON(_MutableJSONDictMixin, Mutable, dict):
+    """A JSON dictionary type that implements :class:`.Mutable`, tracking
+    changes within nested dictionaries and lists.
+
+    The :class:`.MutableJSON` object implements a dictionary whose nested
+    dictionary and list values are converted into tracked containers as
+    well, so that a change at any level within the structure emits change
+    events to the underlying mapping.  The path of each changed element is
+    recorded, so that when used with a :class:`.types.JSON` type on
+    a PostgreSQL ``JSONB``, MySQL or SQLite column, the UPDATE emitted
+    by the unit of work modifies only the changed elements within the
+    stored document, rather than sending the whole value to the database.
+
+    Dictionaries and lists assigned into the structure are copied into new
+    tracked containers.
+
+    See :ref:`mutable_json` for background.
+
+    .. versionadded:: 1.4
+
+    .. seealso::
+
+        :class:`.MutableDict`
+
+    """
+
+    def __init__(self, *arg, **kw):
+        dict.__init__(self)
+        self._json_changes = set()
+        self._json_populate(dict(*arg, **kw))
+
+    def __reduce_ex__(self, proto):
+        return (self.__class__, (dict(self),))
+
+    def _json_root_changed(self, path):
+        if not path:
+            # the document as a whole has changed
+            self._json_changes = None
+        elif self._json_changes is not None:
+            self._json_changes.add(path)
+        self.changed()
+
+    def _json_lookup(self, path):
+        value = self
+        for key in path:
+            try:
+                value = value[key]
+            except (KeyError, IndexError, TypeError):
+                return False, None
+        return True, value
+
+    def _json_update_expression(self, column, dialect):
+        """Return a SQL expression which applies the changes recorded
+        since the document was loaded or flushed to the given column, or
+        None if the whole value is to be sent.
+
+        """
+        if not self._json_changes or not isinstance(column.type, types.JSON):
+            return None
+
+        update = _json_updates.get(dialect.name)
+        if update is None:
+            return None
+
+        # changes within an element that is itself changed are included
+        # when that element is updated as a whole
+        paths = set()
+        sets = []
+        removes = []
+        for path in sorted(
+            self._json_changes, key=lambda path: (len(path), repr(path))
+        ):
+            if any(path[0:idx] in paths for idx in range(1, len(path))):
+                continue
+            paths.add(path)
+            exists, value = self._json_lookup(path)
+            if exists:
+                sets.append((path, value))
+            else:
+                removes.append(path)
+
+        return update(column, sets, removes)
+
+    @classmethod
+    def _listen_on_attribute(cls, attribute, coerce, parent_cls):
+        super(MutableJSON, cls)._listen_on_attribute(
+            attribute, coerce, parent_cls
+        )
+        if parent_cls is not attribute.class_:
+            return
+
+        key = attribute.key
+        column = attribute.property.columns[0]
+
+        # values for which an update expression was placed in the
+        # object's dictionary, restored once the UPDATE has proceeded
+        flushing = weakref.WeakKeyDictionary()
+
+        def set_(target, value, oldvalue, initiator):
+            if value is not oldvalue and isinstance(value, MutableJSON):
+                # an assigned value is sent as a whole
+                value._json_changes = None
+            return value
+
+        def before_update(mapper, connection, state):
+            value = state.dict.get(key, None)
+            if (
+                isinstance(value, MutableJSON)
+                and state.committed_state.get(key, None) is NO_VALUE
+            ):
+                expr = value._json_update_expression(
+                    column, connection.dialect
+                )
+                if expr is not None:
+                    flushing[state.obj()] = value
+                    state.dict[key] = expr
+
+        def after_flush(mapper, connection, state):
+            value = flushing.pop(state.obj(), None)
+            if value is not None:
+                state.manager[key].impl.set_committed_value(
+                    state, state.dict, value
+                )
+            else:
+                value = state.dict.get(key, None)
+            if isinstance(value, MutableJSON):
+                value._json_changes = set()
+
+        event.listen(
+            attribute, "set", set_, raw=True, retval=True, propagate=True
+        )
+        event.listen(
+            parent_cls,
+            "before_update",
+            before_update,
+            raw=True,
+            propagate=True,
+        )
+        event.listen(
+            parent_cls, "after_update", after_flush, raw=True, propagate=True
+        )
+        event.listen(
+            parent_cls, "after_insert", after_flush, raw=True, propagate=True
+        )
+
+    @classmethod
+    def coerce(cls, key, value):
+        """Convert plain dictionary to instance of this class."""
+        if not isinstance(value, cls):
+            if isinstance(value, dict):
+                return cls(value)
+            return Mutable.coerce(key, value)
+        else:
+            return value
+
+
+def _json_value(column, value):
+    if value is None:
+        value = types.JSON.NULL
+    return bindparam(None, value, type_=column.type)
+
+
+def _json_path(path):
+    return bindparam(None, path, type_=types.JSON.JSONPathType)
+
+
+def _postgresql_json_update(column, sets, removes):
+    from ..dialects.postgresql import JSONB
+
+    # jsonb_set() and #- aren't available for the plain JSON type
+    if not isinstance(column.type, JSONB):
+        return None
+
+    expr = column
+    for path in removes:
+        expr = expr.op("#-", return_type=column.type)(_json_path(path))
+    for path, value in sets:
+        expr = func.jsonb_set(
+            expr,
+            _json_path(path),
+            cast(_json_value(column, value), column.type),
+            type_=column.type,
+        )
+    return expr
+
+
+def _json_set_update(json_value):
+    def update(column, sets, removes):
+        expr = column
+        if removes:
+            expr = func.JSON_REMOVE(
+                expr,
+                *[_json_path(path) for path in removes],
+                type_=column.type
+            )
+        if sets:
+            args = []
+            for path, value in sets:
+                args.append(_json_path(path))
+                args.append(json_value(_json_value(column, value)))
+            expr = func.JSON_SET(expr, *args, type_=column.type)
+        return expr
+
+    return update
+
+
+_json_updates = {
+    "postgresql": _postgresql_json_update,
+    "mysql": _json_set_update(lambda value: func.JSON_EXTRACT(value, "$")),
+    "sqlite": _json_set_update(func.JSON),
+}
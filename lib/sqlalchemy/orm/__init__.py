@@ -248,6 +248,7 @@ with_expression = strategy_options.with_expression._unbound_fn
 load_only = strategy_options.load_only._unbound_fn
 lazyload = strategy_options.lazyload._unbound_fn
 lazyload_all = strategy_options.lazyload_all._unbound_all_fn
+batchload = strategy_options.batchload._unbound_fn
 subqueryload = strategy_options.subqueryload._unbound_fn
 subqueryload_all = strategy_options.subqueryload_all._unbound_all_fn
 selectinload = strategy_options.selectinload._unbound_fn
@@ -287,7 +288,9 @@ def __go(lcls):
     )
 
     _sa_util.dependencies.resolve_all("sqlalchemy.orm")
+    _sa_util.preloaded.import_prefix("sqlalchemy.orm")
     _sa_util.dependencies.resolve_all("sqlalchemy.ext")
+    _sa_util.preloaded.import_prefix("sqlalchemy.ext")
 
 
 __go(locals())
@@ -605,7 +605,8 @@ class AttributeImpl(object):
         assert self.trackparent, msg
 
         return (
-            state.parents.get(id(self.parent_token), optimistic) is not False
+            state._parents.get(id(self.parent_token), optimistic)
+            is not False
         )
 
     def sethasparent(self, state, parent_state, value):
@@ -1155,8 +1156,13 @@ class CollectionAttributeImpl(AttributeImpl):
         return [(instance_state(o), o) for o in current]
 
     def fire_append_event(self, state, dict_, value, initiator):
+        initiator = initiator or self._append_token
+
         for fn in self.dispatch.append:
-            value = fn(state, value, initiator or self._append_token)
+            value = fn(state, value, initiator)
+
+        for fn in self.dispatch.bulk_append:
+            fn(state, [value], initiator)
 
         state._modified_event(dict_, self, NO_VALUE, True)
 
@@ -1165,6 +1171,44 @@ class CollectionAttributeImpl(AttributeImpl):
 
         return value
 
+    def fire_append_multiple_event(self, state, dict_, values, initiator):
+        """Fire append events for a series of values as a single
+        operation.
+
+        Per-value "append" listeners are invoked for each value, after
+        which "bulk_append" listeners receive the complete list.  Returns
+        the list of values to be placed in the collection.
+
+        """
+        initiator = initiator or self._append_token
+
+        if self.dispatch.append:
+            listeners = list(self.dispatch.append)
+            collected = []
+            for value in values:
+                for fn in listeners:
+                    value = fn(state, value, initiator)
+                collected.append(value)
+            values = collected
+        else:
+            values = list(values)
+
+        if not values:
+            return values
+
+        for fn in self.dispatch.bulk_append:
+            fn(state, values, initiator)
+
+        state._modified_event(dict_, self, NO_VALUE, True)
+
+        if self.trackparent:
+            sethasparent = self.sethasparent
+            for value in values:
+                if value is not None:
+                    sethasparent(instance_state(value), state, True)
+
+        return values
+
     def fire_pre_remove_event(self, state, dict_, initiator):
         """A special event used for pop() operations.
 
@@ -1180,8 +1224,43 @@ class CollectionAttributeImpl(AttributeImpl):
         if self.trackparent and value is not None:
             self.sethasparent(instance_state(value), state, False)
 
+        initiator = initiator or self._remove_token
+
         for fn in self.dispatch.remove:
-            fn(state, value, initiator or self._remove_token)
+            fn(state, value, initiator)
+
+        for fn in self.dispatch.bulk_remove:
+            fn(state, [value], initiator)
+
+        state._modified_event(dict_, self, NO_VALUE, True)
+
+    def fire_remove_multiple_event(self, state, dict_, values, initiator):
+        """Fire remove events for a series of values as a single
+        operation.
+
+        Per-value "remove" listeners are invoked for each value, after
+        which "bulk_remove" listeners receive the complete list.
+
+        """
+        if not values:
+            return
+
+        if self.trackparent:
+            sethasparent = self.sethasparent
+            for value in values:
+                if value is not None:
+                    sethasparent(instance_state(value), state, False)
+
+        initiator = initiator or self._remove_token
+
+        if self.dispatch.remove:
+            listeners = list(self.dispatch.remove)
+            for value in values:
+                for fn in listeners:
+                    fn(state, value, initiator)
+
+        for fn in self.dispatch.bulk_remove:
+            fn(state, values, initiator)
 
         state._modified_event(dict_, self, NO_VALUE, True)
 
@@ -1464,37 +1543,40 @@ def backref_listeners(attribute, key, uselist):
                 )
         return child
 
-    def emit_backref_from_collection_append_event(state, child, initiator):
-        if child is None:
-            return
+    def emit_backref_from_collection_bulk_append_event(
+        state, values, initiator
+    ):
+        obj = state.obj()
+        for child in values:
+            if child is None:
+                continue
 
-        child_state, child_dict = instance_state(child), instance_dict(child)
-        child_impl = child_state.manager[key].impl
+            child_state, child_dict = (
+                instance_state(child),
+                instance_dict(child),
+            )
+            child_impl = child_state.manager[key].impl
 
-        if (
-            initiator.parent_token is not parent_token
-            and initiator.parent_token is not child_impl.parent_token
-        ):
-            _acceptable_key_err(state, initiator, child_impl)
+            if (
+                initiator.parent_token is not parent_token
+                and initiator.parent_token is not child_impl.parent_token
+            ):
+                _acceptable_key_err(state, initiator, child_impl)
 
-        # tokens to test for a recursive loop.
-        check_append_token = child_impl._append_token
-        check_bulk_replace_token = (
-            child_impl._bulk_replace_token if child_impl.collection else None
-        )
+            # tokens to test for a recursive loop.
+            if initiator is child_impl._append_token or (
+                child_impl.collection
+                and initiator is child_impl._bulk_replace_token
+            ):
+                continue
 
-        if (
-            initiator is not check_append_token
-            and initiator is not check_bulk_replace_token
-        ):
             child_impl.append(
                 child_state,
                 child_dict,
-                state.obj(),
+                obj,
                 initiator,
                 passive=PASSIVE_NO_FETCH,
             )
-        return child
 
     def emit_backref_from_collection_remove_event(state, child, initiator):
         if (
@@ -1541,12 +1623,25 @@ def backref_listeners(attribute, key, uselist):
                         passive=PASSIVE_NO_FETCH,
                     )
 
+    def emit_backref_from_collection_bulk_remove_event(
+        state, values, initiator
+    ):
+        for child in values:
+            emit_backref_from_collection_remove_event(state, child, initiator)
+
     if uselist:
+        # collections deliver their members to the backref as a
+        # single list per operation
         event.listen(
             attribute,
-            "append",
-            emit_backref_from_collection_append_event,
-            retval=True,
+            "bulk_append",
+            emit_backref_from_collection_bulk_append_event,
+            raw=True,
+        )
+        event.listen(
+            attribute,
+            "bulk_remove",
+            emit_backref_from_collection_bulk_remove_event,
             raw=True,
         )
     else:
@@ -1557,14 +1652,14 @@ def backref_listeners(attribute, key, uselist):
             retval=True,
             raw=True,
         )
-    # TODO: need coverage in test/orm/ of remove event
-    event.listen(
-        attribute,
-        "remove",
-        emit_backref_from_collection_remove_event,
-        retval=True,
-        raw=True,
-    )
+        # TODO: need coverage in test/orm/ of remove event
+        event.listen(
+            attribute,
+            "remove",
+            emit_backref_from_collection_remove_event,
+            retval=True,
+            raw=True,
+        )
 
 
 _NO_HISTORY = util.symbol("NO_HISTORY")
@@ -408,7 +408,7 @@ def _inspect_mapped_class(class_, configure=False):
         return None
     else:
         if configure and mapper._new_mappers:
-            mapper._configure_all()
+            mapper._check_configure()
         return mapper
 
 
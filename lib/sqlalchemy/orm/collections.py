@@ -39,7 +39,9 @@ specified in terms of generic decorator recipes, but are instead hand-tooled
 for increased efficiency.  The targeted decorators occasionally implement
 adapter-like behavior, such as mapping bulk-set methods (``extend``,
 ``update``, ``__setslice__``, etc.) into the series of atomic mutation events
-that the ORM requires.
+that the ORM requires.  Where the collection's own ``append`` or ``add``
+method is the stock instrumented one, ``extend`` and ``update`` report all of
+their members to the ORM as a single bulk event.
 
 The targeted decorators are used internally for automatic instrumentation of
 entity collection classes.  Every collection class goes through a
@@ -658,6 +660,8 @@ class CollectionAdapter(object):
             not self.empty
         ), "This collection adapter is already in the 'empty' state"
         self.empty = True
+        if not self.owner_state._empty_collections:
+            self.owner_state._empty_collections = {}
         self.owner_state._empty_collections[self._key] = user_data
 
     def _reset_empty(self):
@@ -757,6 +761,27 @@ class CollectionAdapter(object):
         else:
             return item
 
+    def fire_append_multiple_event(self, items, initiator=None):
+        """Notify that a series of entities has entered the collection
+        as part of a single operation.
+
+        Returns the list of entities to be placed in the collection,
+        as per :meth:`.CollectionAdapter.fire_append_event`.
+
+        """
+        if initiator is not False and items:
+            if self.invalidated:
+                self._warn_invalidated()
+
+            if self.empty:
+                self._reset_empty()
+
+            return self.attr.fire_append_multiple_event(
+                self.owner_state, self.owner_state.dict, items, initiator
+            )
+        else:
+            return list(items)
+
     def fire_remove_event(self, item, initiator=None):
         """Notify that a entity has been removed from the collection.
 
@@ -776,6 +801,22 @@ class CollectionAdapter(object):
                 self.owner_state, self.owner_state.dict, item, initiator
             )
 
+    def fire_remove_multiple_event(self, items, initiator=None):
+        """Notify that a series of entities has been removed from the
+        collection as part of a single operation.
+
+        """
+        if initiator is not False and items:
+            if self.invalidated:
+                self._warn_invalidated()
+
+            if self.empty:
+                self._reset_empty()
+
+            self.attr.fire_remove_multiple_event(
+                self.owner_state, self.owner_state.dict, items, initiator
+            )
+
     def fire_pre_remove_event(self, initiator=None):
         """Notify that an entity is about to be removed from the collection.
 
@@ -839,15 +880,26 @@ def bulk_replace(values, existing_adapter, new_adapter, initiator=None):
 
     appender = new_adapter.bulk_appender()
 
+    # events for all incoming members are fired as a single operation,
+    # after which the members are placed in the collection in their
+    # original order
+    added = iter(
+        new_adapter.fire_append_multiple_event(
+            [member for member in values if member in additions],
+            initiator=initiator,
+        )
+    )
+
     for member in values or ():
         if member in additions:
-            appender(member, _sa_initiator=initiator)
+            appender(next(added), _sa_initiator=False)
         elif member in constants:
             appender(member, _sa_initiator=False)
 
     if existing_adapter:
-        for member in removals:
-            existing_adapter.fire_remove_event(member, initiator=initiator)
+        existing_adapter.fire_remove_multiple_event(
+            list(removals), initiator=initiator
+        )
 
 
 def prepare_instrumentation(factory):
@@ -1125,6 +1177,61 @@ def __set(collection, item, _sa_initiator=None):
     return item
 
 
+def __set_multiple(collection, items, _sa_initiator=None):
+    """Run set events for a series of items as a single operation.
+
+    This event always occurs before the collection is actually mutated.
+
+    """
+
+    if _sa_initiator is not False:
+        executor = collection._sa_adapter
+        if executor:
+            items = executor.fire_append_multiple_event(items, _sa_initiator)
+    return items
+
+
+def __list_extend(collection, iterable):
+    """Append a series of items to a list-like collection.
+
+    When append() is the stock instrumented method, events for all items
+    are fired as a single operation; otherwise append() is called for
+    each item so that it may intercept them.
+
+    """
+    append = getattr(collection.append, "_sa_append_without_event", None)
+    if append is None:
+        for value in iterable:
+            collection.append(value)
+    else:
+        for value in __set_multiple(collection, list(iterable)):
+            append(collection, value)
+
+
+def __set_update(collection, iterable):
+    """Add a series of items to a set-like collection.
+
+    As with __list_extend(), events for all items not already present
+    are fired as a single operation when add() is the stock instrumented
+    method.
+
+    """
+    add = getattr(collection.add, "_sa_add_without_event", None)
+    if add is None:
+        for item in iterable:
+            collection.add(item)
+        return
+
+    incoming, seen = [], set()
+    for item in iterable:
+        # testlib.pragma exempt:__hash__
+        if item not in collection and item not in seen:
+            seen.add(item)
+            incoming.append(item)
+    for item in __set_multiple(collection, incoming):
+        add(collection, item)
+
+
 def __del(collection, item, _sa_initiator=None):
     """Run del events.
 
@@ -1160,6 +1267,7 @@ def _list_decorators():
             fn(self, item)
 
         _tidy(append)
+        append._sa_append_without_event = fn
         return append
 
     def remove(fn):
@@ -1261,8 +1369,7 @@ def _list_decorators():
 
     def extend(fn):
         def extend(self, iterable):
-            for value in iterable:
-                self.append(value)
+            __list_extend(self, iterable)
 
         _tidy(extend)
         return extend
@@ -1271,8 +1378,7 @@ def _list_decorators():
         def __iadd__(self, iterable):
             # list.__iadd__ takes any iterable and seems to let TypeError
             # raise as-is instead of returning NotImplemented
-            for value in iterable:
-                self.append(value)
+            __list_extend(self, iterable)
             return self
 
         _tidy(__iadd__)
@@ -1440,6 +1546,7 @@ def _set_decorators():
             fn(self, value)
 
         _tidy(add)
+        add._sa_add_without_event = fn
         return add
 
     def discard(fn):
@@ -1486,8 +1593,7 @@ def _set_decorators():
 
     def update(fn):
         def update(self, value):
-            for item in value:
-                self.add(item)
+            __set_update(self, value)
 
         _tidy(update)
         return update
@@ -1496,8 +1602,7 @@ def _set_decorators():
         def __ior__(self, value):
             if not _set_binops_check_strict(self, value):
                 return NotImplemented
-            for item in value:
-                self.add(item)
+            __set_update(self, value)
             return self
 
         _tidy(__ior__)
@@ -966,6 +966,8 @@ class DetectKeySwitch(DependencyProcessor):
 
 
 class ManyToManyDP(DependencyProcessor):
+    _chunksize = 500
+
     def per_property_dependencies(
         self,
         uow,
@@ -1183,30 +1185,7 @@ class ManyToManyDP(DependencyProcessor):
         connection = uowcommit.transaction.connection(self.mapper)
 
         if secondary_delete:
-            associationrow = secondary_delete[0]
-            statement = self.secondary.delete(
-                sql.and_(
-                    *[
-                        c == sql.bindparam(c.key, type_=c.type)
-                        for c in self.secondary.c
-                        if c.key in associationrow
-                    ]
-                )
-            )
-            result = connection.execute(statement, secondary_delete)
-
-            if (
-                result.supports_sane_multi_rowcount()
-            ) and result.rowcount != len(secondary_delete):
-                raise exc.StaleDataError(
-                    "DELETE statement on table '%s' expected to delete "
-                    "%d row(s); Only %d were matched."
-                    % (
-                        self.secondary.description,
-                        len(secondary_delete),
-                        result.rowcount,
-                    )
-                )
+            self._delete_secondary_rows(connection, secondary_delete)
 
         if secondary_update:
             associationrow = secondary_update[0]
@@ -1236,7 +1215,155 @@ class ManyToManyDP(DependencyProcessor):
 
         if secondary_insert:
             statement = self.secondary.insert()
-            connection.execute(statement, secondary_insert)
+            if (
+                len(secondary_insert) > 1
+                and connection.dialect.supports_multivalues_insert
+            ):
+                chunksize = max(1, self._chunksize // len(secondary_insert[0]))
+                while secondary_insert:
+                    chunk = secondary_insert[0:chunksize]
+                    secondary_insert = secondary_insert[chunksize:]
+                    if len(chunk) > 1:
+                        connection.execute(statement.values(chunk))
+                    else:
+                        connection.execute(statement, chunk)
+            else:
+                connection.execute(statement, secondary_insert)
+
+    def _delete_secondary_rows(self, connection, secondary_delete):
+        """Delete association rows from the secondary table.
+
+        Rows which share the same values for the columns on one side of
+        the association are deleted using
+        DELETE .. WHERE a = ? AND b IN (...), in chunks; remaining rows
+        are deleted using an executemany of DELETE .. WHERE a = ? AND b = ?.
+        The side which produces the fewest statements is chosen, so that
+        the same rows result in the same statements regardless of which
+        side of a bidirectional relationship processes them.
+
+        """
+        associationrow = secondary_delete[0]
+
+        single_rows = secondary_delete
+        in_groups = ()
+        for group_cols, in_cols in self._secondary_delete_groupings(
+            connection, associationrow
+        ):
+            groups = util.OrderedDict()
+            for row in secondary_delete:
+                groups.setdefault(
+                    tuple(row[c.key] for c in group_cols), []
+                ).append(row)
+            multi = [rows for rows in groups.values() if len(rows) > 1]
+            singles = [rows[0] for rows in groups.values() if len(rows) == 1]
+            if multi and (
+                not in_groups
+                or len(multi) + bool(singles)
+                < len(in_groups) + bool(single_rows)
+            ):
+                in_groups = multi
+                single_rows = singles
+                grouping = group_cols, in_cols
+
+        expected = matched = 0
+
+        if in_groups:
+            group_cols, in_cols = grouping
+            if len(in_cols) > 1:
+                in_expr = sql.tuple_(*in_cols)
+            else:
+                in_expr = in_cols[0]
+            in_statement = self.secondary.delete(
+                sql.and_(
+                    *[
+                        c == sql.bindparam(c.key, type_=c.type)
+                        for c in group_cols
+                    ]
+                    + [
+                        in_expr.in_(
+                            sql.bindparam("related_keys", expanding=True)
+                        )
+                    ]
+                )
+            )
+            chunksize = max(1, self._chunksize // len(in_cols))
+
+            for rows in in_groups:
+                params = dict((c.key, rows[0][c.key]) for c in group_cols)
+                if len(in_cols) > 1:
+                    related_keys = [
+                        tuple(row[c.key] for c in in_cols) for row in rows
+                    ]
+                else:
+                    key = in_cols[0].key
+                    related_keys = [row[key] for row in rows]
+
+                # emit keys in a deterministic order, independently of
+                # which side of the relationship generated the rows
+                try:
+                    related_keys.sort()
+                except TypeError:
+                    pass
+
+                while related_keys:
+                    chunk = related_keys[0:chunksize]
+                    related_keys = related_keys[chunksize:]
+                    result = connection.execute(
+                        in_statement, dict(params, related_keys=chunk)
+                    )
+                    if result.supports_sane_rowcount():
+                        expected += len(chunk)
+                        matched += result.rowcount
+
+        if single_rows:
+            statement = self.secondary.delete(
+                sql.and_(
+                    *[
+                        c == sql.bindparam(c.key, type_=c.type)
+                        for c in self.secondary.c
+                        if c.key in associationrow
+                    ]
+                )
+            )
+            result = connection.execute(statement, single_rows)
+            if result.supports_sane_multi_rowcount():
+                expected += len(single_rows)
+                matched += result.rowcount
+
+        if matched != expected:
+            raise exc.StaleDataError(
+                "DELETE statement on table '%s' expected to delete "
+                "%d row(s); Only %d were matched."
+                % (self.secondary.description, expected, matched)
+            )
+
+    def _secondary_delete_groupings(self, connection, associationrow):
+        """Return the ``(group_cols, in_cols)`` pairs which may be used
+        to delete association rows using an IN expression, ordered by
+        the position of their columns in the secondary table."""
+
+        parent_cols = [r for l, r in self.prop.synchronize_pairs]
+        child_cols = [r for l, r in self.prop.secondary_synchronize_pairs]
+
+        if (
+            set(associationrow)
+            != set(c.key for c in parent_cols + child_cols)
+            or "related_keys" in self.secondary.c
+        ):
+            return ()
+
+        positions = dict((c, idx) for idx, c in enumerate(self.secondary.c))
+        return sorted(
+            [
+                (group_cols, in_cols)
+                for group_cols, in_cols in [
+                    (parent_cols, child_cols),
+                    (child_cols, parent_cols),
+                ]
+                if len(in_cols) == 1 or connection.dialect.supports_tuple_in
+            ],
+            key=lambda grouping: min(positions[c] for c in grouping[0]),
+        )
 
     def _synchronize(
         self, state, child, associationrow, clearkeys, uowcommit, operation
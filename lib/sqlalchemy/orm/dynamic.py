@@ -10,6 +10,10 @@
 Dynamic collections act like Query() objects for read operations and support
 basic add/delete mutation.
 
+Write-only collections support the same add/delete mutation, but never load
+the contents of the collection; read operations are available only
+through an explicit Query.
+
 """
 
 from . import attributes
@@ -59,6 +63,32 @@ class DynaLoader(strategies.AbstractRelationshipLoader):
         )
 
 
+@log.class_logger
+@properties.RelationshipProperty.strategy_for(lazy="write_only")
+class WriteOnlyLoader(strategies.AbstractRelationshipLoader):
+    def init_class_attribute(self, mapper):
+        self.is_class_level = True
+        if not self.uselist or self.parent_property.direction not in (
+            interfaces.ONETOMANY,
+            interfaces.MANYTOMANY,
+        ):
+            raise exc.InvalidRequestError(
+                "On relationship %s, 'write_only' loaders cannot be used "
+                "with many-to-one/one-to-one relationships and/or "
+                "uselist=False." % self.parent_property
+            )
+
+        strategies._register_attribute(
+            self.parent_property,
+            mapper,
+            useobject=True,
+            impl_class=WriteOnlyAttributeImpl,
+            target_mapper=self.parent_property.mapper,
+            order_by=self.parent_property.order_by,
+            query_class=self.parent_property.query_class,
+        )
+
+
 class DynamicAttributeImpl(attributes.AttributeImpl):
     uses_objects = True
     default_accepts_scalar_loader = False
@@ -126,8 +156,13 @@ class DynamicAttributeImpl(attributes.AttributeImpl):
 
         collection_history.add_added(value)
 
+        initiator = initiator or self._append_token
+
         for fn in self.dispatch.append:
-            value = fn(state, value, initiator or self._append_token)
+            value = fn(state, value, initiator)
+
+        for fn in self.dispatch.bulk_append:
+            fn(state, [value], initiator)
 
         if self.trackparent and value is not None:
             self.sethasparent(attributes.instance_state(value), state, True)
@@ -143,8 +178,13 @@ class DynamicAttributeImpl(attributes.AttributeImpl):
         if self.trackparent and value is not None:
             self.sethasparent(attributes.instance_state(value), state, False)
 
+        initiator = initiator or self._remove_token
+
         for fn in self.dispatch.remove:
-            fn(state, value, initiator or self._remove_token)
+            fn(state, value, initiator)
+
+        for fn in self.dispatch.bulk_remove:
+            fn(state, [value], initiator)
 
     def _modified_event(self, state, dict_):
 
@@ -259,6 +299,223 @@ class DynamicAttributeImpl(attributes.AttributeImpl):
         self.remove(state, dict_, value, initiator, passive=passive)
 
 
+class WriteOnlyAttributeImpl(DynamicAttributeImpl):
+    """Attribute implementation for a "write only" collection.
+
+    Changes to the collection are tracked as pending history only;
+    the existing contents of the collection are never loaded, and any
+    operation which would require them raises an error.
+
+    """
+
+    def __init__(
+        self,
+        class_,
+        key,
+        typecallable,
+        dispatch,
+        target_mapper,
+        order_by,
+        query_class=None,
+        **kw
+    ):
+        super(WriteOnlyAttributeImpl, self).__init__(
+            class_, key, typecallable, dispatch, target_mapper, order_by, **kw
+        )
+        self.query_class = query_class or Query
+
+    def _raise_for_load(self):
+        raise exc.InvalidRequestError(
+            "Attribute %s is a write-only collection; the existing "
+            "contents of the collection can't be loaded from the database "
+            "for this operation.  If this is a delete operation, configure "
+            "passive_deletes=True on the relationship in order to resolve "
+            "this error." % self
+        )
+
+    def get(self, state, dict_, passive=attributes.PASSIVE_OFF):
+        if not passive & attributes.SQL_OK:
+            return self._get_collection_history(
+                state, attributes.PASSIVE_NO_INITIALIZE
+            ).added_items
+        else:
+            return WriteOnlyCollection(self, state)
+
+    def get_collection(
+        self,
+        state,
+        dict_,
+        user_data=None,
+        passive=attributes.PASSIVE_NO_INITIALIZE,
+    ):
+        # cascades other than an active "delete" pass
+        # PASSIVE_NO_INITIALIZE, and receive only the pending items
+        return self._get_collection_history(state, passive).added_items
+
+    def set(
+        self,
+        state,
+        dict_,
+        value,
+        initiator=None,
+        passive=attributes.PASSIVE_OFF,
+        check_old=None,
+        pop=False,
+        _adapt=True,
+    ):
+        if initiator and initiator.parent_token is self.parent_token:
+            return
+
+        if pop and value is None:
+            return
+
+        if state.has_identity:
+            raise exc.InvalidRequestError(
+                "Attribute %s is a write-only collection; the collection "
+                "of a persistent object can't be replaced.  Use the add(), "
+                "add_all() and remove() methods of the collection instead."
+                % self
+            )
+
+        super(WriteOnlyAttributeImpl, self).set(
+            state,
+            dict_,
+            value,
+            initiator=initiator,
+            passive=passive,
+            check_old=check_old,
+            pop=pop,
+            _adapt=_adapt,
+        )
+
+    def _get_collection_history(self, state, passive=attributes.PASSIVE_OFF):
+        if (
+            state.has_identity
+            and passive & attributes.INIT_OK
+            and passive & attributes.SQL_OK
+        ):
+            self._raise_for_load()
+
+        if self.key in state.committed_state:
+            return state.committed_state[self.key]
+        else:
+            return CollectionHistory(self, state)
+
+
+class WriteOnlyCollection(object):
+    """A collection which is never loaded, returned by a relationship
+    configured with ``lazy="write_only"``.
+
+    Objects are added to and removed from the collection using the
+    :meth:`.WriteOnlyCollection.add`, :meth:`.WriteOnlyCollection.add_all`
+    and :meth:`.WriteOnlyCollection.remove` methods; these changes are
+    held as pending history until the next flush.  The contents of the
+    collection as present in the database are only available through the
+    :class:`.Query` returned by :meth:`.WriteOnlyCollection.select`, and
+    the collection itself can't be iterated.
+
+    .. versionadded:: 1.4
+
+    .. seealso::
+
+        :ref:`write_only_relationship`
+
+    """
+
+    __slots__ = ("instance", "attr")
+
+    def __init__(self, attr, state):
+        self.instance = state.obj()
+        self.attr = attr
+
+    def select(self):
+        """Return a :class:`.Query` which will SELECT the members of this
+        collection from the database.
+
+        The query is criteria-limited to the members of the collection
+        and makes use of the ``order_by`` configured on the relationship,
+        if any.  Further criteria, as well as LIMIT / OFFSET for
+        paginated access, may be applied to it as with any other
+        :class:`.Query`::
+
+            page = (
+                user.audit_log.select()
+                .order_by(AuditEntry.id)
+                .limit(50)
+                .offset(100)
+                .all()
+            )
+
+        The :class:`.Query` autoflushes as usual, so that changes staged
+        on the collection are present in the database before its SELECT
+        is emitted.
+
+        """
+        instance = self.instance
+        sess = object_session(instance)
+        if sess is None:
+            raise orm_exc.DetachedInstanceError(
+                "Parent instance %s is not bound to a Session; "
+                "write-only collection '%s' can't be queried"
+                % (orm_util.instance_str(instance), self.attr.key)
+            )
+
+        prop = object_mapper(instance)._props[self.attr.key]
+
+        query = self.attr.query_class(self.attr.target_mapper, session=sess)
+        if prop.secondary is not None:
+            # as with AppenderMixin, ensure prop.secondary is in the FROM
+            # following the mapper selectable.
+            query._from_obj = (prop.mapper.selectable, prop.secondary)
+
+        query._criterion = prop._with_parent(instance, alias_secondary=False)
+
+        if self.attr.order_by:
+            query._order_by = self.attr.order_by
+
+        return query
+
+    def add(self, item):
+        """Add an item to this collection.
+
+        The given item will be persisted to the database in terms of
+        the parent instance's collection on the next flush.
+
+        """
+        self.attr.append(
+            attributes.instance_state(self.instance),
+            attributes.instance_dict(self.instance),
+            item,
+            None,
+        )
+
+    def add_all(self, iterator):
+        """Add an iterable of items to this collection.
+
+        The given items will be persisted to the database in terms of
+        the parent instance's collection on the next flush.
+
+        """
+        state = attributes.instance_state(self.instance)
+        dict_ = attributes.instance_dict(self.instance)
+        for item in iterator:
+            self.attr.append(state, dict_, item, None)
+
+    def remove(self, item):
+        """Remove an item from this collection.
+
+        The given item will be removed from the parent instance's
+        collection on the next flush.
+
+        """
+        self.attr.remove(
+            attributes.instance_state(self.instance),
+            attributes.instance_dict(self.instance),
+            item,
+            None,
+        )
+
+
 class AppenderMixin(object):
     query_class = None
 
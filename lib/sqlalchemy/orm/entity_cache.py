@@ -0,0 +1,227 @@
+# orm/entity_cache.py
+# Copyright (C) 2005-2019 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""A second level cache of loaded column state, shared among
+:class:`.Session` objects.
+
+"""
+
+import copy
+import weakref
+
+from . import attributes
+from . import instrumentation
+from .. import util
+
+
+class CacheBackend(object):
+    """Storage used by an :class:`.EntityCache`.
+
+    Keys are identity keys as produced by :func:`.util.identity_key`;
+    values are tuples of a mapped class and a dictionary of column
+    attribute values, which are picklable to the same degree as the
+    values themselves.  A backend for an external store will usually
+    serialize both.
+
+    .. versionadded:: 1.4
+
+    """
+
+    def get(self, key):
+        """Return the value for the given key, or ``None``."""
+        raise NotImplementedError()
+
+    def set(self, key, value):
+        """Store the given value under the given key."""
+        raise NotImplementedError()
+
+    def delete_many(self, keys):
+        """Remove the given keys, if present."""
+        raise NotImplementedError()
+
+    def clear(self):
+        """Remove all keys."""
+        raise NotImplementedError()
+
+
+class LRUCacheBackend(CacheBackend):
+    """An in-process :class:`.CacheBackend` which retains a bounded number
+    of the most recently used entries.
+
+    Values are stored as is; the :class:`.EntityCache` stores and loads
+    copies of attribute values, so that values of mutable types are not
+    shared among objects.
+
+    .. versionadded:: 1.4
+
+    """
+
+    def __init__(self, capacity=1000):
+        self._cache = util.LRUCache(capacity)
+
+    def get(self, key):
+        return self._cache.get(key)
+
+    def set(self, key, value):
+        self._cache[key] = value
+
+    def delete_many(self, keys):
+        for key in keys:
+            self._cache.pop(key, None)
+
+    def clear(self):
+        self._cache.clear()
+
+
+class EntityCache(object):
+    """A second level cache of the column state of loaded objects, keyed on
+    identity key and shared among any number of :class:`.Session` objects.
+
+    The cache is used by passing it to the :paramref:`.Session.entity_cache`
+    parameter, typically via :class:`.sessionmaker`::
+
+        from sqlalchemy.orm.entity_cache import EntityCache
+
+        Session = sessionmaker(engine, entity_cache=EntityCache())
+
+    The column state of objects loaded by primary key, using
+    :meth:`.Query.get`, :meth:`.Session.get_many` or the lazy load of a
+    simple many-to-one relationship, is stored in the cache.  When such a
+    load subsequently locates an identity which is not present in the
+    identity map of a :class:`.Session` but is present in the cache, the
+    object is produced from the cache without emitting SQL; column
+    attributes which were not loaded at the time the object was cached are
+    expired.
+
+    Entries are invalidated for all objects that are updated or deleted
+    within a flush, both when the flush completes and again when the
+    enclosing transaction ends, and are not populated by a
+    :class:`.Session` while its transaction has pending changes to them.
+    A :meth:`.Query.update` or :meth:`.Query.delete` clears the cache
+    entirely.   Changes made outside of the unit of work, such as using
+    Core statements or the "bulk" methods, are not detected, and require
+    that :meth:`.EntityCache.invalidate` or :meth:`.EntityCache.clear` be
+    called explicitly.
+
+    :param backend: a :class:`.CacheBackend`; defaults to an
+     :class:`.LRUCacheBackend` of 1000 entries.
+
+    .. versionadded:: 1.4
+
+    """
+
+    def __init__(self, backend=None):
+        if backend is None:
+            backend = LRUCacheBackend()
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self._pending = weakref.WeakKeyDictionary()
+        self._cleared = weakref.WeakKeyDictionary()
+
+    def invalidate(self, keys):
+        """Remove the entries for the given identity keys."""
+
+        self.backend.delete_many(keys)
+
+    def clear(self):
+        """Remove all entries."""
+
+        self.backend.clear()
+
+    def _load(self, session, mapper, key):
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+
+        class_, values = value
+        manager = instrumentation.manager_of_class(class_)
+        if manager is None or not manager.is_mapped:
+            return None
+
+        # copy values, so that in-place changes to mutable values of the
+        # loaded object don't leak into the cache
+        values = copy.deepcopy(values)
+
+        instance = manager.new_instance()
+        state = attributes.instance_state(instance)
+        dict_ = attributes.instance_dict(instance)
+        dict_.update(values)
+
+        state.key = key
+        state.identity_token = key[2]
+        state.session_id = session.hash_key
+        session.identity_map._add_unpresent(state, key)
+        state._commit_all(dict_, session.identity_map)
+
+        unloaded = [k for k in _column_keys(manager.mapper) if k not in values]
+        if unloaded:
+            state.expired_attributes.update(unloaded)
+
+        if state.manager.dispatch.load:
+            state.manager.dispatch.load(state, None)
+        if session.dispatch.loaded_as_persistent:
+            session.dispatch.loaded_as_persistent(session, instance)
+        return instance
+
+    def _put(self, session, instance):
+        state = attributes.instance_state(instance)
+        key = state.key
+        if (
+            key is None
+            or session in self._cleared
+            or key in self._pending.get(session, ())
+        ):
+            return
+
+        dict_ = state.dict
+        committed_state = state.committed_state
+        self.backend.set(
+            key,
+            (
+                state.class_,
+                copy.deepcopy(
+                    dict(
+                        (k, dict_[k])
+                        for k in _column_keys(state.manager.mapper)
+                        if k in dict_ and k not in committed_state
+                    )
+                ),
+            ),
+        )
+
+    def _after_flush(self, session, flush_context):
+        keys = [
+            state.key
+            for state, (isdelete, listonly) in flush_context.states.items()
+            if state.key is not None and not listonly
+        ]
+        if keys:
+            self._pending.setdefault(session, set()).update(keys)
+            self.backend.delete_many(keys)
+
+    def _after_bulk(self, session):
+        self._cleared[session] = True
+        self.backend.clear()
+
+    def _after_transaction_end(self, session):
+        # entries may have been populated by other sessions before this
+        # session's changes were committed or rolled back
+        keys = self._pending.pop(session, None)
+        if self._cleared.pop(session, None):
+            self.backend.clear()
+        elif keys:
+            self.backend.delete_many(keys)
+
+
+def _column_keys(mapper):
+    return mapper._memo(
+        ("entity_cache_keys",),
+        lambda: [prop.key for prop in mapper.column_attrs],
+    )
@@ -6,6 +6,7 @@
 # the MIT License: http://www.opensource.org/licenses/mit-license.php
 
 import operator
+import re
 
 from .. import inspect
 from .. import util
@@ -36,21 +37,43 @@ _straight_ops = set(
 
 
 _notimplemented_ops = set(
-    getattr(operators, op)
-    for op in (
-        "like_op",
-        "notlike_op",
-        "ilike_op",
-        "notilike_op",
-        "between_op",
-        "in_op",
-        "notin_op",
-        "endswith_op",
-        "concat_op",
-    )
+    getattr(operators, op) for op in ("match_op", "notmatch_op")
 )
 
 
+# only the case insensitive forms of LIKE are evaluated, as the case
+# sensitivity of LIKE, and therefore startswith() / endswith() /
+# contains(), varies by backend and collation.
+_ilike_ops = {operators.ilike_op: False, operators.notilike_op: True}
+
+
+_functions = {
+    "lower": lambda value: value.lower(),
+    "upper": lambda value: value.upper(),
+    "abs": abs,
+    "length": len,
+    "char_length": len,
+}
+
+
+def _ilike_regex(pattern, escape):
+    """Convert a SQL ILIKE pattern into a compiled regular expression."""
+
+    regex = []
+    chars = iter(pattern)
+    for char in chars:
+        if char == escape:
+            regex.append(re.escape(next(chars, "")))
+        elif char == "%":
+            regex.append(".*")
+        elif char == "_":
+            regex.append(".")
+        else:
+            regex.append(re.escape(char))
+    regex.append(r"\Z")
+    return re.compile("".join(regex), re.DOTALL | re.IGNORECASE)
+
+
 class EvaluatorCompiler(object):
     def __init__(self, target_cls=None):
         self.target_cls = target_cls
@@ -86,6 +109,14 @@ class EvaluatorCompiler(object):
                     % parentmapper.class_
                 )
             key = parentmapper._columntoproperty[clause].key
+        elif (
+            self.target_cls
+            and clause in inspect(self.target_cls)._columntoproperty
+        ):
+            # a column of the target's mapped table which is not
+            # annotated, such as within the criteria generated for a
+            # many-to-one comparison
+            key = inspect(self.target_cls)._columntoproperty[clause].key
         else:
             key = clause.key
             if (
@@ -138,16 +169,27 @@ class EvaluatorCompiler(object):
         return evaluate
 
     def visit_binary(self, clause):
+        operator = clause.operator
+        if operator in (operators.in_op, operators.notin_op):
+            return self._visit_in(clause)
+        elif operator in (operators.between_op, operators.notbetween_op):
+            return self._visit_between(clause)
+        elif operator in _ilike_ops:
+            return self._visit_ilike(clause)
+        elif operator is operators.empty_in_op:
+            return lambda obj: False
+        elif operator is operators.empty_notin_op:
+            return lambda obj: True
+
         eval_left, eval_right = list(
             map(self.process, [clause.left, clause.right])
         )
-        operator = clause.operator
-        if operator is operators.is_:
+        if operator in (operators.is_, operators.isnot_distinct_from):
 
             def evaluate(obj):
                 return eval_left(obj) == eval_right(obj)
 
-        elif operator is operators.isnot:
+        elif operator in (operators.isnot, operators.is_distinct_from):
 
             def evaluate(obj):
                 return eval_left(obj) != eval_right(obj)
@@ -161,6 +203,15 @@ class EvaluatorCompiler(object):
                     return None
                 return operator(eval_left(obj), eval_right(obj))
 
+        elif operator is operators.concat_op:
+
+            def evaluate(obj):
+                left_val = eval_left(obj)
+                right_val = eval_right(obj)
+                if left_val is None or right_val is None:
+                    return None
+                return left_val + right_val
+
         else:
             raise UnevaluatableError(
                 "Cannot evaluate %s with operator %s"
@@ -168,6 +219,153 @@ class EvaluatorCompiler(object):
             )
         return evaluate
 
+    def _visit_in(self, clause):
+        eval_left = self.process(clause.left)
+        eval_values = self._process_list(clause.right)
+        negate = clause.operator is operators.notin_op
+
+        def evaluate(obj):
+            left_val = eval_left(obj)
+            if left_val is None:
+                return None
+            has_null = False
+            for value in eval_values(obj):
+                if value is None:
+                    has_null = True
+                elif value == left_val:
+                    return not negate
+            if has_null:
+                return None
+            return negate
+
+        return evaluate
+
+    def _visit_between(self, clause):
+        eval_left = self.process(clause.left)
+        eval_lower, eval_upper = list(map(self.process, clause.right.clauses))
+        symmetric = clause.modifiers.get("symmetric", False)
+        negate = clause.operator is operators.notbetween_op
+
+        def evaluate(obj):
+            left_val = eval_left(obj)
+            lower = eval_lower(obj)
+            upper = eval_upper(obj)
+            if left_val is None or lower is None or upper is None:
+                return None
+            if symmetric and upper < lower:
+                lower, upper = upper, lower
+            return (lower <= left_val <= upper) is not negate
+
+        return evaluate
+
+    def _visit_ilike(self, clause):
+        eval_left = self.process(clause.left)
+        negate = _ilike_ops[clause.operator]
+        escape = clause.modifiers.get("escape")
+
+        right = clause.right
+        if right.__visit_name__ == "bindparam" and right.callable is None:
+            # a literal pattern is compiled up front
+            if right.value is None:
+                return lambda obj: None
+            regex = _ilike_regex(right.value, escape)
+
+            def evaluate(obj):
+                left_val = eval_left(obj)
+                if left_val is None:
+                    return None
+                return (regex.match(left_val) is not None) is not negate
+
+            return evaluate
+
+        eval_pattern = self.process(right)
+
+        def evaluate(obj):
+            left_val = eval_left(obj)
+            pattern = eval_pattern(obj)
+            if left_val is None or pattern is None:
+                return None
+            regex = _ilike_regex(pattern, escape)
+            return (regex.match(left_val) is not None) is not negate
+
+        return evaluate
+
+    def _process_list(self, clause):
+        """Return an evaluator returning a list of values, given the
+        right side of an IN expression."""
+
+        if clause.__visit_name__ == "grouping":
+            clause = clause.element
+        if clause.__visit_name__ == "clauselist":
+            evaluators = list(map(self.process, clause.clauses))
+            return lambda obj: [evaluate(obj) for evaluate in evaluators]
+        elif clause.__visit_name__ == "bindparam" and clause.expanding:
+            evaluate = self.visit_bindparam(clause)
+            return lambda obj: list(evaluate(obj))
+        else:
+            raise UnevaluatableError(
+                "Cannot evaluate IN against %s" % type(clause).__name__
+            )
+
+    def visit_case(self, clause):
+        if clause.value is not None:
+            eval_value = self.process(clause.value)
+        else:
+            eval_value = None
+        whens = [
+            (self.process(when), self.process(then))
+            for when, then in clause.whens
+        ]
+        if clause.else_ is not None:
+            eval_else = self.process(clause.else_)
+        else:
+            eval_else = self.visit_null(None)
+
+        def evaluate(obj):
+            if eval_value is not None:
+                value = eval_value(obj)
+                for eval_when, eval_then in whens:
+                    if value is not None and value == eval_when(obj):
+                        return eval_then(obj)
+            else:
+                for eval_when, eval_then in whens:
+                    if eval_when(obj):
+                        return eval_then(obj)
+            return eval_else(obj)
+
+        return evaluate
+
+    def visit_function(self, clause):
+        name = clause.name.lower()
+        evaluators = list(map(self.process, clause.clauses.clauses))
+        if not clause.packagenames and name == "coalesce":
+
+            def evaluate(obj):
+                for sub_evaluate in evaluators:
+                    value = sub_evaluate(obj)
+                    if value is not None:
+                        return value
+                return None
+
+            return evaluate
+        elif (
+            not clause.packagenames
+            and name in _functions
+            and len(evaluators) == 1
+        ):
+            fn = _functions[name]
+            eval_arg = evaluators[0]
+
+            def evaluate(obj):
+                value = eval_arg(obj)
+                if value is None:
+                    return None
+                return fn(value)
+
+            return evaluate
+
+        raise UnevaluatableError("Cannot evaluate function %s()" % name)
+
     def visit_unary(self, clause):
         eval_inner = self.process(clause.element)
         if clause.operator is operators.inv:
@@ -178,6 +376,15 @@ class EvaluatorCompiler(object):
                     return None
                 return not value
 
+            return evaluate
+        elif clause.operator is operators.neg:
+
+            def evaluate(obj):
+                value = eval_inner(obj)
+                if value is None:
+                    return None
+                return -value
+
             return evaluate
         raise UnevaluatableError(
             "Cannot evaluate %s with operator %s"
@@ -173,8 +173,9 @@ class InstanceEvents(event.Events):
         _InstanceEventsHold.populate(class_, classmanager)
 
     @classmethod
-    @util.dependencies("sqlalchemy.orm")
-    def _accept_with(cls, orm, target):
+    @util.preload_module("sqlalchemy.orm")
+    def _accept_with(cls, target):
+        orm = util.preloaded.orm
         if isinstance(target, instrumentation.ClassManager):
             return target
         elif isinstance(target, mapperlib.Mapper):
@@ -573,8 +574,9 @@ class MapperEvents(event.Events):
         _MapperEventsHold.populate(class_, mapper)
 
     @classmethod
-    @util.dependencies("sqlalchemy.orm")
-    def _accept_with(cls, orm, target):
+    @util.preload_module("sqlalchemy.orm")
+    def _accept_with(cls, target):
+        orm = util.preloaded.orm
         if target is orm.mapper:
             return mapperlib.Mapper
         elif isinstance(target, type):
@@ -2106,6 +2108,77 @@ class AttributeEvents(event.Events):
 
         """
 
+    def bulk_append(self, target, values, initiator):
+        """Receive a collection 'bulk append' event.
+
+        This event is invoked once for each operation which adds members
+        to a collection, receiving all of the members added by that
+        operation as a single list.  Operations which add many members at
+        once, such as ``list.extend()``, ``set.update()`` or a bulk replace
+        of the collection, emit this event a single time rather than once
+        per member; a single-item ``append()`` emits the event with a
+        one-element list.
+
+        The :meth:`.AttributeEvents.append` event continues to be invoked
+        for each member individually; these per-member listeners are
+        invoked first, so that the values received here are those which
+        will actually be placed in the collection, including any
+        replacement values returned by ``retval=True`` listeners.
+
+        The ORM uses this event internally for "save-update" cascade and
+        backref handling of collections.
+
+        .. versionadded:: 1.4
+
+        :param target: the object instance receiving the event.
+          If the listener is registered with ``raw=True``, this will
+          be the :class:`.InstanceState` object.
+        :param values: a list of the values being appended.  This list
+          should not be modified.
+        :param initiator: An instance of :class:`.attributes.Event`
+          representing the initiation of the event.  The same initiator
+          applies to all of the given values.
+        :return: No return value is defined for this event.
+
+        .. seealso::
+
+            :class:`.AttributeEvents` - background on listener options such
+            as propagation to subclasses.
+
+            :meth:`.AttributeEvents.append`
+
+        """
+
+    def bulk_remove(self, target, values, initiator):
+        """Receive a collection 'bulk remove' event.
+
+        This event is invoked once for each operation which removes members
+        from a collection, receiving all of the members removed by that
+        operation as a single list.  This includes the members removed
+        by a bulk replace of the collection.  The
+        :meth:`.AttributeEvents.remove` event continues to be invoked for
+        each member individually, before this event is invoked.
+
+        .. versionadded:: 1.4
+
+        :param target: the object instance receiving the event.
+          If the listener is registered with ``raw=True``, this will
+          be the :class:`.InstanceState` object.
+        :param values: a list of the values being removed.  This list
+          should not be modified.
+        :param initiator: An instance of :class:`.attributes.Event`
+          representing the initiation of the event.
+        :return: No return value is defined for this event.
+
+        .. seealso::
+
+            :class:`.AttributeEvents` - background on listener options such
+            as propagation to subclasses.
+
+            :meth:`.AttributeEvents.remove`
+
+        """
+
     def set(self, target, value, oldvalue, initiator):
         """Receive a scalar set event.
 
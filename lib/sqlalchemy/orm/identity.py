@@ -5,10 +5,12 @@
 # This module is part of SQLAlchemy and is released under
 # the MIT License: http://www.opensource.org/licenses/mit-license.php
 
+import collections
 import weakref
 
 from . import attributes
 from . import util as orm_util
+from .state import _return_none
 from .. import exc as sa_exc
 from .. import util
 
@@ -46,7 +48,7 @@ class IdentityMap(object):
             self._modified.add(state)
 
     def _manage_removed_state(self, state):
-        del state._instance_dict
+        state._instance_dict = _return_none
         if state.modified:
             self._modified.discard(state)
 
@@ -358,3 +360,99 @@ class StrongInstanceDict(IdentityMap):
         self._dict.update(keepers)
         self.modified = bool(dirty)
         return ref_count - len(self)
+
+
+class LRUInstanceDict(WeakInstanceDict):
+    """A weak-referencing identity map which additionally maintains strong
+    references to a bounded number of the most recently used objects.
+
+    Objects are weakly referenced by the map itself as with the default
+    identity map; however, the ``capacity`` most recently loaded or
+    accessed objects remain strongly referenced, so that a long running
+    :class:`.Session` which works with the same rows repeatedly does not
+    need to reload them once they fall out of scope in the application, and
+    does not grow without bound as would a strong referencing map.
+
+    Only the strong reference is discarded when an object falls off the
+    end of the LRU; the object remains present in the map for as long as it
+    is otherwise referenced.   Objects which are pending, deleted, or which
+    have pending changes are strongly referenced by the :class:`.Session`
+    independently of this map and are never discarded.
+
+    The map is used by passing it to the :paramref:`.Session.identity_map_cls`
+    parameter; the ``capacity`` may be configured by passing a subclass or
+    a ``functools.partial()``::
+
+        import functools
+
+        from sqlalchemy.orm.identity import LRUInstanceDict
+
+        session = Session(
+            identity_map_cls=functools.partial(LRUInstanceDict, capacity=5000)
+        )
+
+    The :attr:`.LRUInstanceDict.hits` and :attr:`.LRUInstanceDict.misses`
+    counters track the outcome of identity lookups made when loading rows
+    and when retrieving objects by primary key.
+
+    .. versionadded:: 1.4
+
+    """
+
+    def __init__(self, capacity=1000):
+        super(LRUInstanceDict, self).__init__()
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._strong_refs = collections.OrderedDict()
+
+    @property
+    def hit_rate(self):
+        """The ratio of identity lookups which located an object present
+        in the map, or ``None`` if no lookups have taken place."""
+
+        total = self.hits + self.misses
+        if not total:
+            return None
+        return self.hits / float(total)
+
+    def _strong_ref(self, key, obj):
+        strong_refs = self._strong_refs
+        strong_refs.pop(key, None)
+        strong_refs[key] = obj
+        if len(strong_refs) > self.capacity:
+            strong_refs.popitem(last=False)
+
+    def _manage_incoming_state(self, state):
+        super(LRUInstanceDict, self)._manage_incoming_state(state)
+        obj = state.obj()
+        if obj is not None:
+            self._strong_ref(state.key, obj)
+
+    def _manage_removed_state(self, state):
+        super(LRUInstanceDict, self)._manage_removed_state(state)
+        self._strong_refs.pop(state.key, None)
+
+    def _add_unpresent(self, state, key):
+        # inlined form of add() called by loading.py
+        self._dict[key] = state
+        state._instance_dict = self._wr
+        self._strong_ref(key, state.obj())
+
+    def get(self, key, default=None):
+        obj = super(LRUInstanceDict, self).get(key)
+        if obj is None:
+            self.misses += 1
+            return default
+        else:
+            self.hits += 1
+            self._strong_ref(key, obj)
+            return obj
+
+    def prune(self):
+        """release all strong references, allowing unreferenced,
+        non-dirty objects to be garbage collected."""
+
+        ref_count = len(self)
+        self._strong_refs.clear()
+        return ref_count - len(self)
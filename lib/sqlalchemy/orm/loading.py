@@ -25,6 +25,7 @@ from .base import _SET_DEFERRED_EXPIRED
 from .util import _none_set
 from .util import state_str
 from .. import exc as sa_exc
+from .. import sql
 from .. import util
 from ..sql import util as sql_util
 
@@ -72,6 +73,7 @@ def instances(query, cursor, context):
 
         while True:
             context.partials = {}
+            context.readonly_instances = {}
 
             if query._yield_per:
                 fetch = cursor.fetchmany(query._yield_per)
@@ -105,9 +107,10 @@ def instances(query, cursor, context):
         util.raise_from_cause(err)
 
 
-@util.dependencies("sqlalchemy.orm.query")
-def merge_result(querylib, query, iterator, load=True):
+@util.preload_module("sqlalchemy.orm.query")
+def merge_result(query, iterator, load=True):
     """Merge a result into this :class:`.Query` object's Session."""
+    querylib = util.preloaded.orm_query
 
     session = query.session
     if load:
@@ -284,6 +287,71 @@ def load_on_pk_identity(
         return None
 
 
+_load_on_pk_identities_chunksize = 500
+
+
+def _coerce_pk_identity(mapper, primary_key_identity):
+    """Coerce string values within a primary key identity to the Python
+    type of their primary key column, where it is known, so that the
+    identity matches the identity key of the row the database returns.
+
+    Numeric values of differing types, e.g. ``Decimal`` and ``int``,
+    already compare and hash as equal, so are left as is.
+
+    """
+    coerced = []
+    for col, value in zip(mapper.primary_key, primary_key_identity):
+        if isinstance(value, util.string_types):
+            try:
+                python_type = col.type.python_type
+                if not issubclass(python_type, util.string_types):
+                    value = python_type(value)
+            except (NotImplementedError, TypeError, ValueError):
+                pass
+        coerced.append(value)
+    return tuple(coerced)
+
+
+def load_on_pk_identities(query, primary_key_identities):
+    """Load the given primary key identities from the database, using
+    chunks of SELECT .. WHERE pk IN (...).
+
+    Yields each instance located.
+
+    """
+    q = query._clone()
+    q._get_condition()
+
+    mapper = query._mapper_zero()
+    pk_cols = mapper.primary_key
+
+    if len(pk_cols) > 1:
+        in_expr = sql.tuple_(*pk_cols)
+    else:
+        in_expr = pk_cols[0]
+        primary_key_identities = [
+            ident[0] for ident in primary_key_identities
+        ]
+
+    q._criterion = q._adapt_clause(
+        in_expr.in_(sql.bindparam("primary_keys", expanding=True)),
+        True,
+        False,
+    )
+
+    if query._for_update_arg is not None:
+        q._version_check = True
+    q._order_by = None
+
+    chunksize = _load_on_pk_identities_chunksize
+    while primary_key_identities:
+        chunk = primary_key_identities[0:chunksize]
+        primary_key_identities = primary_key_identities[chunksize:]
+        q._params = dict(query._params, primary_keys=chunk)
+        for instance in q:
+            yield instance
+
+
 def _setup_entity_query(
     context,
     mapper,
@@ -375,7 +443,13 @@ def _instance_processor(
         if prop in quick_populators:
             # this is an inlined path just for column-based attributes.
             col = quick_populators[prop]
-            if col is _DEFER_FOR_STATE:
+            if context.readonly_entities and col in (
+                _DEFER_FOR_STATE,
+                _SET_DEFERRED_EXPIRED,
+            ):
+                # deferred columns are left unloaded on readonly objects
+                continue
+            elif col is _DEFER_FOR_STATE:
                 populators["new"].append(
                     (prop.key, prop._deferred_column_loader)
                 )
@@ -459,6 +533,12 @@ def _instance_processor(
             # loading does not apply
             assert only_load_props is None
 
+            if context.readonly_entities:
+                raise sa_exc.InvalidRequestError(
+                    "Polymorphic 'selectin' loading of %s is not supported "
+                    "with the readonly_entities execution option" % mapper
+                )
+
             callable_ = _load_subclass_via_in(context, path, selectin_load_via)
 
             PostLoad.callable_for_path(
@@ -470,6 +550,22 @@ def _instance_processor(
                 selectin_load_via,
             )
 
+    if context.readonly_entities:
+        _instance = _readonly_instance_processor(
+            mapper, context, pk_cols, populators
+        )
+        if mapper.polymorphic_map and not _polymorphic_from:
+            _instance = _decorate_polymorphic_switch(
+                _instance,
+                context,
+                mapper,
+                result,
+                path,
+                polymorphic_discriminator,
+                adapter,
+            )
+        return _instance
+
     post_load = PostLoad.for_context(context, load_path, only_load_props)
 
     if refresh_state:
@@ -484,6 +580,13 @@ def _instance_processor(
     else:
         refresh_identity_key = None
 
+    if context.query._execution_options.get("compile_populators", False):
+        populate_full = _compiled_populate_full(
+            populators, runid, populate_existing
+        )
+    else:
+        populate_full = None
+
     if mapper.allow_partial_pks:
         is_not_primary_key = _none_set.issuperset
     else:
@@ -560,17 +663,20 @@ def _instance_processor(
                 state.load_options = propagate_options
                 state.load_path = load_path
 
-            _populate_full(
-                context,
-                row,
-                state,
-                dict_,
-                isnew,
-                load_path,
-                loaded_instance,
-                populate_existing,
-                populators,
-            )
+            if populate_full is not None:
+                populate_full(row, state, dict_, isnew, load_path)
+            else:
+                _populate_full(
+                    context,
+                    row,
+                    state,
+                    dict_,
+                    isnew,
+                    load_path,
+                    loaded_instance,
+                    populate_existing,
+                    populators,
+                )
 
             if isnew:
                 if loaded_instance:
@@ -642,6 +748,77 @@ def _instance_processor(
     return _instance
 
 
+def _readonly_instance_processor(mapper, context, pk_cols, populators):
+    """Produce a row processor for the ``readonly_entities`` execution
+    option.
+
+    Instances are created without an :class:`.InstanceState` and are
+    neither placed in the identity map nor associated with the
+    :class:`.Session`.  Rows are de-duplicated per result batch using
+    ``context.readonly_instances``.  Besides column attributes, only
+    loader strategies that supply a ``populators["readonly"]`` entry,
+    called as ``populator(dict_, row, isnew)``, contribute attributes;
+    strategies which leave an attribute unloaded supply no populator at
+    all in this mode.  Any other "expire", "new" or "delayed" populator
+    requires an :class:`.InstanceState`, and raises.
+
+    """
+    quick = populators["quick"]
+    readonly = populators["readonly"]
+
+    readonly_keys = set(key for key, populator in readonly)
+    unsupported = [
+        key
+        for kind in ("expire", "new", "delayed")
+        for key, populator in populators[kind]
+        if key not in readonly_keys
+    ]
+    if unsupported:
+        raise sa_exc.InvalidRequestError(
+            "Loading of attribute(s) %s of %s is not supported with the "
+            "readonly_entities execution option"
+            % (", ".join("'%s'" % key for key in unsupported), mapper)
+        )
+
+    class_ = mapper.class_
+    identity_class = mapper._identity_class
+    identity_token = context.identity_token
+    instance_dict = attributes.instance_dict
+
+    if mapper.allow_partial_pks:
+        is_not_primary_key = _none_set.issuperset
+    else:
+        is_not_primary_key = _none_set.intersection
+
+    def _instance(row):
+        identitykey = (
+            identity_class,
+            tuple([row[column] for column in pk_cols]),
+            identity_token,
+        )
+        instances = context.readonly_instances
+        instance = instances.get(identitykey)
+
+        if instance is None:
+            if is_not_primary_key(identitykey[1]):
+                return None
+
+            instance = instances[identitykey] = class_.__new__(class_)
+            dict_ = instance_dict(instance)
+            for key, getter in quick:
+                dict_[key] = getter(row)
+            for key, populator in readonly:
+                populator(dict_, row, True)
+        else:
+            dict_ = instance_dict(instance)
+            for key, populator in readonly:
+                populator(dict_, row, False)
+
+        return instance
+
+    return _instance
+
+
 def _load_subclass_via_in(context, path, entity):
     mapper = entity.mapper
 
@@ -731,6 +908,107 @@ def _populate_full(
             # populator(state, dict_, row, new_path=False)
 
 
+_populate_full_factories = util.LRUCache(100)
+
+
+def _compiled_populate_full(populators, runid, populate_existing):
+    """Return a version of :func:`._populate_full` specific to the given
+    collection of populators.
+
+    The generated function has the loops of :func:`._populate_full`
+    unrolled, with each attribute key, getter and populator bound as a
+    local name.  The source is generated once per "shape" of populators,
+    that is the number of each kind of populator, so that the factory may
+    be shared among all queries against mappers of a similar layout.
+
+    """
+    quick = populators["quick"]
+    expire = populators["expire"]
+    new = populators["new"]
+    delayed = populators["delayed"]
+    existing = populators["existing"]
+
+    shape = (
+        len(quick),
+        tuple(bool(set_callable) for key, set_callable in expire),
+        len(new),
+        len(delayed),
+        len(existing),
+        bool(populate_existing),
+    )
+
+    factory = _populate_full_factories.get(shape)
+    if factory is None:
+        factory = _populate_full_factories[
+            shape
+        ] = _generate_populate_full_factory(shape)
+
+    return factory(
+        runid,
+        [key for key, getter in quick],
+        [getter for key, getter in quick],
+        [key for key, set_callable in expire],
+        [populator for key, populator in new + delayed],
+        [populator for key, populator in existing],
+    )
+
+
+def _generate_populate_full_factory(shape):
+    num_quick, expire, num_new, num_delayed, num_existing, pop_existing = (
+        shape
+    )
+    num_new += num_delayed
+
+    def args(prefix, num):
+        return "".join("%s%d, " % (prefix, idx) for idx in range(num))
+
+    lines = [
+        "def factory(runid, quick_keys, getters, expire_keys, "
+        "new_populators, existing_populators):",
+        "    %s= quick_keys" % args("k", num_quick),
+        "    %s= getters" % args("g", num_quick),
+        "    %s= expire_keys" % args("x", len(expire)),
+        "    %s= new_populators" % args("n", num_new),
+        "    %s= existing_populators" % args("e", num_existing),
+        "    def populate_full(row, state, dict_, isnew, load_path):",
+        "        if isnew:",
+        "            state.runid = runid",
+    ]
+    for idx in range(num_quick):
+        lines.append("            dict_[k%d] = g%d(row)" % (idx, idx))
+    for idx, set_callable in enumerate(expire):
+        if pop_existing:
+            lines.append("            dict_.pop(x%d, None)" % idx)
+        if set_callable:
+            lines.append("            state.expired_attributes.add(x%d)" % idx)
+    for idx in range(num_new):
+        lines.append("            n%d(state, dict_, row)" % idx)
+    lines.extend(
+        [
+            "        elif load_path != state.load_path:",
+            "            state.load_path = load_path",
+        ]
+    )
+    for idx in range(num_quick):
+        lines.extend(
+            [
+                "            if k%d not in dict_:" % idx,
+                "                dict_[k%d] = g%d(row)" % (idx, idx),
+            ]
+        )
+    for idx in range(num_existing):
+        lines.append("            e%d(state, dict_, row)" % idx)
+    lines.append("        else:")
+    for idx in range(num_existing):
+        lines.append("            e%d(state, dict_, row)" % idx)
+    lines.extend(["            pass", "    return populate_full", ""])
+
+    # empty unpacking targets such as " = quick_keys" are not valid
+    # Python; drop those lines
+    code = "\n".join(line for line in lines if not line.startswith("    = "))
+    return util.langhelpers._exec_code_in_env(code, {}, "factory")
+
+
 def _populate_partial(
     context, row, state, dict_, isnew, load_path, unloaded, populators
 ):
@@ -926,6 +1204,24 @@ def load_scalar_attributes(mapper, state, attribute_names):
     if attribute_names:
         attribute_names = attribute_names.intersection(mapper.attrs.keys())
 
+    if (
+        has_key
+        and attribute_names
+        and session.bulk_load_expired
+        and not session._flushing
+        and attribute_names.issubset(state.expired_attributes)
+    ):
+        # load the same attributes for all other instances of this
+        # mapper in the session which have them expired as well.
+        states = session._bulk_expired_siblings(state, attribute_names)
+        if len(states) > 1:
+            missing = load_scalar_attributes_for_states(
+                mapper, states, attribute_names
+            )
+            if state in missing:
+                raise orm_exc.ObjectDeletedError(state)
+            return
+
     if mapper.inherits and not mapper.concrete:
         # because we are using Core to produce a select() that we
         # pass to the Query, we aren't calling setup() for mapped
@@ -983,3 +1279,42 @@ def load_scalar_attributes(mapper, state, attribute_names):
     # may not complete (even if PK attributes are assigned)
     if has_key and result is None:
         raise orm_exc.ObjectDeletedError(state)
+
+
+def load_scalar_attributes_for_states(mapper, states, attribute_names=None):
+    """initiate a column-based attribute refresh operation for many
+    persistent states of the same mapper, using chunks of
+    SELECT .. WHERE pk IN (...).
+
+    Returns a list of those states which were not located.
+
+    """
+    session = states[0].session
+
+    # as is the case for a single refresh, pending changes are not
+    # flushed
+    q = session.query(mapper).autoflush(False)
+    if attribute_names:
+        attribute_names = attribute_names.intersection(mapper.attrs.keys())
+
+        # the primary key is needed in each row in order to locate
+        # the instance
+        q._get_options(
+            only_load_props=attribute_names.union(
+                prop.key for prop in mapper._identity_key_props
+            )
+        )
+
+    idents = util.unique_list(state.key[1] for state in states)
+    try:
+        idents.sort()
+    except TypeError:
+        pass
+
+    # instances already present in the identity map receive the
+    # expired attributes in the row, as is the case for any query
+    located = set(
+        attributes.instance_state(instance)
+        for instance in load_on_pk_identities(q, idents)
+    )
+    return [state for state in states if state not in located]
@@ -105,6 +105,9 @@ class Mapper(InspectionAttr):
     """
 
     _new_mappers = False
+    _configure_generation = 0
+    _checked_generation = None
+    _relationship_targets = None
     _dispose_called = False
 
     @util.deprecated_params(
@@ -722,6 +725,7 @@ class Mapper(InspectionAttr):
             self._configure_polymorphic_setter()
             self._configure_pks()
             Mapper._new_mappers = True
+            Mapper._configure_generation += 1
             self._log("constructed")
             self._expire_memoizations()
         finally:
@@ -1337,6 +1341,87 @@ class Mapper(InspectionAttr):
         """
         configure_mappers()
 
+    def _check_configure(self):
+        """Configure this mapper along with the mappers it depends upon,
+        if new mappers have been constructed since it was last checked.
+
+        """
+        if (
+            Mapper._new_mappers
+            and self._checked_generation != Mapper._configure_generation
+        ):
+            _do_configure_mappers(self)
+
+    def _get_relationship_targets(self):
+        """Return a list of ``(mapper, modifies_target)`` tuples for each
+        relationship on this mapper, where ``modifies_target`` indicates
+        that configuring the relationship also alters the target mapper,
+        i.e. by establishing a backref or a delete-orphan cascade on it.
+
+        """
+        if self._relationship_targets is not None:
+            return self._relationship_targets
+
+        targets = []
+        complete = True
+        for prop in self._props.values():
+            if (
+                not isinstance(prop, properties.RelationshipProperty)
+                or prop.parent is not self
+            ):
+                continue
+            try:
+                target = prop.entity.mapper
+            except Exception:
+                # the target can't be resolved yet; the error, if
+                # it persists, is raised when the relationship
+                # itself is configured.
+                complete = False
+                continue
+            targets.append(
+                (
+                    target,
+                    bool(prop.backref) or prop.cascade.delete_orphan,
+                )
+            )
+        if complete:
+            self._relationship_targets = targets
+        return targets
+
+    def _mappers_to_configure(self):
+        """Return the list of mappers which must be configured in order
+        for this mapper to be used.
+
+        This includes the full inheritance hierarchy of this mapper and
+        the mappers targeted by its relationships, as well as those
+        mappers not yet configured which have a relationship that alters
+        one of these, repeated for each mapper located.
+
+        """
+        altered_by = {}
+        for mapper in list(_mapper_registry):
+            if not mapper.configured:
+                for target, modifies in mapper._get_relationship_targets():
+                    if modifies:
+                        altered_by.setdefault(target, []).append(mapper)
+
+        found = [self]
+        seen = set(found)
+        for mapper in found:
+            related = list(mapper._inheriting_mappers)
+            if mapper.inherits is not None:
+                related.append(mapper.inherits)
+            related.extend(
+                target
+                for target, modifies in mapper._get_relationship_targets()
+            )
+            related.extend(altered_by.get(mapper, ()))
+            for other in related:
+                if other not in seen:
+                    seen.add(other)
+                    found.append(other)
+        return found
+
     def dispose(self):
         # Disable any attribute-based compilation.
         self.configured = True
@@ -1964,6 +2049,9 @@ class Mapper(InspectionAttr):
         """
         self._init_properties[key] = prop
         self._configure_property(key, prop, init=self.configured)
+        if not self.configured:
+            self._relationship_targets = None
+            Mapper._configure_generation += 1
 
     def _expire_memoizations(self):
         for mapper in self.iterate_to_root():
@@ -2029,8 +2117,8 @@ class Mapper(InspectionAttr):
         """return a MapperProperty associated with the given key.
         """
 
-        if _configure_mappers and Mapper._new_mappers:
-            configure_mappers()
+        if _configure_mappers:
+            self._check_configure()
 
         try:
             return self._props[key]
@@ -2048,8 +2136,7 @@ class Mapper(InspectionAttr):
     @property
     def iterate_properties(self):
         """return an iterator of all MapperProperty objects."""
-        if Mapper._new_mappers:
-            configure_mappers()
+        self._check_configure()
         return iter(self._props.values())
 
     def _mappers_from_spec(self, spec, selectable):
@@ -2124,8 +2211,7 @@ class Mapper(InspectionAttr):
 
     @_memoized_configured_property
     def _with_polymorphic_mappers(self):
-        if Mapper._new_mappers:
-            configure_mappers()
+        self._check_configure()
         if not self.with_polymorphic:
             return []
         return self._mappers_from_spec(*self.with_polymorphic)
@@ -2359,8 +2445,7 @@ class Mapper(InspectionAttr):
             :attr:`.Mapper.all_orm_descriptors`
 
         """
-        if Mapper._new_mappers:
-            configure_mappers()
+        self._check_configure()
         return util.ImmutableProperties(self._props)
 
     @_memoized_configured_property
@@ -2475,8 +2560,7 @@ class Mapper(InspectionAttr):
         return self._filter_properties(properties.CompositeProperty)
 
     def _filter_properties(self, type_):
-        if Mapper._new_mappers:
-            configure_mappers()
+        self._check_configure()
         return util.ImmutableProperties(
             util.OrderedDict(
                 (k, v) for k, v in self._props.items() if isinstance(v, type_)
@@ -2923,14 +3007,16 @@ class Mapper(InspectionAttr):
 
         return None
 
-    @util.dependencies(
+    @util.preload_module(
         "sqlalchemy.ext.baked", "sqlalchemy.orm.strategy_options"
     )
-    def _subclass_load_via_in(self, baked, strategy_options, entity):
+    def _subclass_load_via_in(self, entity):
         """Assemble a BakedQuery that can load the columns local to
         this subclass as a SELECT with IN.
 
         """
+        baked = util.preloaded.ext_baked
+        strategy_options = util.preloaded.orm_strategy_options
         assert self.inherits
 
         polymorphic_prop = self._columntoproperty[self.polymorphic_on]
@@ -3067,6 +3153,14 @@ class Mapper(InspectionAttr):
     def _compiled_cache(self):
         return util.LRUCache(self._compiled_cache_size)
 
+    @_memoized_configured_property
+    def _query_cache(self):
+        return util.LRUCache(self._compiled_cache_size)
+
+    @_memoized_configured_property
+    def _query_compiled_cache(self):
+        return util.LRUCache(self._compiled_cache_size)
+
     @_memoized_configured_property
     def _sorted_tables(self):
         table_to_mapper = {}
@@ -3179,11 +3273,31 @@ def configure_mappers():
       mappings that haven't been produced yet, such as if they are in modules
       as yet unimported.
 
+    .. versionchanged:: 1.4 Mappers are otherwise configured on first use
+       along with only those other mappers which they depend upon, i.e.
+       their inheritance hierarchy, the mappers targeted by their
+       relationships, and those mappers which establish a backref upon
+       them.   :func:`.configure_mappers` continues to configure all
+       mappers which have been constructed.   When listeners for the
+       :meth:`.MapperEvents.before_configured` or
+       :meth:`.MapperEvents.after_configured` events are present, which
+       includes the use of ``__declare_first__()`` and
+       ``__declare_last__()`` with declarative, all mappers are
+       configured on first use, so that these events continue to
+       accompany the configuration of all mappers.
+
     """
 
     if not Mapper._new_mappers:
         return
 
+    _do_configure_mappers(None)
+
+
+def _do_configure_mappers(for_mapper):
+    """Configure all mappers, or those which the given mapper depends
+    upon."""
+
     _CONFIGURE_MUTEX.acquire()
     try:
         global _already_compiling
@@ -3196,15 +3310,33 @@ def configure_mappers():
             if not Mapper._new_mappers:
                 return
 
-            has_skip = False
+            dispatch = Mapper.dispatch._for_class(Mapper)
+            if for_mapper is not None and (
+                dispatch.before_configured or dispatch.after_configured
+            ):
+                # these events are defined in terms of all mappers being
+                # configured, and may construct or alter mappers
+                # themselves, so configure all mappers as before
+                for_mapper = None
+
+            if for_mapper is not None:
+                generation = Mapper._configure_generation
+                mappers = found = for_mapper._mappers_to_configure()
+                if all(m.configured for m in found):
+                    for mapper in found:
+                        mapper._checked_generation = generation
+                    return
+            else:
+                dispatch.before_configured()
+                # initialize properties on all mappers
+                # note that _mapper_registry is unordered, which
+                # may randomly conceal/reveal issues related to
+                # the order of mapper compilation
+                mappers = list(_mapper_registry)
 
-            Mapper.dispatch._for_class(Mapper).before_configured()
-            # initialize properties on all mappers
-            # note that _mapper_registry is unordered, which
-            # may randomly conceal/reveal issues related to
-            # the order of mapper compilation
+            has_skip = False
 
-            for mapper in list(_mapper_registry):
+            for mapper in mappers:
                 run_configure = None
                 for fn in mapper.dispatch.before_mapper_configured:
                     run_configure = fn(mapper, mapper.class_)
@@ -3239,12 +3371,20 @@ def configure_mappers():
                         raise
 
             if not has_skip:
-                Mapper._new_mappers = False
+                if for_mapper is None:
+                    Mapper._new_mappers = False
+                else:
+                    for mapper in found:
+                        mapper._checked_generation = generation
+                    Mapper._new_mappers = not all(
+                        m.configured for m in _mapper_registry
+                    )
         finally:
             _already_compiling = False
     finally:
         _CONFIGURE_MUTEX.release()
-    Mapper.dispatch._for_class(Mapper).after_configured()
+    if for_mapper is None:
+        Mapper.dispatch._for_class(Mapper).after_configured()
 
 
 def reconstructor(fn):
@@ -3339,7 +3479,7 @@ def _event_on_first_init(manager, cls):
     instrumenting_mapper = manager.info.get(_INSTRUMENTOR)
     if instrumenting_mapper:
         if Mapper._new_mappers:
-            configure_mappers()
+            instrumenting_mapper._check_configure()
 
 
 def _event_on_init(state, args, kwargs):
@@ -3354,7 +3494,7 @@ def _event_on_init(state, args, kwargs):
     instrumenting_mapper = state.manager.info.get(_INSTRUMENTOR)
     if instrumenting_mapper:
         if Mapper._new_mappers:
-            configure_mappers()
+            instrumenting_mapper._check_configure()
         if instrumenting_mapper._set_polymorphic_identity:
             instrumenting_mapper._set_polymorphic_identity(state)
 
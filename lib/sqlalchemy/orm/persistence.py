@@ -930,6 +930,17 @@ def _emit_update_statements(
         )
         allow_multirow = has_all_defaults and not needs_version_id
 
+        if (
+            allow_multirow
+            and not hasvalue
+            and not return_defaults
+            and len(records) > 1
+            and _use_coalesced_update(mapper, table, connection)
+        ):
+            coalesced_runs = _coalesced_update_runs(mapper, table, records)
+        else:
+            coalesced_runs = None
+
         if hasvalue:
             for (
                 state,
@@ -987,6 +998,18 @@ def _emit_update_statements(
                             True,
                         )
                     rows += c.rowcount
+            elif coalesced_runs:
+                check_rowcount = assert_singlerow
+                rows += _emit_coalesced_update_statements(
+                    base_mapper,
+                    uowtransaction,
+                    cached_connections,
+                    mapper,
+                    table,
+                    coalesced_runs,
+                    cached_stmt,
+                    bookkeeping,
+                )
             else:
                 multiparams = [rec[2] for rec in records]
 
@@ -1321,8 +1344,23 @@ def _emit_delete_statements(
         expected = len(del_objects)
         rows_matched = -1
         only_warn = False
+        check_rowcount = (
+            connection.dialect.supports_sane_multi_rowcount
+            or len(del_objects) == 1
+        )
 
         if (
+            not need_version_id
+            and expected > 1
+            and _use_batched_delete(base_mapper, mapper, table, connection)
+        ):
+            rows_matched = _emit_batched_delete_statements(
+                base_mapper, mapper, table, connection, del_objects
+            )
+            only_warn = True
+            # each DELETE .. IN is a single execute()
+            check_rowcount = connection.dialect.supports_sane_rowcount
+        elif (
             need_version_id
             and not connection.dialect.supports_sane_multi_rowcount
         ):
@@ -1353,10 +1391,7 @@ def _emit_delete_statements(
             base_mapper.confirm_deleted_rows
             and rows_matched > -1
             and expected != rows_matched
-            and (
-                connection.dialect.supports_sane_multi_rowcount
-                or len(del_objects) == 1
-            )
+            and check_rowcount
         ):
             # TODO: why does this "only warn" if versioning is turned off,
             # whereas the UPDATE raises?
@@ -1378,6 +1413,212 @@ def _emit_delete_statements(
                 )
 
 
+_batched_update_chunksize = 500
+
+
+def _use_coalesced_update(mapper, table, connection):
+    """Return True if UPDATE statements with identical SET clauses against
+    the given table may be combined into UPDATE .. WHERE pk IN (...)."""
+
+    return (
+        (
+            len(mapper._pks_by_table[table]) == 1
+            or connection.dialect.supports_tuple_in
+        )
+        and "primary_keys" not in table.c
+        # Python-side onupdate defaults are invoked once per statement,
+        # and may consult the parameters of the individual row
+        and not any(
+            col.onupdate is not None and col.onupdate.is_callable
+            for col in table.c
+        )
+    )
+
+
+def _coalesced_update_runs(mapper, table, records):
+    """Group consecutive UPDATE records which SET identical values.
+
+    Returns a list of ``(set_params, records)`` tuples, or None if no
+    two records can be combined.  Only consecutive records are grouped,
+    so that the order in which rows are updated is maintained.
+
+    """
+    pk_keys = [col._label for col in mapper._pks_by_table[table]]
+
+    def set_values(rec):
+        return dict(
+            (key, (type(value), value))
+            for key, value in rec[2].items()
+            if key not in pk_keys
+        )
+
+    runs = [
+        (set_params, list(run))
+        for set_params, run in groupby(records, set_values)
+    ]
+    if len(runs) == len(records):
+        return None
+    return runs
+
+
+def _emit_coalesced_update_statements(
+    base_mapper,
+    uowtransaction,
+    cached_connections,
+    mapper,
+    table,
+    runs,
+    cached_stmt,
+    bookkeeping,
+):
+    """Emit UPDATE statements for runs of records grouped by
+    _coalesced_update_runs(), using UPDATE .. WHERE pk IN (...) for
+    each run of more than one record, returning the total number of rows
+    matched."""
+
+    pk_cols = list(mapper._pks_by_table[table])
+    pk_keys = [col._label for col in pk_cols]
+
+    statement = base_mapper._memo(
+        ("coalesced_update", table),
+        lambda: table.update(_pk_in_clause(pk_cols)),
+    )
+
+    rows = 0
+    for set_params, run in runs:
+        connection = cached_connections[run[0][4]]
+
+        if len(run) == 1:
+            executions = [(connection.execute(cached_stmt, run[0][2]), run)]
+        else:
+            set_params = dict(
+                (key, value) for key, (type_, value) in set_params.items()
+            )
+            executions = []
+            chunksize = max(1, _batched_update_chunksize // len(pk_cols))
+            for idx, chunk in enumerate(
+                _pk_chunks(
+                    pk_cols,
+                    pk_keys,
+                    [rec[2] for rec in run],
+                    _batched_update_chunksize,
+                )
+            ):
+                params = dict(set_params, primary_keys=chunk)
+                executions.append(
+                    (
+                        connection.execute(statement, params),
+                        run[idx * chunksize : (idx + 1) * chunksize],
+                    )
+                )
+
+        for c, chunk_records in executions:
+            rows += c.rowcount
+            if bookkeeping:
+                for (
+                    state,
+                    state_dict,
+                    params,
+                    mapper_rec,
+                    conn,
+                    value_params,
+                    has_all_defaults,
+                    has_all_pks,
+                ) in chunk_records:
+                    _postfetch(
+                        mapper_rec,
+                        uowtransaction,
+                        table,
+                        state,
+                        state_dict,
+                        c,
+                        c.context.compiled_parameters[0],
+                        value_params,
+                        True,
+                    )
+    return rows
+
+
+_batched_delete_chunksize = 500
+
+
+def _use_batched_delete(base_mapper, mapper, table, connection):
+    """Return True if rows of the given table may be deleted using
+    DELETE .. WHERE pk IN (...), rather than one row per parameter set."""
+
+    dialect = connection.dialect
+
+    if not dialect.supports_sane_rowcount:
+        return False
+
+    pk_cols = mapper._pks_by_table[table]
+    if len(pk_cols) > 1 and not dialect.supports_tuple_in:
+        return False
+
+    # rows in a self-referential table are deleted in dependency order;
+    # don't rely upon the database to check constraints for the
+    # statement as a whole
+    return not base_mapper._memo(
+        ("delete_self_referential", table),
+        lambda: any(fk.column.table is table for fk in table.foreign_keys),
+    )
+
+
+def _emit_batched_delete_statements(
+    base_mapper, mapper, table, connection, del_objects
+):
+    """Emit DELETE .. WHERE pk IN (...) statements for the given
+    parameter sets, returning the total number of rows matched."""
+
+    pk_cols = list(mapper._pks_by_table[table])
+
+    statement = base_mapper._memo(
+        ("batched_delete", table),
+        lambda: table.delete(_pk_in_clause(pk_cols)),
+    )
+
+    rows_matched = 0
+    for chunk in _pk_chunks(
+        pk_cols,
+        [col.key for col in pk_cols],
+        del_objects,
+        _batched_delete_chunksize,
+    ):
+        c = connection.execute(statement, {"primary_keys": chunk})
+        rows_matched += c.rowcount
+    return rows_matched
+
+
+def _pk_in_clause(pk_cols):
+    """Return the criterion pk IN (:primary_keys) for the given primary key
+    columns, using an expanding bound parameter."""
+
+    if len(pk_cols) > 1:
+        in_expr = sql.tuple_(*pk_cols)
+    else:
+        in_expr = pk_cols[0]
+    return in_expr.in_(sql.bindparam("primary_keys", expanding=True))
+
+
+def _pk_chunks(pk_cols, keys, param_sets, chunksize):
+    """Yield lists of primary key values, or tuples of values for
+    a composite primary key, from the given parameter sets."""
+
+    if len(pk_cols) > 1:
+        primary_keys = [
+            tuple(params[key] for key in keys) for params in param_sets
+        ]
+    else:
+        key = keys[0]
+        primary_keys = [params[key] for params in param_sets]
+
+    chunksize = max(1, chunksize // len(pk_cols))
+
+    while primary_keys:
+        yield primary_keys[0:chunksize]
+        primary_keys = primary_keys[chunksize:]
+
+
 def _finalize_insert_update_commands(base_mapper, uowtransaction, states):
     """finalize state on states that have been inserted or updated,
     including calling after_insert/after_update events.
@@ -1648,6 +1889,7 @@ class BulkUD(object):
     def __init__(self, query):
         self.query = query.enable_eagerloads(False)
         self.mapper = self.query._bind_mapper()
+        self.returning = ()
         self._validate_query_state()
 
     def _validate_query_state(self):
@@ -1701,8 +1943,9 @@ class BulkUD(object):
     def _do_before_compile(self):
         raise NotImplementedError()
 
-    @util.dependencies("sqlalchemy.orm.query")
-    def _do_pre(self, querylib):
+    @util.preload_module("sqlalchemy.orm.query")
+    def _do_pre(self):
+        querylib = util.preloaded.orm_query
         query = self.query
 
         self.context = querylib.QueryContext(query)
@@ -1784,11 +2027,21 @@ class BulkEvaluate(BulkUD):
 
 
 class BulkFetch(BulkUD):
-    """BulkUD which does the 'fetch' method of session state resolution."""
+    """BulkUD which does the 'fetch' method of session state resolution.
+
+    If the dialect supports RETURNING for multiple rows, the primary keys
+    of matched rows are returned by the UPDATE or DELETE statement itself;
+    otherwise they are SELECTed ahead of the statement.
+
+    """
 
     def _do_pre_synchronize(self):
         query = self.query
         session = query.session
+        if self.mapper is not None and self._use_returning():
+            self.returning = self._returning_columns()
+            return
+
         context = query._compile_context()
         select_stmt = context.statement.with_only_columns(
             self.primary_table.primary_key
@@ -1797,6 +2050,19 @@ class BulkFetch(BulkUD):
             select_stmt, mapper=self.mapper, params=query._params
         ).fetchall()
 
+    def _use_returning(self):
+        return self.query._crud_returning_supported(
+            self.mapper, self.primary_table
+        )
+
+    def _returning_columns(self):
+        return list(self.primary_table.primary_key)
+
+    def _do_exec(self):
+        super(BulkFetch, self)._do_exec()
+        if self.returning:
+            self.matched_rows = self.result.fetchall()
+
 
 class BulkUpdate(BulkUD):
     """BulkUD which handles UPDATEs."""
@@ -1882,11 +2148,15 @@ class BulkUpdate(BulkUD):
             values,
             **self.update_kwargs
         )
+        if self.returning:
+            update_stmt = update_stmt.returning(*self.returning)
 
         self._execute_stmt(update_stmt)
 
     def _do_post(self):
         session = self.query.session
+        if session.entity_cache is not None:
+            session.entity_cache._after_bulk(session)
         session.dispatch.after_bulk_update(self)
 
 
@@ -1917,11 +2187,15 @@ class BulkDelete(BulkUD):
 
     def _do_exec(self):
         delete_stmt = sql.delete(self.primary_table, self.context.whereclause)
+        if self.returning:
+            delete_stmt = delete_stmt.returning(*self.returning)
 
         self._execute_stmt(delete_stmt)
 
     def _do_post(self):
         session = self.query.session
+        if session.entity_cache is not None:
+            session.entity_cache._after_bulk(session)
         session.dispatch.after_bulk_delete(self)
 
 
@@ -1979,29 +2253,92 @@ class BulkUpdateFetch(BulkFetch, BulkUpdate):
     """BulkUD which handles UPDATEs using the "fetch"
     method of session resolution."""
 
+    def _use_returning(self):
+        # RETURNING delivers the new primary key of each row, rather than
+        # the identity of the object in the Session; SELECT the current
+        # primary keys first if any of them are changing.
+        for key, value in self._resolved_values_keys_as_propnames:
+            prop = self.mapper.column_attrs.get(key)
+            if prop is not None and any(
+                self.primary_table.primary_key.contains_column(col)
+                for col in prop.columns
+            ):
+                return False
+        return super(BulkUpdateFetch, self)._use_returning()
+
+    def _returning_columns(self):
+        # when using RETURNING, also return the new values of updated
+        # columns, so that matched objects may be refreshed in place
+        # rather than expired.
+        self.returning_keys = []
+        columns = []
+        for key in util.unique_list(
+            k for k, v in self._resolved_values_keys_as_propnames
+        ):
+            prop = self.mapper.column_attrs.get(key)
+            if (
+                prop is not None
+                and len(prop.columns) == 1
+                and self.primary_table.c.contains_column(prop.columns[0])
+            ):
+                self.returning_keys.append(key)
+                columns.append(prop.columns[0])
+        return super(BulkUpdateFetch, self)._returning_columns() + columns
+
     def _do_post_synchronize(self):
         session = self.query.session
         target_mapper = self.query._mapper_zero()
 
-        states = set(
-            [
-                attributes.instance_state(session.identity_map[identity_key])
-                for identity_key in [
+        values = self._resolved_values_keys_as_propnames
+        attrib = set(k for k, v in values)
+
+        if self.returning:
+            num_pk = len(self.primary_table.primary_key)
+            refreshed = dict(
+                (
+                    target_mapper.identity_key_from_primary_key(
+                        list(row[0:num_pk])
+                    ),
+                    dict(zip(self.returning_keys, row[num_pk:])),
+                )
+                for row in self.matched_rows
+            )
+        else:
+            refreshed = dict(
+                (
                     target_mapper.identity_key_from_primary_key(
                         list(primary_key)
-                    )
-                    for primary_key in self.matched_rows
-                ]
-                if identity_key in session.identity_map
-            ]
-        )
+                    ),
+                    {},
+                )
+                for primary_key in self.matched_rows
+            )
 
-        values = self._resolved_values_keys_as_propnames
-        attrib = set(k for k, v in values)
-        for state in states:
-            to_expire = attrib.intersection(state.dict)
+        states = set()
+        for identity_key, new_values in refreshed.items():
+            obj = session.identity_map.get(identity_key)
+            if obj is None:
+                continue
+            state, dict_ = (
+                attributes.instance_state(obj),
+                attributes.instance_dict(obj),
+            )
+
+            if new_values:
+                # only refresh unmodified attributes; those with pending
+                # changes are expired as they've been overwritten
+                to_refresh = state.unmodified.intersection(new_values)
+                for key in to_refresh:
+                    dict_[key] = new_values[key]
+                state.manager.dispatch.refresh(state, None, to_refresh)
+                state._commit(dict_, list(to_refresh))
+            else:
+                to_refresh = ()
+
+            to_expire = attrib.difference(to_refresh).intersection(dict_)
             if to_expire:
                 session._expire_state(state, to_expire)
+            states.add(state)
         session._register_altered(states)
 
 
@@ -19,6 +19,7 @@ database to return iterable result sets.
 
 """
 
+import copy
 from itertools import chain
 
 from . import attributes
@@ -104,6 +105,7 @@ class Query(object):
     _correlate = frozenset()
     _populate_existing = False
     _invoke_all_eagers = True
+    _compile_cache = True
     _version_check = False
     _autoflush = True
     _only_load_props = None
@@ -962,6 +964,103 @@ class Query(object):
         """
         return self._get_impl(ident, loading.load_on_pk_identity)
 
+    def get_many(self, idents):
+        """Return a list of instances based on the given primary key
+        identifiers, in the same order, with ``None`` for each identifier
+        that is not found.
+
+        E.g.::
+
+            users = session.query(User).get_many([5, 7, 12])
+
+            some_objects = session.query(VersionedFoo).get_many(
+                [(5, 10), (7, 3)])
+
+        :meth:`~.Query.get_many` is the multiple-identifier form of
+        :meth:`~.Query.get`.  Each identifier which is present in the
+        local identity map is returned directly from this collection,
+        subject to the same rules as :meth:`~.Query.get`.  The remaining
+        identifiers are loaded using SELECT statements against the
+        primary key using IN, one for each chunk of 500 identifiers,
+        rather than emitting one SELECT per identifier; for a composite
+        primary key, a tuple IN expression is used, which requires a
+        backend that supports it.
+
+        As with :meth:`~.Query.get`, the originating :class:`.Query` must
+        be constructed against a single mapped entity with no additional
+        filtering criterion.  When the mapped entity is polymorphic,
+        objects are returned as their loaded subclass.
+
+        :param idents: a sequence of identifiers, each of which is in any
+         of the forms accepted by :meth:`~.Query.get`.
+
+        :return: a list of object instances or ``None``, corresponding
+         to ``idents``.
+
+        .. versionadded:: 1.4
+
+        .. seealso::
+
+            :meth:`.Session.get_many`
+
+        """
+        mapper = self._only_full_mapper_zero("get_many")
+
+        idents = [
+            loading._coerce_pk_identity(
+                mapper, self._primary_key_identity(mapper, ident, "get_many")
+            )
+            for ident in idents
+        ]
+
+        found = {}
+        readonly = self._execution_options.get("readonly_entities", False)
+
+        # objects loaded with readonly_entities are never taken from the
+        # identity map, which only holds objects tracked by the Session
+        if (
+            not self._populate_existing
+            and not mapper.always_refresh
+            and self._for_update_arg is None
+            and not readonly
+        ):
+            for ident in idents:
+                if ident in found:
+                    continue
+                instance = self._identity_lookup(mapper, ident)
+                if instance is not None:
+                    self._get_existing_condition()
+                    # reject calls for id in identity map but class
+                    # mismatch.
+                    if not issubclass(instance.__class__, mapper.class_):
+                        instance = None
+                    found[ident] = instance
+
+        to_load = []
+        for ident in idents:
+            if ident not in found:
+                if None in ident:
+                    found[ident] = loading.load_on_pk_identity(self, ident)
+                else:
+                    found[ident] = None
+                    to_load.append(ident)
+
+        if to_load:
+            if readonly:
+                key_props = mapper._identity_key_props
+                for instance in loading.load_on_pk_identities(self, to_load):
+                    dict_ = attributes.instance_dict(instance)
+                    found[tuple([dict_[p.key] for p in key_props])] = instance
+                return [found[ident] for ident in idents]
+
+            entity_cache = self.session.entity_cache
+            for instance in loading.load_on_pk_identities(self, to_load):
+                found[attributes.instance_state(instance).key[1]] = instance
+                if entity_cache is not None:
+                    entity_cache._put(self.session, instance)
+
+        return [found[ident] for ident in idents]
+
     def _identity_lookup(
         self,
         mapper,
@@ -1014,15 +1113,22 @@ class Query(object):
         key = mapper.identity_key_from_primary_key(
             primary_key_identity, identity_token=identity_token
         )
+
+        entity_cache = self.session.entity_cache
+        if (
+            entity_cache is not None
+            and passive & attributes.SQL_OK
+            and key not in self.session.identity_map
+        ):
+            return entity_cache._load(self.session, mapper, key)
+
         return loading.get_from_identity(self.session, key, passive)
 
-    def _get_impl(self, primary_key_identity, db_load_fn, identity_token=None):
+    def _primary_key_identity(self, mapper, primary_key_identity, meth):
         # convert composite types to individual args
         if hasattr(primary_key_identity, "__composite_values__"):
             primary_key_identity = primary_key_identity.__composite_values__()
 
-        mapper = self._only_full_mapper_zero("get")
-
         is_dict = isinstance(primary_key_identity, dict)
         if not is_dict:
             primary_key_identity = util.to_list(primary_key_identity)
@@ -1030,8 +1136,8 @@ class Query(object):
         if len(primary_key_identity) != len(mapper.primary_key):
             raise sa_exc.InvalidRequestError(
                 "Incorrect number of values in identifier to formulate "
-                "primary key for query.get(); primary key columns are %s"
-                % ",".join("'%s'" % c for c in mapper.primary_key)
+                "primary key for query.%s(); primary key columns are %s"
+                % (meth, ",".join("'%s'" % c for c in mapper.primary_key))
             )
 
         if is_dict:
@@ -1044,18 +1150,32 @@ class Query(object):
             except KeyError:
                 raise sa_exc.InvalidRequestError(
                     "Incorrect names of values in identifier to formulate "
-                    "primary key for query.get(); primary key attribute names"
+                    "primary key for query.%s(); primary key attribute names"
                     " are %s"
-                    % ",".join(
-                        "'%s'" % prop.key
-                        for prop in mapper._identity_key_props
+                    % (
+                        meth,
+                        ",".join(
+                            "'%s'" % prop.key
+                            for prop in mapper._identity_key_props
+                        ),
                     )
                 )
 
+        return primary_key_identity
+
+    def _get_impl(self, primary_key_identity, db_load_fn, identity_token=None):
+        mapper = self._only_full_mapper_zero("get")
+
+        primary_key_identity = self._primary_key_identity(
+            mapper, primary_key_identity, "get"
+        )
+        readonly = self._execution_options.get("readonly_entities", False)
+
         if (
             not self._populate_existing
             and not mapper.always_refresh
             and self._for_update_arg is None
+            and not readonly
         ):
 
             instance = self._identity_lookup(
@@ -1070,7 +1190,14 @@ class Query(object):
                     return None
                 return instance
 
-        return db_load_fn(self, primary_key_identity)
+        instance = db_load_fn(self, primary_key_identity)
+        if (
+            instance is not None
+            and self.session.entity_cache is not None
+            and not readonly
+        ):
+            self.session.entity_cache._put(self.session, instance)
+        return instance
 
     @_generative()
     def correlate(self, *args):
@@ -1129,6 +1256,16 @@ class Query(object):
         """
         self._populate_existing = True
 
+    @_generative()
+    def _with_compile_cache(self, value):
+        """Set the 'compile cache' flag which allows the compiled form of
+        this :class:`.Query` to be cached, keyed on its structure.
+
+        Default is that of :attr:`.Query._compile_cache`.
+
+        """
+        self._compile_cache = value
+
     @_generative()
     def _with_invoke_all_eagers(self, value):
         """Set the 'invoke all eagers' flag which causes joined- and
@@ -1638,6 +1775,27 @@ class Query(object):
         automatically if the :meth:`~sqlalchemy.orm.query.Query.yield_per()`
         method is used.
 
+        The ORM additionally accepts the following option:
+
+        * ``compile_populators`` - when ``True``, rows are populated into
+          mapped instances using a generated Python function specific to
+          the attributes being loaded, rather than iterating through a
+          series of per-attribute callables.  This reduces per-row overhead
+          when loading large numbers of full objects.
+
+          .. versionadded:: 1.4
+
+        * ``readonly_entities`` - when ``True``, mapped instances are
+          created directly from rows without an :class:`.InstanceState`;
+          they are not placed in the identity map, are not associated
+          with the :class:`.Session`, and emit no load events.  Only
+          column attributes and relationships loaded by joined, subquery
+          or selectin eager loading are populated; instances can't be
+          modified and other attributes can't be loaded.  See
+          :ref:`session_readonly_entities`.
+
+          .. versionadded:: 1.4
+
         .. seealso::
 
             :meth:`.Query.get_execution_options`
@@ -3341,12 +3499,226 @@ class Query(object):
             return None
 
     def __iter__(self):
+        cache_key = self._query_cache_key()
+        if cache_key is not None:
+            return self._execute_cached(*cache_key)
+
         context = self._compile_context()
         context.statement.use_labels = True
         if self._autoflush and not self._populate_existing:
             self.session._autoflush()
         return self._execute_and_instances(context)
 
+    def _query_cache_key(self):
+        """Return a tuple of ``(mapper, key, bindparams)`` representing the
+        structure of this :class:`.Query`, or ``None`` if the query can't be
+        cached.  ``mapper`` is the base mapper whose caches are used.
+
+        The key is built from the entities, criteria, options and other
+        SQL-affecting state of the query; the values of bound parameters are
+        not part of the key, and are instead collected into the
+        ``bindparams`` list so that they may be applied to a previously
+        compiled statement.   Any state which can't be represented
+        reliably, such as aliased entities, adapted FROM clauses or
+        options that don't produce a cache key, disables caching for the
+        query.
+
+        """
+        if (
+            not self._compile_cache
+            or self.session is None
+            or not self.session.enable_baked_queries
+            or self._statement is not None
+            or self._refresh_state is not None
+            or self._only_load_props
+            or self._polymorphic_adapters
+            or self._filter_aliases
+            or self._from_obj_alias is not None
+            or self._correlate
+            or self._with_hints
+            or self._prefixes
+            or self._suffixes
+            or self._current_path.path
+            or self.dispatch.before_compile
+            or not util.methods_equivalent(
+                self.__class__._compile_context, Query._compile_context
+            )
+            or not isinstance(self._limit, (int, type(None)))
+            or not isinstance(self._offset, (int, type(None)))
+        ):
+            return None
+
+        bindparams = []
+        key = [
+            self.__class__,
+            self._only_return_tuples,
+            self._enable_eagerloads,
+            self._with_labels,
+            self._yield_per,
+            self._limit,
+            self._offset,
+            self._populate_existing,
+            self._invoke_all_eagers,
+            self._version_check,
+            self._autoflush,
+            self._enable_single_crit,
+            self._orm_only_adapt,
+            self._orm_only_from_obj_alias,
+            # affects both the loading strategies set up at compile time
+            # and the QueryContext itself
+            bool(self._execution_options.get("readonly_entities", False)),
+        ]
+        mapper = None
+
+        try:
+            for ent in self._entities:
+                if isinstance(ent, _MapperEntity):
+                    if ent.is_aliased_class:
+                        return None
+                    if mapper is None:
+                        mapper = ent.mapper
+                    key.append(
+                        (
+                            ent.mapper,
+                            tuple(ent._with_polymorphic or ()),
+                            ent._polymorphic_discriminator,
+                        )
+                    )
+                    for opt in self._with_options:
+                        opt_key = opt._generate_cache_key(ent.path)
+                        if opt_key is False:
+                            return None
+                        key.append(opt_key)
+                elif isinstance(ent, _ColumnEntity):
+                    if any(e.is_aliased_class for e in ent.entities):
+                        return None
+                    elif mapper is None:
+                        mapper = ent.mapper
+                    key.append(
+                        (
+                            ent._label_name,
+                            tuple(e.mapper for e in ent.entities),
+                            ent.column._cache_key(bindparams=bindparams),
+                        )
+                    )
+                else:
+                    return None
+
+            for insp in self._join_entities + (
+                (self._select_from_entity,)
+                if self._select_from_entity is not None
+                else ()
+            ):
+                if getattr(insp, "is_aliased_class", False):
+                    return None
+                key.append(insp)
+
+            for elem in (self._criterion, self._having):
+                key.append(
+                    elem._cache_key(bindparams=bindparams)
+                    if elem is not None
+                    else None
+                )
+
+            for elements in (self._order_by, self._group_by, self._distinct):
+                if isinstance(elements, list):
+                    key.append(
+                        tuple(
+                            elem._cache_key(bindparams=bindparams)
+                            for elem in elements
+                        )
+                    )
+                else:
+                    key.append(elements)
+
+            key.append(
+                tuple(
+                    elem._cache_key(bindparams=bindparams)
+                    for elem in self._from_obj
+                )
+            )
+            key.append(
+                self._for_update_arg._cache_key(bindparams=bindparams)
+                if self._for_update_arg is not None
+                else None
+            )
+        except NotImplementedError:
+            return None
+
+        if mapper is None:
+            return None
+
+        return mapper.base_mapper, tuple(key), bindparams
+
+    def _execute_cached(self, mapper, key, bindparams):
+        """Execute this :class:`.Query` using a :class:`.QueryContext`
+        retrieved from the query cache of the given base mapper, compiling
+        and storing the context first if it's not already present.
+
+        """
+        cache = mapper._query_cache
+        cached = cache.get(key)
+        if cached is None:
+            context = self._compile_context()
+            context.statement.use_labels = True
+
+            # the bound parameters gathered from the query must be the
+            # same objects present in the final statement, in order that
+            # new values can be applied to them by key.   If compilation
+            # copied them, e.g. due to adaptation, don't cache.
+            if not any(
+                isinstance(value, Query)
+                for value in context.attributes.values()
+            ):
+                in_statement = set()
+                visitors.traverse(
+                    context.statement,
+                    {},
+                    {"bindparam": lambda bind: in_statement.add(bind)},
+                )
+                if in_statement.issuperset(bindparams):
+                    cached = copy.copy(context)
+                    cached.session = None
+                    cached.attributes = context.attributes.copy()
+                    cached.query = query = self._clone()
+                    query.session = None
+                    cache[key] = (cached, bindparams)
+
+            if self._autoflush and not self._populate_existing:
+                self.session._autoflush()
+            return self._execute_and_instances(context)
+
+        cached, cached_bindparams = cached
+        context = copy.copy(cached)
+        context.session = self.session
+        context.attributes = cached.attributes.copy()
+        context.propagate_options = set(
+            o for o in self._with_options if o.propagate_to_loaders
+        )
+
+        # apply the current query's per-execution state on top of the
+        # compiled state of the cached query
+        q = self._clone()
+        q._entities = cached.query._entities
+        q._primary_entity = cached.query._primary_entity
+        params = dict(
+            (cached_bind.key, bind.effective_value)
+            for cached_bind, bind in zip(cached_bindparams, bindparams)
+        )
+        params.update(self._params)
+        q._params = params
+        if "compiled_cache" not in self._execution_options:
+            # compiled forms of the cached statements are kept apart from
+            # the contexts themselves, so that neither evicts the other
+            q._execution_options = self._execution_options.union(
+                {"compiled_cache": mapper._query_compiled_cache}
+            )
+        context.query = q
+
+        if self._autoflush and not self._populate_existing:
+            self.session._autoflush()
+        return q._execute_and_instances(context)
+
     def __str__(self):
         context = self._compile_context()
         try:
@@ -3380,6 +3752,18 @@ class Query(object):
 
         return conn.execute(stmt, self._params)
 
+    def _crud_returning_supported(self, mapper, table):
+        """Return True if UPDATE and DELETE statements against the given
+        table invoked via :meth:`._execute_crud` may use RETURNING to
+        return a row for each affected row."""
+
+        return (
+            table.implicit_returning
+            and self.session.get_bind(
+                mapper, clause=table
+            ).dialect.full_returning
+        )
+
     def _get_bind_args(self, querycontext, fn, **kw):
         return fn(
             mapper=self._bind_mapper(), clause=querycontext.statement, **kw
@@ -3622,14 +4006,19 @@ class Query(object):
             ``'fetch'`` - performs a select query before the delete to find
             objects that are matched by the delete query and need to be
             removed from the session. Matched objects are removed from the
-            session.
+            session.  On backends that support RETURNING for multiple rows,
+            such as PostgreSQL and SQL Server, the primary keys of matched
+            rows are instead returned by the DELETE statement itself.
 
             ``'evaluate'`` - Evaluate the query's criteria in Python straight
             on the objects in the session. If evaluation of the criteria isn't
             implemented, an error is raised.
 
             The expression evaluator currently doesn't account for differing
-            string collations between the database and Python.
+            string collations between the database and Python.  LIKE and
+            related operators such as :meth:`.ColumnOperators.startswith`
+            aren't evaluated, as their case sensitivity varies by backend;
+            :meth:`.ColumnOperators.ilike` is evaluated case insensitively.
 
         :return: the count of rows matched as returned by the database's
           "row count" feature.
@@ -3760,14 +4149,22 @@ class Query(object):
 
             ``'fetch'`` - performs a select query before the update to find
             objects that are matched by the update query. The updated
-            attributes are expired on matched objects.
+            attributes are expired on matched objects.  On backends that
+            support RETURNING for multiple rows, such as PostgreSQL and SQL
+            Server, the UPDATE statement itself returns the primary keys of
+            matched rows along with the new values of updated columns, which
+            are then refreshed in place on matched objects that have no
+            pending changes to those attributes.
 
             ``'evaluate'`` - Evaluate the Query's criteria in Python straight
             on the objects in the session. If evaluation of the criteria isn't
             implemented, an exception is raised.
 
             The expression evaluator currently doesn't account for differing
-            string collations between the database and Python.
+            string collations between the database and Python.  LIKE and
+            related operators such as :meth:`.ColumnOperators.startswith`
+            aren't evaluated, as their case sensitivity varies by backend;
+            :meth:`.ColumnOperators.ilike` is evaluated case insensitively.
 
         :param update_args: Optional dictionary, if present will be passed
          to the underlying :func:`.update` construct as the ``**kw`` for
@@ -4676,6 +5073,8 @@ class QueryContext(object):
         "partials",
         "post_load_paths",
         "identity_token",
+        "readonly_entities",
+        "readonly_instances",
     )
 
     def __init__(self, query):
@@ -4706,6 +5105,10 @@ class QueryContext(object):
         self.invoke_all_eagers = query._invoke_all_eagers
         self.version_check = query._version_check
         self.refresh_state = query._refresh_state
+        self.readonly_entities = (
+            query._execution_options.get("readonly_entities", False)
+            and query._refresh_state is None
+        )
         self.primary_columns = []
         self.secondary_columns = []
         self.eager_order_by = []
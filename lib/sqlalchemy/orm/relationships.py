@@ -532,6 +532,13 @@ class RelationshipProperty(StrategizedProperty):
             first accessed, using a separate SELECT statement, or identity map
             fetch for simple many-to-one references.
 
+          * ``batch`` - items should be loaded lazily when the property is
+            first accessed on any object, for all objects which were loaded
+            in the same result as that object, using a SELECT statement
+            that specifies primary key identifiers using an IN clause.
+
+            .. versionadded:: 1.4
+
           * ``immediate`` - items should be loaded as the parents are loaded,
             using a separate SELECT statement, or identity map fetch for
             simple many-to-one references.
@@ -583,6 +590,15 @@ class RelationshipProperty(StrategizedProperty):
             applied before iterating the results.  See
             the section :ref:`dynamic_relationship` for more details.
 
+          * ``write_only`` - the attribute will return a
+            :class:`.WriteOnlyCollection` object, which allows objects to
+            be added to and removed from the collection but never loads
+            it; its contents may be queried explicitly using
+            :meth:`.WriteOnlyCollection.select`.  See the section
+            :ref:`write_only_relationship` for more details.
+
+            .. versionadded:: 1.4
+
           * True - a synonym for 'select'
 
           * False - a synonym for 'joined'
@@ -596,6 +612,9 @@ class RelationshipProperty(StrategizedProperty):
 
             :ref:`dynamic_relationship` - detail on the ``dynamic`` option.
 
+            :ref:`write_only_relationship` - detail on the ``write_only``
+            option.
+
             :ref:`collections_noload_raiseload` - notes on "noload" and "raise"
 
         :param load_on_pending=False:
@@ -1439,8 +1458,7 @@ class RelationshipProperty(StrategizedProperty):
 
         @util.memoized_property
         def property(self):
-            if mapperlib.Mapper._new_mappers:
-                mapperlib.Mapper._configure_all()
+            self.prop.parent._check_configure()
             return self.prop
 
     def _with_parent(self, instance, alias_secondary=True, from_entity=None):
@@ -18,6 +18,7 @@ from . import loading
 from . import persistence
 from . import query
 from . import state as statelib
+from . import strategy_options
 from .base import _class_to_mapper
 from .base import _none_set
 from .base import _state_mapper
@@ -72,13 +73,14 @@ class _SessionClassMethods(object):
         close_all_sessions()
 
     @classmethod
-    @util.dependencies("sqlalchemy.orm.util")
-    def identity_key(cls, orm_util, *args, **kwargs):
+    @util.preload_module("sqlalchemy.orm.util")
+    def identity_key(cls, *args, **kwargs):
         """Return an identity key.
 
         This is an alias of :func:`.util.identity_key`.
 
         """
+        orm_util = util.preloaded.orm_util
         return orm_util.identity_key(*args, **kwargs)
 
     @classmethod
@@ -379,9 +381,12 @@ class SessionTransaction(object):
 
         assert not self.session._deleted
 
+        expired = []
         for s in self.session.identity_map.all_states():
             if not dirty_only or s.modified or s in self._dirty:
                 s._expire(s.dict, self.session.identity_map._modified)
+                expired.append(s)
+        self.session._track_bulk_expired(expired, replace=not dirty_only)
 
     def _remove_snapshot(self):
         """Remove the restoration state taken before a transaction began.
@@ -392,8 +397,10 @@ class SessionTransaction(object):
         assert self._is_transaction_boundary
 
         if not self.nested and self.session.expire_on_commit:
-            for s in self.session.identity_map.all_states():
+            all_states = self.session.identity_map.all_states()
+            for s in all_states:
                 s._expire(s.dict, self.session.identity_map._modified)
+            self.session._track_bulk_expired(all_states, replace=True)
 
             statelib.InstanceState._detach_states(
                 list(self._deleted), self.session
@@ -584,6 +591,9 @@ class SessionTransaction(object):
         self._state = CLOSED
         self.session.dispatch.after_transaction_end(self.session, self)
 
+        if self._parent is None and self.session.entity_cache is not None:
+            self.session.entity_cache._after_transaction_end(self.session)
+
         if self._parent is None:
             if not self.session.autocommit:
                 self.session.begin()
@@ -633,6 +643,7 @@ class Session(_SessionClassMethods):
         "expunge_all",
         "flush",
         "get_bind",
+        "get_many",
         "is_modified",
         "bulk_save_objects",
         "bulk_insert_mappings",
@@ -640,6 +651,7 @@ class Session(_SessionClassMethods):
         "merge",
         "query",
         "refresh",
+        "refresh_all",
         "rollback",
         "scalar",
     )
@@ -682,6 +694,9 @@ class Session(_SessionClassMethods):
         enable_baked_queries=True,
         info=None,
         query_cls=None,
+        identity_map_cls=None,
+        bulk_load_expired=False,
+        entity_cache=None,
     ):
         r"""Construct a new Session.
 
@@ -765,6 +780,21 @@ class Session(_SessionClassMethods):
            :class:`.sessionmaker` function, and is not sent directly to the
            constructor for ``Session``.
 
+        :param bulk_load_expired: Defaults to ``False``.  When ``True``,
+           the first access of an expired attribute on a persistent
+           instance loads the same attributes for all other instances of
+           the same mapper within this :class:`.Session` which have them
+           expired as well, such as after a :meth:`~.Session.commit`,
+           using SELECT statements against the primary key using IN, one
+           for each chunk of 500 instances, rather than emitting one SELECT
+           per instance.
+
+           .. versionadded:: 1.4
+
+           .. seealso::
+
+                :meth:`.Session.refresh_all`
+
         :param enable_baked_queries: defaults to ``True``.  A flag consumed
            by the :mod:`sqlalchemy.ext.baked` extension to determine if
            "baked queries" should be cached, as is the normal operation
@@ -777,6 +807,8 @@ class Session(_SessionClassMethods):
            logic in the calling application or potentially within the ORM
            that may be malfunctioning due to cache key collisions or similar
            can be flagged by observing if this flag resolves the issue.
+           This flag also disables the structural caching of compiled
+           :class:`.Query` objects described at :ref:`query_compile_cache`.
 
            .. versionadded:: 1.2
 
@@ -784,6 +816,15 @@ class Session(_SessionClassMethods):
            legacy-only flag which when ``False`` disables *all* 0.5-style
            object accounting on transaction boundaries.
 
+        :param entity_cache: an optional
+          :class:`~sqlalchemy.orm.entity_cache.EntityCache` which stores the
+          column state of objects loaded by primary key, so that they may be
+          produced without emitting SQL by any :class:`.Session` sharing the
+          same cache.  Entries are invalidated for objects changed within a
+          flush.
+
+          .. versionadded:: 1.4
+
         :param expire_on_commit:  Defaults to ``True``. When ``True``, all
            instances will be fully expired after each :meth:`~.commit`,
            so that all attribute/object access subsequent to a completed
@@ -807,6 +848,15 @@ class Session(_SessionClassMethods):
           objects, as returned by the :meth:`~.Session.query` method.
           Defaults to :class:`.Query`.
 
+        :param identity_map_cls: a callable which will be called with no
+          arguments to produce the identity map used by this
+          :class:`.Session`.  Defaults to the weak referencing identity map.
+          The :class:`.LRUInstanceDict` identity map may be used to
+          additionally maintain strong references to a bounded number of
+          recently used objects.
+
+          .. versionadded:: 1.4
+
         :param twophase:  When ``True``, all transactions will be started as
             a "two phase" transaction, i.e. using the "two phase" semantics
             of the database in use along with an XID.  During a
@@ -824,7 +874,9 @@ class Session(_SessionClassMethods):
 
         """
 
-        if weak_identity_map in (True, None):
+        if identity_map_cls is not None:
+            self._identity_cls = identity_map_cls
+        elif weak_identity_map in (True, None):
             self._identity_cls = identity.WeakInstanceDict
         else:
             self._identity_cls = identity.StrongInstanceDict
@@ -843,6 +895,9 @@ class Session(_SessionClassMethods):
         self.autocommit = autocommit
         self.expire_on_commit = expire_on_commit
         self.enable_baked_queries = enable_baked_queries
+        self.bulk_load_expired = bulk_load_expired
+        self._bulk_expired = {}
+        self.entity_cache = entity_cache
         self._enable_transaction_accounting = _enable_transaction_accounting
 
         self.twophase = twophase
@@ -1338,6 +1393,7 @@ class Session(_SessionClassMethods):
         self.identity_map = self._identity_cls()
         self._new = {}
         self._deleted = {}
+        self._bulk_expired = {}
 
         statelib.InstanceState._detach_states(all_states, self)
 
@@ -1542,6 +1598,32 @@ class Session(_SessionClassMethods):
 
         return self._query_cls(entities, self, **kwargs)
 
+    def get_many(self, entity, idents):
+        """Return a list of instances of the given entity based on the
+        given primary key identifiers, in the same order, with ``None``
+        for each identifier that is not found.
+
+        Instances already present in the identity map are returned
+        directly; the remainder are loaded using chunked SELECT
+        statements against the primary key using IN.  This is a
+        shortcut for::
+
+            session.query(entity).get_many(idents)
+
+        :param entity: a mapped class or :class:`.Mapper`.
+
+        :param idents: a sequence of primary key identifiers, each in any
+         of the forms accepted by :meth:`.Query.get`.
+
+        .. versionadded:: 1.4
+
+        .. seealso::
+
+            :meth:`.Query.get_many`
+
+        """
+        return self.query(entity).get_many(idents)
+
     @property
     @util.contextmanager
     def no_autoflush(self):
@@ -1675,6 +1757,50 @@ class Session(_SessionClassMethods):
                 "Could not refresh instance '%s'" % instance_str(instance)
             )
 
+    def refresh_all(self, instances, attribute_names=None):
+        """Expire and refresh the attributes on the given instances.
+
+        This is the multiple-instance form of :meth:`.Session.refresh`.
+        Rather than emitting one SELECT per instance, the instances of
+        each mapper are refreshed using SELECT statements against the
+        primary key using IN, one for each chunk of 500 instances.
+
+        :param instances: a sequence of persistent instances.
+
+        :param attribute_names: optional.  An iterable collection of
+          string attribute names indicating a subset of attributes to
+          be refreshed.
+
+        .. versionadded:: 1.4
+
+        .. seealso::
+
+            :meth:`.Session.refresh`
+
+            :paramref:`.Session.bulk_load_expired`
+
+        """
+        by_mapper = util.OrderedDict()
+        for instance in instances:
+            try:
+                state = attributes.instance_state(instance)
+            except exc.NO_STATE:
+                raise exc.UnmappedInstanceError(instance)
+            self._expire_state(state, attribute_names)
+            by_mapper.setdefault(state.mapper, []).append(state)
+
+        if attribute_names is not None:
+            attribute_names = set(attribute_names)
+
+        for mapper, states in by_mapper.items():
+            missing = loading.load_scalar_attributes_for_states(
+                mapper, states, attribute_names
+            )
+            if missing:
+                raise sa_exc.InvalidRequestError(
+                    "Could not refresh instance '%s'" % state_str(missing[0])
+                )
+
     def expire_all(self):
         """Expires all persistent instances within this Session.
 
@@ -1705,8 +1831,10 @@ class Session(_SessionClassMethods):
             :meth:`.Session.refresh`
 
         """
-        for state in self.identity_map.all_states():
+        all_states = self.identity_map.all_states()
+        for state in all_states:
             state._expire(state.dict, self.identity_map._modified)
+        self._track_bulk_expired(all_states, replace=True)
 
     def expire(self, instance, attribute_names=None):
         """Expire the attributes on an instance.
@@ -1753,6 +1881,7 @@ class Session(_SessionClassMethods):
         self._validate_persistent(state)
         if attribute_names:
             state._expire_attributes(state.dict, attribute_names)
+            self._track_bulk_expired([state])
         else:
             # pre-fetch the full cascade since the expire is going to
             # remove associations
@@ -1768,10 +1897,58 @@ class Session(_SessionClassMethods):
 
         if state.key:
             state._expire(state.dict, self.identity_map._modified)
+            self._track_bulk_expired([state])
         elif state in self._new:
             self._new.pop(state)
             state._detach(self)
 
+    def _track_bulk_expired(self, states, replace=False):
+        """Record persistent states which have had attributes expired,
+        as candidates to be loaded together under
+        :paramref:`.Session.bulk_load_expired`."""
+
+        if not self.bulk_load_expired:
+            return
+        if replace:
+            self._bulk_expired = {}
+        for state in states:
+            self._bulk_expired.setdefault(state.mapper, set()).add(state)
+
+    def _bulk_expired_siblings(self, state, attribute_names):
+        """Return the given state along with those states recorded by
+        :meth:`._track_bulk_expired` which have the given attributes
+        expired as well, so that the identity map as a whole need not be
+        scanned on each load of expired attributes.
+
+        Candidates which are no longer expired, or no longer present in
+        this :class:`.Session`, are discarded along the way.
+
+        """
+        candidates = self._bulk_expired.get(state.mapper)
+        if not candidates:
+            return [state]
+
+        siblings = [state]
+        for other in list(candidates):
+            if (
+                other.session_id != self.hash_key
+                or other.obj() is None
+                or not other.expired_attributes
+            ):
+                candidates.discard(other)
+            elif other is not state and (
+                other.identity_token == state.identity_token
+                and attribute_names.issubset(other.expired_attributes)
+            ):
+                siblings.append(other)
+
+        # those states which will have all of their expired attributes
+        # loaded are no longer candidates
+        for other in siblings:
+            if not other.expired_attributes.difference(attribute_names):
+                candidates.discard(other)
+        return siblings
+
     @util.deprecated(
         "0.7",
         "The :meth:`.Session.prune` method is deprecated along with "
@@ -2094,6 +2271,143 @@ class Session(_SessionClassMethods):
         finally:
             self.autoflush = autoflush
 
+    def merge_all(self, instances, load=True):
+        """Copy the state of each of the given instances into a
+        corresponding instance within this :class:`.Session`.
+
+        This is the multiple-instance form of :meth:`.Session.merge`,
+        returning a list of merged instances in the same order as the given
+        instances.  When ``load`` is True, rather than emitting one SELECT
+        for each instance that isn't present in the identity map, the
+        persistent instances corresponding to the given instances are
+        loaded ahead of the merge using SELECT statements against the
+        primary key using IN, one for each mapper and chunk of 500
+        identifiers.  Instances reachable from the given instances via
+        relationships with ``cascade="merge"`` are loaded in the same way,
+        one level of the object graph at a time, and collections which
+        are merged into are loaded up front using "selectin" loading.
+
+        Mappers with a composite primary key are loaded individually, as
+        with :meth:`.Session.merge`.
+
+        :param instances: a sequence of instances to be merged.
+
+        :param load: Boolean, as described at :paramref:`.Session.merge.load`.
+
+        .. versionadded:: 1.4
+
+        .. seealso::
+
+            :meth:`.Session.merge`
+
+        """
+
+        if self._warn_on_events:
+            self._flush_warning("Session.merge_all()")
+
+        _recursive = {}
+        _resolve_conflict_map = {}
+
+        states = []
+        for instance in instances:
+            object_mapper(instance)  # verify mapped
+            states.append(attributes.instance_state(instance))
+
+        if load:
+            # flush current contents if we expect to load data
+            self._autoflush()
+
+        autoflush = self.autoflush
+        try:
+            self.autoflush = False
+            if load:
+                self._preload_for_merge(states, _resolve_conflict_map)
+            return [
+                self._merge(
+                    state,
+                    state.dict,
+                    load=load,
+                    _recursive=_recursive,
+                    _resolve_conflict_map=_resolve_conflict_map,
+                )
+                for state in states
+            ]
+        finally:
+            self.autoflush = autoflush
+
+    def _preload_for_merge(self, states, _resolve_conflict_map):
+        """Load the persistent instances corresponding to the given states
+        and those reachable from them via merge cascades, breadth first.
+
+        The loaded instances are added to ``_resolve_conflict_map``, which
+        also holds strong references to them until they are merged into.
+        Identity keys which are not found in the database are added with a
+        value of None, so that :meth:`._merge` creates a new instance for
+        them without emitting a SELECT.
+
+        """
+        seen = set()
+        while states:
+            by_mapper = util.OrderedDict()
+            next_states = []
+            for state in states:
+                if state in seen:
+                    continue
+                seen.add(state)
+                mapper = _state_mapper(state)
+
+                key = state.key
+                if key is None:
+                    key = mapper._identity_key_from_state(state)
+                    if attributes.NEVER_SET in key[1] or (
+                        _none_set.intersection(key[1])
+                    ):
+                        key = None
+                if (
+                    key is not None
+                    and len(mapper.primary_key) == 1
+                    and key not in self.identity_map
+                    and key not in _resolve_conflict_map
+                ):
+                    by_mapper.setdefault(mapper, util.OrderedDict())[
+                        key
+                    ] = state
+
+                dict_ = state.dict
+                for prop in mapper.relationships:
+                    if not prop.cascade.merge or prop.key not in dict_:
+                        continue
+                    if prop.uselist:
+                        impl = state.get_impl(prop.key)
+                        related = impl.get_collection(state, dict_)
+                    elif dict_[prop.key] is not None:
+                        related = [dict_[prop.key]]
+                    else:
+                        continue
+                    next_states.extend(
+                        attributes.instance_state(obj) for obj in related
+                    )
+
+            for mapper, keys in by_mapper.items():
+                # load collections which will be merged into along with
+                # the parent objects
+                options = [
+                    strategy_options.Load(mapper).selectinload(prop.key)
+                    for prop in mapper.relationships
+                    if prop.uselist
+                    and prop.cascade.merge
+                    and prop.lazy == "select"
+                    and any(prop.key in state.dict for state in keys.values())
+                ]
+                keys = list(keys)
+                found = (
+                    self.query(mapper)
+                    .options(*options)
+                    .get_many([key[1] for key in keys])
+                )
+                _resolve_conflict_map.update(zip(keys, found))
+            states = next_states
+
     def _merge(
         self,
         state,
@@ -2146,6 +2460,9 @@ class Session(_SessionClassMethods):
 
         if merged is None:
             if key_is_persistent and key in _resolve_conflict_map:
+                # None here indicates a key known to be absent from the
+                # database, as established by merge_all(), which also places
+                # the instances it has loaded here
                 merged = _resolve_conflict_map[key]
 
             elif not load:
@@ -2275,7 +2592,7 @@ class Session(_SessionClassMethods):
             if revert_deletion:
                 if not state._attached:
                     return
-                del state._deleted
+                state._deleted = False
             else:
                 raise sa_exc.InvalidRequestError(
                     "Instance '%s' has been deleted.  "
@@ -2559,6 +2876,9 @@ class Session(_SessionClassMethods):
 
             self.dispatch.after_flush(self, flush_context)
 
+            if self.entity_cache is not None:
+                self.entity_cache._after_flush(self, flush_context)
+
             flush_context.finalize_flush_changes()
 
             if not objects and self.identity_map._modified:
@@ -3301,16 +3621,16 @@ def make_transient(instance):
         s._expunge_states([state])
 
     # remove expired state
-    state.expired_attributes.clear()
+    state._expired_attributes = util.EMPTY_SET
 
     # remove deferred callables
     if state.callables:
-        del state.callables
+        state.callables = ()
 
     if state.key:
-        del state.key
+        state.key = None
     if state._deleted:
-        del state._deleted
+        state._deleted = False
 
 
 def make_transient_to_detached(instance):
@@ -3349,7 +3669,7 @@ def make_transient_to_detached(instance):
         raise sa_exc.InvalidRequestError("Given object must be transient")
     state.key = state.mapper._identity_key_from_state(state)
     if state._deleted:
-        del state._deleted
+        state._deleted = False
     state._commit_all(state.dict)
     state._expire_attributes(state.dict, state.unloaded_expirable)
 
@@ -56,50 +56,116 @@ class InstanceState(interfaces.InspectionAttrInfo):
 
         :ref:`core_inspection_toplevel`
 
-    """
-
-    session_id = None
-    key = None
-    runid = None
-    load_options = util.EMPTY_SET
-    load_path = ()
-    insert_order = None
-    _strong_obj = None
-    modified = False
-    expired = False
-    _deleted = False
-    _load_pending = False
-    _orphaned_outside_of_session = False
-    is_instance = True
-    identity_token = None
-    _last_known_values = ()
+    .. attribute:: callables
 
-    callables = ()
-    """A namespace where a per-state loader callable can be associated.
+        A namespace where a per-state loader callable can be associated.
 
-    In SQLAlchemy 1.0, this is only used for lazy loaders / deferred
-    loaders that were set up via query option.
+        In SQLAlchemy 1.0, this is only used for lazy loaders / deferred
+        loaders that were set up via query option.
 
-    Previously, callables was used also to indicate expired attributes
-    by storing a link to the InstanceState itself in this dictionary.
-    This role is now handled by the expired_attributes set.
+        Previously, callables was used also to indicate expired attributes
+        by storing a link to the InstanceState itself in this dictionary.
+        This role is now handled by the expired_attributes set.
 
     """
 
+    # the per-state collections committed_state, expired_attributes,
+    # callables, parents, _pending_mutations and _empty_collections
+    # start out as shared immutable empty collections and are replaced
+    # with a new dict / set on first write; the vast majority of loaded
+    # objects never modify, expire or parent anything.  The public
+    # committed_state, expired_attributes and parents accessors allocate
+    # the collection on first access, so that it may be mutated in place;
+    # internal read-only access uses the underscored slots.
+    __slots__ = (
+        "class_",
+        "manager",
+        "obj",
+        "_committed_state",
+        "_expired_attributes",
+        "callables",
+        "session_id",
+        "key",
+        "runid",
+        "load_options",
+        "load_path",
+        "insert_order",
+        "_strong_obj",
+        "modified",
+        "expired",
+        "_deleted",
+        "_load_pending",
+        "_orphaned_outside_of_session",
+        "identity_token",
+        "_last_known_values",
+        "_instance_dict",
+        "_parents",
+        "_pending_mutations",
+        "_empty_collections",
+    )
+
+    is_instance = True
+
     def __init__(self, obj, manager):
         self.class_ = obj.__class__
         self.manager = manager
         self.obj = weakref.ref(obj, self._cleanup)
-        self.committed_state = {}
-        self.expired_attributes = set()
+        self._committed_state = util.EMPTY_DICT
+        self._expired_attributes = util.EMPTY_SET
+        self.callables = ()
+        self.session_id = self.key = self.runid = None
+        self.load_options = util.EMPTY_SET
+        self.load_path = ()
+        self.insert_order = self._strong_obj = self.identity_token = None
+        self.modified = self.expired = self._deleted = False
+        self._load_pending = self._orphaned_outside_of_session = False
+        self._last_known_values = ()
+        self._instance_dict = _return_none
+        self._parents = util.EMPTY_DICT
+        self._pending_mutations = util.EMPTY_DICT
+        self._empty_collections = util.EMPTY_DICT
 
-    expired_attributes = None
-    """The set of keys which are 'expired' to be loaded by
-       the manager's deferred scalar loader, assuming no pending
-       changes.
+    @property
+    def committed_state(self):
+        """A dictionary of attribute keys to the value each attribute had
+        prior to being modified, for those attributes which have changed
+        since the last flush or load."""
+        committed_state = self._committed_state
+        if committed_state is util.EMPTY_DICT:
+            committed_state = self._committed_state = {}
+        return committed_state
+
+    @committed_state.setter
+    def committed_state(self, value):
+        self._committed_state = value
 
-       see also the ``unmodified`` collection which is intersected
-       against this set when a refresh operation occurs."""
+    @property
+    def expired_attributes(self):
+        """The set of keys which are 'expired' to be loaded by
+        the manager's deferred scalar loader, assuming no pending
+        changes.
+
+        see also the ``unmodified`` collection which is intersected
+        against this set when a refresh operation occurs."""
+        expired_attributes = self._expired_attributes
+        if expired_attributes is util.EMPTY_SET:
+            expired_attributes = self._expired_attributes = set()
+        return expired_attributes
+
+    @expired_attributes.setter
+    def expired_attributes(self, value):
+        self._expired_attributes = value
+
+    @property
+    def parents(self):
+        parents = self._parents
+        if parents is util.EMPTY_DICT:
+            parents = self._parents = {}
+        return parents
+
+    @parents.setter
+    def parents(self, value):
+        self._parents = value
 
     @util.memoized_property
     def attrs(self):
@@ -227,8 +293,9 @@ class InstanceState(interfaces.InspectionAttrInfo):
         return self.key is not None and not self._attached
 
     @property
-    @util.dependencies("sqlalchemy.orm.session")
-    def _attached(self, sessionlib):
+    @util.preload_module("sqlalchemy.orm.session")
+    def _attached(self):
+        sessionlib = util.preloaded.orm_session
         return (
             self.session_id is not None
             and self.session_id in sessionlib._sessions
@@ -247,8 +314,8 @@ class InstanceState(interfaces.InspectionAttrInfo):
             self._last_known_values[key] = NO_VALUE
 
     @property
-    @util.dependencies("sqlalchemy.orm.session")
-    def session(self, sessionlib):
+    @util.preload_module("sqlalchemy.orm.session")
+    def session(self):
         """Return the owning :class:`.Session` for this instance,
         or ``None`` if none available.
 
@@ -260,6 +327,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
         fully detached under normal circumstances.
 
         """
+        sessionlib = util.preloaded.orm_session
         return sessionlib._state_session(self)
 
     @property
@@ -302,19 +370,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
         # the board ?  probably
         return self.key
 
-    @util.memoized_property
-    def parents(self):
-        return {}
-
-    @util.memoized_property
-    def _pending_mutations(self):
-        return {}
-
-    @util.memoized_property
-    def _empty_collections(self):
-        return {}
-
-    @util.memoized_property
+    @property
     def mapper(self):
         """Return the :class:`.Mapper` used for this mapped object."""
         return self.manager.mapper
@@ -348,7 +404,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
             state.session_id = None
 
             if to_transient and state.key:
-                del state.key
+                state.key = None
             if persistent:
                 if to_transient:
                     if persistent_to_transient is not None:
@@ -378,7 +434,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
 
     def _dispose(self):
         self._detach()
-        del self.obj
+        self.obj = _return_none
 
     def _cleanup(self, ref):
         """Weakref callback cleanup.
@@ -400,7 +456,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
         instance_dict = self._instance_dict()
         if instance_dict is not None:
             instance_dict._fast_discard(self)
-            del self._instance_dict
+            self._instance_dict = _return_none
 
             # we can't possibly be in instance_dict._modified
             # b.c. this is weakref cleanup only, that set
@@ -408,10 +464,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
             # assert self not in instance_dict._modified
 
         self.session_id = self._strong_obj = None
-        del self.obj
-
-    def obj(self):
-        return None
+        self.obj = _return_none
 
     @property
     def dict(self):
@@ -452,28 +505,34 @@ class InstanceState(interfaces.InspectionAttrInfo):
 
     def _get_pending_mutation(self, key):
         if key not in self._pending_mutations:
+            if not self._pending_mutations:
+                self._pending_mutations = {}
             self._pending_mutations[key] = PendingCollection()
         return self._pending_mutations[key]
 
     def __getstate__(self):
-        state_dict = {"instance": self.obj()}
+        state_dict = {
+            "instance": self.obj(),
+            "class_": self.class_,
+            "committed_state": self._committed_state,
+            "expired_attributes": self._expired_attributes,
+        }
         state_dict.update(
-            (k, self.__dict__[k])
+            (k, getattr(self, k))
             for k in (
-                "committed_state",
                 "_pending_mutations",
                 "modified",
                 "expired",
                 "callables",
                 "key",
-                "parents",
                 "load_options",
-                "class_",
-                "expired_attributes",
-                "info",
             )
-            if k in self.__dict__
+            if getattr(self, k)
         )
+        if self._parents:
+            state_dict["parents"] = self._parents
+        if "info" in self.__dict__:
+            state_dict["info"] = self.info
         if self.load_path:
             state_dict["load_path"] = self.load_path.serialize()
 
@@ -493,38 +552,45 @@ class InstanceState(interfaces.InspectionAttrInfo):
             self.obj = None
             self.class_ = state_dict["class_"]
 
-        self.committed_state = state_dict.get("committed_state", {})
-        self._pending_mutations = state_dict.get("_pending_mutations", {})
-        self.parents = state_dict.get("parents", {})
+        self._committed_state = (
+            state_dict.get("committed_state") or util.EMPTY_DICT
+        )
+        self._pending_mutations = (
+            state_dict.get("_pending_mutations") or util.EMPTY_DICT
+        )
+        self._parents = state_dict.get("parents") or util.EMPTY_DICT
         self.modified = state_dict.get("modified", False)
         self.expired = state_dict.get("expired", False)
+        self.session_id = self.runid = self.insert_order = None
+        self._strong_obj = self.identity_token = None
+        self._deleted = self._load_pending = False
+        self._orphaned_outside_of_session = False
+        self._last_known_values = ()
+        self._instance_dict = _return_none
+        self._empty_collections = util.EMPTY_DICT
+        self.callables = ()
         if "info" in state_dict:
             self.info.update(state_dict["info"])
         if "callables" in state_dict:
             self.callables = state_dict["callables"]
 
             try:
-                self.expired_attributes = state_dict["expired_attributes"]
+                self._expired_attributes = state_dict["expired_attributes"]
             except KeyError:
-                self.expired_attributes = set()
+                self._expired_attributes = set()
                 # 0.9 and earlier compat
                 for k in list(self.callables):
                     if self.callables[k] is self:
-                        self.expired_attributes.add(k)
+                        self._expired_attributes.add(k)
                         del self.callables[k]
         else:
-            if "expired_attributes" in state_dict:
-                self.expired_attributes = state_dict["expired_attributes"]
-            else:
-                self.expired_attributes = set()
+            self._expired_attributes = (
+                state_dict.get("expired_attributes") or util.EMPTY_SET
+            )
 
-        self.__dict__.update(
-            [
-                (k, state_dict[k])
-                for k in ("key", "load_options")
-                if k in state_dict
-            ]
-        )
+        self.key = state_dict.get("key")
+        self.load_options = state_dict.get("load_options", util.EMPTY_SET)
+        self.load_path = ()
         if self.key:
             try:
                 self.identity_token = self.key[2]
@@ -546,12 +612,13 @@ class InstanceState(interfaces.InspectionAttrInfo):
         old = dict_.pop(key, None)
         if old is not None and self.manager[key].impl.collection:
             self.manager[key].impl._invalidate_collection(old)
-        self.expired_attributes.discard(key)
+        if self._expired_attributes:
+            self._expired_attributes.discard(key)
         if self.callables:
             self.callables.pop(key, None)
 
     def _copy_callables(self, from_):
-        if "callables" in from_.__dict__:
+        if from_.callables:
             self.callables = dict(from_.callables)
 
     @classmethod
@@ -560,7 +627,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
         if impl.collection:
 
             def _set_callable(state, dict_, row):
-                if "callables" not in state.__dict__:
+                if not state.callables:
                     state.callables = {}
                 old = dict_.pop(key, None)
                 if old is not None:
@@ -570,7 +637,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
         else:
 
             def _set_callable(state, dict_, row):
-                if "callables" not in state.__dict__:
+                if not state.callables:
                     state.callables = {}
                 state.callables[key] = fn
 
@@ -581,16 +648,11 @@ class InstanceState(interfaces.InspectionAttrInfo):
 
         if self.modified:
             modified_set.discard(self)
-            self.committed_state.clear()
+            self._committed_state = util.EMPTY_DICT
             self.modified = False
 
         self._strong_obj = None
-
-        if "_pending_mutations" in self.__dict__:
-            del self.__dict__["_pending_mutations"]
-
-        if "parents" in self.__dict__:
-            del self.__dict__["parents"]
+        self._pending_mutations = self._parents = util.EMPTY_DICT
 
         self.expired_attributes.update(
             [
@@ -601,7 +663,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
         )
 
         if self.callables:
-            for k in self.expired_attributes.intersection(self.callables):
+            for k in self._expired_attributes.intersection(self.callables):
                 del self.callables[k]
 
         for k in self.manager._collection_impl_keys.intersection(dict_):
@@ -619,7 +681,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
         self.manager.dispatch.expire(self, None)
 
     def _expire_attributes(self, dict_, attribute_names, no_loader=False):
-        pending = self.__dict__.get("_pending_mutations", None)
+        pending = self._pending_mutations
 
         callables = self.callables
 
@@ -643,7 +705,8 @@ class InstanceState(interfaces.InspectionAttrInfo):
             ):
                 self._last_known_values[key] = old
 
-            self.committed_state.pop(key, None)
+            if self._committed_state:
+                self._committed_state.pop(key, None)
             if pending:
                 pending.pop(key, None)
 
@@ -659,7 +722,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
         if not passive & SQL_OK:
             return PASSIVE_NO_RESULT
 
-        toload = self.expired_attributes.intersection(self.unmodified)
+        toload = self._expired_attributes.intersection(self.unmodified)
 
         self.manager.deferred_scalar_loader(self, toload)
 
@@ -667,7 +730,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
         # instance state didn't have an identity,
         # the attributes still might be in the callables
         # dict.  ensure they are removed.
-        self.expired_attributes.clear()
+        self._expired_attributes = util.EMPTY_SET
 
         return ATTR_WAS_SET
 
@@ -675,7 +738,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
     def unmodified(self):
         """Return the set of keys which have no uncommitted changes"""
 
-        return set(self.manager).difference(self.committed_state)
+        return set(self.manager).difference(self._committed_state)
 
     def unmodified_intersection(self, keys):
         """Return self.unmodified.intersection(keys)."""
@@ -683,7 +746,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
         return (
             set(keys)
             .intersection(self.manager)
-            .difference(self.committed_state)
+            .difference(self._committed_state)
         )
 
     @property
@@ -696,7 +759,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
         """
         return (
             set(self.manager)
-            .difference(self.committed_state)
+            .difference(self._committed_state)
             .difference(self.dict)
         )
 
@@ -722,9 +785,6 @@ class InstanceState(interfaces.InspectionAttrInfo):
             if self.manager[attr].impl.accepts_scalar_loader
         )
 
-    def _instance_dict(self):
-        return None
-
     def _modified_event(
         self, dict_, attr, previous, collection=False, is_userland=False
     ):
@@ -736,7 +796,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
                     "Can't flag attribute '%s' modified; it's not present in "
                     "the object state" % attr.key
                 )
-            if attr.key not in self.committed_state or is_userland:
+            if attr.key not in self._committed_state or is_userland:
                 if collection:
                     if previous is NEVER_SET:
                         if attr.key in dict_:
@@ -782,14 +842,16 @@ class InstanceState(interfaces.InspectionAttrInfo):
         this step if a value was not populated in state.dict.
 
         """
-        for key in keys:
-            self.committed_state.pop(key, None)
+        if self._committed_state:
+            for key in keys:
+                self._committed_state.pop(key, None)
 
         self.expired = False
 
-        self.expired_attributes.difference_update(
-            set(keys).intersection(dict_)
-        )
+        if self._expired_attributes:
+            self._expired_attributes.difference_update(
+                set(keys).intersection(dict_)
+            )
 
         # the per-keys commit removes object-level callables,
         # while that of commit_all does not.  it's not clear
@@ -824,14 +886,10 @@ class InstanceState(interfaces.InspectionAttrInfo):
         """Mass / highly inlined version of commit_all()."""
 
         for state, dict_ in iter_:
-            state_dict = state.__dict__
+            state._committed_state = state._pending_mutations = util.EMPTY_DICT
 
-            state.committed_state.clear()
-
-            if "_pending_mutations" in state_dict:
-                del state_dict["_pending_mutations"]
-
-            state.expired_attributes.difference_update(dict_)
+            if state._expired_attributes:
+                state._expired_attributes.difference_update(dict_)
 
             if instance_dict and state.modified:
                 instance_dict._modified.discard(state)
@@ -840,6 +898,12 @@ class InstanceState(interfaces.InspectionAttrInfo):
             state._strong_obj = None
 
 
+def _return_none():
+    """Stands in for the weakref callables ``InstanceState.obj`` and
+    ``InstanceState._instance_dict`` when there's no referent."""
+    return None
+
+
 class AttributeState(object):
     """Provide an inspection interface corresponding
     to a particular attribute on a particular mapped object.
@@ -314,7 +314,10 @@ class DeferredColumnLoader(LoaderStrategy):
         # for the column; this is because in most cases we are
         # working just with the setup_query() directive which does
         # not support this, and the behavior here should be consistent.
-        if not self.is_class_level:
+        if context.readonly_entities:
+            # left unloaded on readonly objects
+            return
+        elif not self.is_class_level:
             set_deferred_for_local_state = (
                 self.parent_property._deferred_column_loader
             )
@@ -740,14 +743,15 @@ class LazyLoader(AbstractRelationshipLoader, util.MemoizedSlots):
             for pk in self.mapper.primary_key
         ]
 
-    @util.dependencies("sqlalchemy.ext.baked")
-    def _memoized_attr__bakery(self, baked):
+    @util.preload_module("sqlalchemy.ext.baked")
+    def _memoized_attr__bakery(self):
+        baked = util.preloaded.ext_baked
         return baked.bakery(size=50)
 
-    @util.dependencies("sqlalchemy.orm.strategy_options")
-    def _emit_lazyload(
-        self, strategy_options, session, state, primary_key_identity, passive
-    ):
+    @util.preload_module("sqlalchemy.orm.strategy_options")
+    def _emit_lazyload(self, session, state, primary_key_identity, passive):
+        strategy_options = util.preloaded.orm_strategy_options
+
         # emit lazy load now using BakedQuery, to cut way down on the overhead
         # of generating queries.
         # there are two big things we are trying to guard against here:
@@ -780,6 +784,7 @@ class LazyLoader(AbstractRelationshipLoader, util.MemoizedSlots):
 
         if not self.parent_property.bake_queries:
             q.spoil(full=True)
+            q.add_criteria(lambda q: q._with_compile_cache(False))
 
         if self.parent_property.secondary is not None:
             q.add_criteria(
@@ -808,13 +813,16 @@ class LazyLoader(AbstractRelationshipLoader, util.MemoizedSlots):
             if self._raise_on_sql:
                 self._invoke_raise_load(state, passive, "raise_on_sql")
 
-            return (
+            instance = (
                 q(session)
                 .with_post_criteria(lambda q: q._set_lazyload_from(state))
                 ._load_on_pk_identity(
                     session.query(self.mapper), primary_key_identity
                 )
             )
+            if instance is not None and session.entity_cache is not None:
+                session.entity_cache._put(session, instance)
+            return instance
 
         if self.parent_property.order_by:
             q.add_criteria(
@@ -888,7 +896,10 @@ class LazyLoader(AbstractRelationshipLoader, util.MemoizedSlots):
     ):
         key = self.key
 
-        if not self.is_class_level:
+        if context.readonly_entities:
+            # left unloaded on readonly objects
+            return
+        elif not self.is_class_level:
             # we are not the primary manager for this attribute
             # on this class - set up a
             # per-instance lazyloader, which will override the
@@ -934,6 +945,145 @@ class LoadLazyAttribute(object):
         return strategy._load_for_state(state, passive)
 
 
+@log.class_logger
+@properties.RelationshipProperty.strategy_for(lazy="batch")
+class BatchLazyLoader(LazyLoader):
+    """Provide loading behavior for a :class:`.RelationshipProperty`
+    with "lazy='batch'", that is loads when first accessed, for all
+    objects which were loaded in the same result as the target object.
+
+    """
+
+    __slots__ = ()
+
+    def create_row_processor(
+        self, context, path, loadopt, mapper, result, adapter, populators
+    ):
+        key = self.key
+
+        if context.readonly_entities:
+            # left unloaded on readonly objects
+            return
+
+        load_batch = LoadBatchAttribute(
+            key,
+            self,
+            (context.query._current_path or orm_util.PathRegistry.root)
+            + path,
+            context.query._with_options,
+        )
+        set_lazy_callable = InstanceState._instance_level_callable_processor(
+            mapper.class_manager, load_batch, key
+        )
+        batch_states = load_batch.states
+
+        def set_batch_callable(state, dict_, row):
+            set_lazy_callable(state, dict_, row)
+            batch_states.append(state)
+
+        populators["new"].append((key, set_batch_callable))
+
+    def _load_for_batch(self, state, passive, load_batch):
+        if (
+            load_batch.path is None
+            or not state.key
+            or not passive & attributes.SQL_OK
+            or passive & attributes.NO_AUTOFLUSH
+        ):
+            return self._load_for_state(state, passive)
+
+        session = _state_session(state)
+        if not session:
+            return self._load_for_state(state, passive)
+
+        if self.use_get:
+            # if the related object is already in the identity map,
+            # there's no SQL to be saved
+            value = self._load_for_state(state, passive ^ attributes.SQL_OK)
+            if value is not attributes.PASSIVE_NO_RESULT:
+                return value
+
+        key = self.key
+
+        # locate those objects from the same result which still have
+        # this attribute pending for batch load.  hold onto the objects
+        # themselves so that they aren't garbage collected in the interim.
+        siblings = []
+        for sibling in load_batch.states:
+            obj = sibling.obj()
+            if (
+                obj is not None
+                and sibling.session_id == state.session_id
+                and sibling.key is not None
+                and sibling.callables
+                and sibling.callables.get(key) is load_batch
+                and key not in sibling.committed_state
+            ):
+                siblings.append((obj, sibling))
+
+        if len(siblings) < 2:
+            return self._load_for_state(state, passive)
+
+        q = session.query(self.parent)
+        q._with_options = load_batch.options
+        context = query.QueryContext(q)
+
+        self.parent_property._get_strategy(
+            (("lazy", "selectin"),)
+        )._load_for_path(
+            context,
+            load_batch.path,
+            [(sibling, False) for obj, sibling in siblings],
+            None,
+            self.entity,
+        )
+
+        load_batch.states[:] = [
+            sibling
+            for obj, sibling in siblings
+            if sibling.callables and sibling.callables.get(key) is load_batch
+        ]
+
+        if key in state.dict:
+            return attributes.ATTR_WAS_SET
+        else:
+            return self._load_for_state(state, passive)
+
+
+class LoadBatchAttribute(LoadLazyAttribute):
+    """loader object used by BatchLazyLoader, which tracks the states
+    loaded in a single result.
+
+    The collection of states is not serialized; an unpickled object
+    falls back to loading its attribute individually.
+
+    """
+
+    def __init__(self, key, initiating_strategy, path, options):
+        super(LoadBatchAttribute, self).__init__(key, initiating_strategy)
+        self.path = path
+        self.options = options
+        self.states = []
+
+    def __getstate__(self):
+        return {"key": self.key, "strategy_key": self.strategy_key}
+
+    def __setstate__(self, state):
+        self.key = state["key"]
+        self.strategy_key = state["strategy_key"]
+        self.path = None
+        self.options = ()
+        self.states = []
+
+    def __call__(self, state, passive=attributes.PASSIVE_OFF):
+        key = self.key
+        instance_mapper = state.manager.mapper
+        prop = instance_mapper._props[key]
+        strategy = prop._strategies[self.strategy_key]
+
+        return strategy._load_for_batch(state, passive, self)
+
+
 @properties.RelationshipProperty.strategy_for(lazy="immediate")
 class ImmediateLoader(AbstractRelationshipLoader):
     __slots__ = ()
@@ -1273,6 +1423,8 @@ class SubqueryLoader(AbstractRelationshipLoader):
         q = q._conditional_options(*orig_query._with_options)
         if orig_query._populate_existing:
             q._populate_existing = orig_query._populate_existing
+        if orig_query._execution_options.get("readonly_entities", False):
+            q = q.execution_options(readonly_entities=True)
 
         return q
 
@@ -1376,10 +1528,26 @@ class SubqueryLoader(AbstractRelationshipLoader):
             if self.key not in dict_:
                 load_collection_from_subq(state, dict_, row)
 
+        collection_factory = self.parent.class_manager[
+            self.key
+        ].impl.collection_factory
+
+        def load_collection_from_subq_readonly(dict_, row, isnew):
+            if self.key not in dict_:
+                collection = collection_factory()
+                for item in collections.get(
+                    tuple([row[col] for col in local_cols]), ()
+                ):
+                    collection._sa_appender(item)
+                dict_[self.key] = collection
+
         populators["new"].append((self.key, load_collection_from_subq))
         populators["existing"].append(
             (self.key, load_collection_from_subq_existing_row)
         )
+        populators["readonly"].append(
+            (self.key, load_collection_from_subq_readonly)
+        )
 
         if context.invoke_all_eagers:
             populators["eager"].append((self.key, collections.loader))
@@ -1404,10 +1572,20 @@ class SubqueryLoader(AbstractRelationshipLoader):
             if self.key not in dict_:
                 load_scalar_from_subq(state, dict_, row)
 
+        def load_scalar_from_subq_readonly(dict_, row, isnew):
+            if self.key not in dict_:
+                collection = collections.get(
+                    tuple([row[col] for col in local_cols]), (None,)
+                )
+                dict_[self.key] = collection[0]
+
         populators["new"].append((self.key, load_scalar_from_subq))
         populators["existing"].append(
             (self.key, load_scalar_from_subq_existing_row)
         )
+        populators["readonly"].append(
+            (self.key, load_scalar_from_subq_readonly)
+        )
         if context.invoke_all_eagers:
             populators["eager"].append((self.key, collections.loader))
 
@@ -2012,12 +2190,33 @@ class JoinedLoader(AbstractRelationshipLoader):
         def load_collection_from_joined_exec(state, dict_, row):
             _instance(row)
 
+        collection_factory = self.parent.class_manager[
+            key
+        ].impl.collection_factory
+
+        def load_collection_from_joined_readonly(dict_, row, isnew):
+            # there's no state to key on; the instance dictionaries
+            # are kept alive by context.readonly_instances
+            if isnew or (id(dict_), key) not in context.attributes:
+                collection = dict_[key] = collection_factory()
+                result_list = context.attributes[
+                    (id(dict_), key)
+                ] = util.UniqueAppender(collection, "_sa_appender")
+            else:
+                result_list = context.attributes[(id(dict_), key)]
+            inst = _instance(row)
+            if inst is not None:
+                result_list.append(inst)
+
         populators["new"].append(
             (self.key, load_collection_from_joined_new_row)
         )
         populators["existing"].append(
             (self.key, load_collection_from_joined_existing_row)
         )
+        populators["readonly"].append(
+            (self.key, load_collection_from_joined_readonly)
+        )
         if context.invoke_all_eagers:
             populators["eager"].append(
                 (self.key, load_collection_from_joined_exec)
@@ -2051,10 +2250,18 @@ class JoinedLoader(AbstractRelationshipLoader):
         def load_scalar_from_joined_exec(state, dict_, row):
             _instance(row)
 
+        def load_scalar_from_joined_readonly(dict_, row, isnew):
+            existing = _instance(row)
+            if key not in dict_:
+                dict_[key] = existing
+
         populators["new"].append((self.key, load_scalar_from_joined_new_row))
         populators["existing"].append(
             (self.key, load_scalar_from_joined_existing_row)
         )
+        populators["readonly"].append(
+            (self.key, load_scalar_from_joined_readonly)
+        )
         if context.invoke_all_eagers:
             populators["eager"].append(
                 (self.key, load_scalar_from_joined_exec)
@@ -2172,13 +2379,34 @@ class SelectInLoader(AbstractRelationshipLoader, util.MemoizedSlots):
             (("lazy", "select"),)
         ).init_class_attribute(mapper)
 
-    @util.dependencies("sqlalchemy.ext.baked")
-    def _memoized_attr__bakery(self, baked):
+    @util.preload_module("sqlalchemy.ext.baked")
+    def _memoized_attr__bakery(self):
+        baked = util.preloaded.ext_baked
         return baked.bakery(size=50)
 
+    def setup_query(
+        self, context, query_entity, path, loadopt, adapter, **kwargs
+    ):
+        # objects without an InstanceState can't be located by the
+        # post-load IN query; load them with a subquery load instead
+        if context.readonly_entities:
+            self.parent_property._get_strategy(
+                (("lazy", "subquery"),)
+            ).setup_query(
+                context, query_entity, path, loadopt, adapter, **kwargs
+            )
+
     def create_row_processor(
         self, context, path, loadopt, mapper, result, adapter, populators
     ):
+        if context.readonly_entities:
+            self.parent_property._get_strategy(
+                (("lazy", "subquery"),)
+            ).create_row_processor(
+                context, path, loadopt, mapper, result, adapter, populators
+            )
+            return
+
         if not self.parent.class_manager[self.key].impl.supports_population:
             raise sa_exc.InvalidRequestError(
                 "'%s' does not support object "
@@ -2225,11 +2453,9 @@ class SelectInLoader(AbstractRelationshipLoader, util.MemoizedSlots):
             effective_entity,
         )
 
-    @util.dependencies("sqlalchemy.ext.baked")
     def _load_for_path(
-        self, baked, context, path, states, load_only, effective_entity
+        self, context, path, states, load_only, effective_entity
     ):
-
         if load_only and self.key not in load_only:
             return
 
@@ -1292,6 +1292,36 @@ def lazyload_all(*keys):
     return _UnboundLoad._from_keys(_UnboundLoad.lazyload, keys, True, {})
 
 
+@loader_option()
+def batchload(loadopt, attr):
+    """Indicate that the given attribute should be loaded using "batch"
+    lazy loading.
+
+    Batch lazy loading emits a SELECT when the attribute is first accessed
+    on any one object, which loads the attribute for all objects that were
+    loaded in the same result as that object, using an IN clause in the
+    same way as :func:`.selectinload`.
+
+    This function is part of the :class:`.Load` interface and supports
+    both method-chained and standalone operation.
+
+    .. versionadded:: 1.4
+
+    .. seealso::
+
+        :ref:`loading_toplevel`
+
+        :ref:`batch_lazy_loading`
+
+    """
+    return loadopt.set_relationship_strategy(attr, {"lazy": "batch"})
+
+
+@batchload._add_unbound_fn
+def batchload(*keys):
+    return _UnboundLoad._from_keys(_UnboundLoad.batchload, keys, False, {})
+
+
 @loader_option()
 def immediateload(loadopt, attr):
     """Indicate that the given attribute should be loaded using
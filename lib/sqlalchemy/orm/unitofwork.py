@@ -51,6 +51,30 @@ def track_cascade_events(descriptor, prop):
                 sess._save_or_update_state(item_state)
         return item
 
+    def bulk_append(state, items, initiator):
+        # process "save_update" cascade rules for a series of instances
+        # appended to the collection of another instance in one operation
+
+        sess = state.session
+        if not sess:
+            return
+
+        if sess._warn_on_events:
+            sess._flush_warning("collection append")
+
+        prop = state.manager.mapper._props[key]
+        if not prop._cascade.save_update or not (
+            prop.cascade_backrefs or key == initiator.key
+        ):
+            return
+
+        for item in items:
+            if item is None:
+                continue
+            item_state = attributes.instance_state(item)
+            if not sess._contains_state(item_state):
+                sess._save_or_update_state(item_state)
+
     def remove(state, item, initiator):
         if item is None:
             return
@@ -85,6 +109,33 @@ def track_cascade_events(descriptor, prop):
                     # item
                     item_state._orphaned_outside_of_session = True
 
+    def bulk_remove(state, items, initiator):
+        sess = state.session
+
+        if sess and sess._warn_on_events:
+            sess._flush_warning("collection remove")
+
+        prop = state.manager.mapper._props[key]
+        if not prop._cascade.delete_orphan:
+            return
+
+        for item in items:
+            if (
+                item is None
+                or item is attributes.NEVER_SET
+                or item is attributes.PASSIVE_NO_RESULT
+            ):
+                continue
+
+            # expunge pending orphans
+            item_state = attributes.instance_state(item)
+
+            if prop.mapper._is_orphan(item_state):
+                if sess and item_state in sess._new:
+                    sess.expunge(item)
+                else:
+                    item_state._orphaned_outside_of_session = True
+
     def set_(state, newvalue, oldvalue, initiator):
         # process "save_update" cascade rules for when an instance
         # is attached to another instance
@@ -122,8 +173,13 @@ def track_cascade_events(descriptor, prop):
                     sess.expunge(oldvalue)
         return newvalue
 
-    event.listen(descriptor, "append", append, raw=True, retval=True)
-    event.listen(descriptor, "remove", remove, raw=True, retval=True)
+    if prop.uselist:
+        # collections deliver their members as a single list per operation
+        event.listen(descriptor, "bulk_append", bulk_append, raw=True)
+        event.listen(descriptor, "bulk_remove", bulk_remove, raw=True)
+    else:
+        event.listen(descriptor, "append", append, raw=True, retval=True)
+        event.listen(descriptor, "remove", remove, raw=True, retval=True)
     event.listen(descriptor, "set", set_, raw=True, retval=True)
 
 
@@ -363,10 +419,18 @@ class UOWTransaction(object):
             if not ret:
                 break
 
-        # see if the graph of mapper dependencies has cycles.
-        self.cycles = cycles = topological.find_cycles(
-            self.dependencies, list(self.postsort_actions.values())
-        )
+        # see if the graph of mapper dependencies has cycles.  the result,
+        # as well as the sorted order of an acyclic graph, is memoized
+        # for the same mapper-level actions and dependencies.
+        plan = self._flush_plan()
+        if plan is not None:
+            self.cycles = cycles = set(
+                self.postsort_actions[key] for key in plan[0]
+            )
+        else:
+            self.cycles = cycles = topological.find_cycles(
+                self.dependencies, list(self.postsort_actions.values())
+            )
 
         if cycles:
             # if yes, break the per-mapper actions into
@@ -399,6 +463,47 @@ class UOWTransaction(object):
             [a for a in self.postsort_actions.values() if not a.disabled]
         ).difference(cycles)
 
+    def _flush_plan(self):
+        """Locate a memoized flush plan for the mapper-level actions and
+        dependencies of this flush, before cycles are broken up into
+        per-state actions.
+
+        Plans are memoized on each base mapper involved in the flush.
+
+        """
+        self._action_keys = keys = dict(
+            (rec, key) for key, rec in self.postsort_actions.items()
+        )
+        self._plan_key = (
+            frozenset(
+                (key, rec.disabled)
+                for key, rec in self.postsort_actions.items()
+            ),
+            frozenset(
+                (keys.get(parent), keys.get(child))
+                for parent, child in self.dependencies
+            ),
+        )
+        self._plan_caches = [
+            base_mapper._memo(("flush_plans",), _flush_plan_cache)
+            for base_mapper in set(m.base_mapper for m in self.mappers)
+        ]
+        if self._plan_caches:
+            return self._plan_caches[0].get(self._plan_key)
+        else:
+            return None
+
+    def _memoize_flush_plan(self, sorted_actions):
+        keys = self._action_keys
+        plan = (
+            frozenset(keys[rec] for rec in self.cycles),
+            [keys[rec] for rec in sorted_actions]
+            if sorted_actions is not None
+            else None,
+        )
+        for cache in self._plan_caches:
+            cache[self._plan_key] = plan
+
     def execute(self):
         postsort_actions = self._generate_actions()
 
@@ -409,8 +514,12 @@ class UOWTransaction(object):
         # print "\nsort:", list(sort)
         # print "\nCOUNT OF POSTSORT ACTIONS", len(postsort_actions)
 
+        plan = self._plan_caches[0].get(self._plan_key)
+
         # execute
         if self.cycles:
+            if plan is None:
+                self._memoize_flush_plan(None)
             for set_ in topological.sort_as_subsets(
                 self.dependencies, postsort_actions
             ):
@@ -418,7 +527,16 @@ class UOWTransaction(object):
                     n = set_.pop()
                     n.execute_aggregate(self, set_)
         else:
-            for rec in topological.sort(self.dependencies, postsort_actions):
+            if plan is None:
+                sorted_actions = list(
+                    topological.sort(self.dependencies, postsort_actions)
+                )
+                self._memoize_flush_plan(sorted_actions)
+            else:
+                sorted_actions = [
+                    self.postsort_actions[key] for key in plan[1]
+                ]
+            for rec in sorted_actions:
                 rec.execute(self)
 
     def finalize_flush_changes(self):
@@ -443,6 +561,10 @@ class UOWTransaction(object):
             self.session._register_persistent(other)
 
 
+def _flush_plan_cache():
+    return util.LRUCache(100)
+
+
 class IterateMappersMixin(object):
     def _mappers(self, uow):
         if self.fromparent:
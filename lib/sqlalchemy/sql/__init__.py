@@ -116,6 +116,7 @@ def __go(lcls):
     _prepare_annotations(ClauseList, Annotated)
 
     _sa_util.dependencies.resolve_all("sqlalchemy.sql")
+    _sa_util.preloaded.import_prefix("sqlalchemy.sql")
 
     from . import naming  # noqa
 
@@ -267,8 +267,9 @@ class DialectKWArgs(object):
         """A synonym for :attr:`.DialectKWArgs.dialect_kwargs`."""
         return self.dialect_kwargs
 
-    @util.dependencies("sqlalchemy.dialects")
-    def _kw_reg_for_dialect(dialects, dialect_name):
+    @util.preload_module("sqlalchemy.dialects")
+    def _kw_reg_for_dialect(dialect_name):
+        dialects = util.preloaded.dialects
         dialect_cls = dialects.registry.load(dialect_name)
         if dialect_cls.construct_arguments is None:
             return None
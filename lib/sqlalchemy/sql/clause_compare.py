@@ -200,8 +200,9 @@ class StructureComparatorStrategy(object):
     def compare_type_coerce(self, left, right, **kw):
         return left.type._compare_type_affinity(right.type)
 
-    @util.dependencies("sqlalchemy.sql.elements")
-    def compare_alias(self, elements, left, right, **kw):
+    @util.preload_module("sqlalchemy.sql.elements")
+    def compare_alias(self, left, right, **kw):
+        elements = util.preloaded.sql_elements
         return (
             left.name == right.name
             if not isinstance(left.name, elements._anonymous_label)
@@ -224,8 +225,9 @@ class StructureComparatorStrategy(object):
     def compare_over(self, left, right, **kw):
         return left.range_ == right.range_ and left.rows == right.rows
 
-    @util.dependencies("sqlalchemy.sql.elements")
-    def compare_label(self, elements, left, right, **kw):
+    @util.preload_module("sqlalchemy.sql.elements")
+    def compare_label(self, left, right, **kw):
+        elements = util.preloaded.sql_elements
         return left._type._compare_type_affinity(right._type) and (
             left.name == right.name
             if not isinstance(left.name, elements._anonymous_label)
@@ -703,9 +703,10 @@ class SQLCompiler(Compiled):
         compiled object, for those values that are present."""
         return self.construct_params(_check=False)
 
-    @util.dependencies("sqlalchemy.engine.result")
-    def _create_result_map(self, result):
+    @util.preload_module("sqlalchemy.engine.result")
+    def _create_result_map(self):
         """utility method used for unit tests only."""
+        result = util.preloaded.engine_result
         return result.ResultMetaData._create_result_map(self._result_columns)
 
     def default_from(self):
@@ -3670,8 +3671,9 @@ class IdentifierPreparer(object):
             ident = self.quote_identifier(ident)
         return ident
 
-    @util.dependencies("sqlalchemy.sql.naming")
-    def format_constraint(self, naming, constraint):
+    @util.preload_module("sqlalchemy.sql.naming")
+    def format_constraint(self, constraint):
+        naming = util.preloaded.sql_naming
         if isinstance(constraint.name, elements._defer_name):
             name = naming._constraint_name_for_table(
                 constraint, constraint.table
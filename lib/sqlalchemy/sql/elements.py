@@ -418,8 +418,8 @@ class ClauseElement(roles.SQLRole, Visitable):
 
         return self
 
-    @util.dependencies("sqlalchemy.engine.default")
-    def compile(self, default, bind=None, dialect=None, **kw):
+    @util.preload_module("sqlalchemy.engine.default")
+    def compile(self, bind=None, dialect=None, **kw):
         """Compile this SQL expression.
 
         The return value is a :class:`~.Compiled` object.
@@ -472,6 +472,7 @@ class ClauseElement(roles.SQLRole, Visitable):
             :ref:`faq_sql_expression_string`
 
         """
+        default = util.preloaded.engine_default
 
         if not dialect:
             if bind:
@@ -1627,8 +1628,8 @@ class TextClause(
             else:
                 new_params[key] = existing._with_value(value)
 
-    @util.dependencies("sqlalchemy.sql.selectable")
-    def columns(self, selectable, *cols, **types):
+    @util.preload_module("sqlalchemy.sql.selectable")
+    def columns(self, *cols, **types):
         r"""Turn this :class:`.TextClause` object into a
         :class:`.TextualSelect` object that serves the same role as a SELECT
         statement.
@@ -1733,6 +1734,7 @@ class TextClause(
          argument as it also indicates positional ordering.
 
         """
+        selectable = util.preloaded.sql_selectable
         positional_input_cols = [
             ColumnClause(col.key, types.pop(col.key))
             if col.key in types
@@ -3262,6 +3264,10 @@ class BinaryExpression(ColumnElement):
             BinaryExpression,
             self.left._cache_key(**kw),
             self.right._cache_key(**kw),
+            self.operator,
+            self.negate,
+            tuple(sorted(self.modifiers.items())),
+            self.type._cache_key,
         )
 
     def self_group(self, against=None):
@@ -4142,6 +4148,7 @@ class ColumnClause(roles.LabeledColumnExprRole, Immutable, ColumnElement):
         return (
             self.name,
             self.table.name if self.table is not None else None,
+            self.table.schema if self.table is not None else None,
             self.is_literal,
             self.type._cache_key,
         )
@@ -593,9 +593,9 @@ class Function(FunctionElement):
 
     def _cache_key(self, **kw):
         return (
-            (Function,) + tuple(self.packagenames)
-            if self.packagenames
-            else () + (self.name, self.clause_expr._cache_key(**kw))
+            (Function,)
+            + tuple(self.packagenames)
+            + (self.name, self.clause_expr._cache_key(**kw))
         )
 
 
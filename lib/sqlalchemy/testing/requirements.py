@@ -284,6 +284,16 @@ class SuiteRequirements(Requirements):
             "%(database)s %(does_support)s 'returning'",
         )
 
+    @property
+    def full_returning(self):
+        """target platform supports RETURNING for UPDATE and DELETE
+        statements which return multiple rows."""
+
+        return exclusions.only_if(
+            lambda config: config.db.dialect.full_returning,
+            "%(database)s %(does_support)s 'RETURNING of multiple rows'",
+        )
+
     @property
     def tuple_in(self):
         """Target platform supports the syntax
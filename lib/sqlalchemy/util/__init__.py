@@ -15,6 +15,7 @@ from ._collections import coerce_generator_arg  # noqa
 from ._collections import collections_abc  # noqa
 from ._collections import column_dict  # noqa
 from ._collections import column_set  # noqa
+from ._collections import EMPTY_DICT  # noqa
 from ._collections import EMPTY_SET  # noqa
 from ._collections import flatten_iterator  # noqa
 from ._collections import has_dupes  # noqa
@@ -137,6 +138,8 @@ from .langhelpers import NoneType  # noqa
 from .langhelpers import only_once  # noqa
 from .langhelpers import PluginLoader  # noqa
 from .langhelpers import portable_instancemethod  # noqa
+from .langhelpers import preload_module  # noqa
+from .langhelpers import preloaded  # noqa
 from .langhelpers import quoted_token_parser  # noqa
 from .langhelpers import safe_reraise  # noqa
 from .langhelpers import set_creation_order  # noqa
@@ -165,6 +165,9 @@ class immutabledict(ImmutableContainer, dict):
         return "immutabledict(%s)" % dict.__repr__(self)
 
 
+EMPTY_DICT = immutabledict()
+
+
 class Properties(object):
     """Provide a __getattr__/__setattr__ interface over a dict."""
 
@@ -98,7 +98,6 @@ def inspect_getfullargspec(func):
 if py3k:
     import base64
     import builtins
-    import configparser
     import itertools
     import pickle
 
@@ -168,7 +167,6 @@ if py3k:
 
 else:
     import base64
-    import ConfigParser as configparser  # noqa
     import itertools
 
     from StringIO import StringIO  # noqa
@@ -10,7 +10,6 @@ modules, classes, hierarchies, attributes, functions, and methods.
 
 """
 from functools import update_wrapper
-import hashlib
 import inspect
 import itertools
 import operator
@@ -26,6 +25,8 @@ from .. import exc
 
 
 def md5_hex(x):
+    import hashlib
+
     if compat.py3k:
         x = x.encode("utf-8")
     m = hashlib.md5()
@@ -1090,6 +1091,67 @@ class dependencies(object):
             return attr
 
 
+class _ModuleRegistry(object):
+    """Registry of modules to load in a package init file.
+
+    To avoid potential thread safety issues for imports that are deferred
+    in a function, like https://bugs.python.org/issue38884, these modules
+    are added to the system module cache by importing them after the
+    package has finished initialization.
+
+    A global instance is provided under the name :attr:`.preloaded`. Use
+    the function :func:`.preload_module` to register modules to load and
+    :meth:`.import_prefix` to load all the modules that start with the
+    given path.
+
+    While the modules are loaded in the global module cache, it's advisable
+    to access them using :attr:`.preloaded` to ensure that it was actually
+    registered. Each registered module is added to the instance ``__dict__``
+    in the form `<package>_<module>`, omitting ``sqlalchemy`` from the
+    package name. Example: ``sqlalchemy.sql.util`` becomes
+    ``preloaded.sql_util``.
+
+    Unlike :class:`.dependencies`, decorated functions are returned
+    unchanged; no wrapper function needs to be generated with ``exec``
+    at import time.
+
+    """
+
+    def __init__(self, prefix="sqlalchemy."):
+        self.module_registry = set()
+        self.prefix = prefix
+
+    def preload_module(self, *deps):
+        """Adds the specified modules to the list to load.
+
+        This method can be used both as a normal function and as a
+        decorator. No change is performed to the decorated object.
+
+        """
+        self.module_registry.update(deps)
+        return lambda fn: fn
+
+    def import_prefix(self, path):
+        """Resolve all the modules in the registry that start with the
+        specified path.
+
+        """
+        for module in self.module_registry:
+            if self.prefix and module.startswith(self.prefix):
+                key = module[len(self.prefix) :].replace(".", "_")
+            else:
+                key = module.replace(".", "_")
+            if (
+                not path or module.startswith(path)
+            ) and key not in self.__dict__:
+                compat.import_(module, globals(), locals())
+                self.__dict__[key] = sys.modules[module]
+
+
+preloaded = _ModuleRegistry()
+preload_module = preloaded.preload_module
+
+
 # from paste.deploy.converters
 def asbool(obj):
     if isinstance(obj, compat.string_types):
@@ -1640,6 +1702,10 @@ def inject_docstring_text(doctext, injecttext, pos):
     return "\n".join(lines)
 
 
+_param_reg = re.compile(r"(\s+):param (?:\\\*\*?)?(.+?):")
+_leading_space_reg = re.compile(r"(\s+)\S")
+
+
 def inject_param_text(doctext, inject_params):
     doclines = doctext.splitlines()
     lines = []
@@ -1648,7 +1714,7 @@ def inject_param_text(doctext, inject_params):
     while doclines:
         line = doclines.pop(0)
         if to_inject is None:
-            m = re.match(r"(\s+):param (?:\\\*\*?)?(.+?):", line)
+            m = _param_reg.match(line)
             if m:
                 param = m.group(2)
                 if param in inject_params:
@@ -1658,7 +1724,7 @@ def inject_param_text(doctext, inject_params):
                     # but if the next line has text, use that line's
                     # indentntation
                     if doclines:
-                        m2 = re.match(r"(\s+)\S", doclines[0])
+                        m2 = _leading_space_reg.match(doclines[0])
                         if m2:
                             indent = " " * len(m2.group(1))
 
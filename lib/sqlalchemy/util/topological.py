@@ -22,23 +22,53 @@ def sort_as_subsets(tuples, allitems, deterministic_order=False):
 
     Set = util.OrderedSet if deterministic_order else set
 
-    todo = Set(allitems)
-
-    while todo:
-        output = Set()
-        for node in todo:
-            if todo.isdisjoint(edges[node]):
-                output.add(node)
-
-        if not output:
-            raise CircularDependencyError(
-                "Circular dependency detected.",
-                find_cycles(tuples, allitems),
-                _gen_edges(edges),
-            )
-
-        todo.difference_update(output)
+    nodes = Set(allitems)
+
+    # count for each node the number of parents which are also
+    # to be sorted, and collect the reverse edges, so that each tier
+    # is derived from the previous one rather than by rescanning
+    # all remaining nodes
+    children = util.defaultdict(list)
+    in_degree = {}
+    for node in nodes:
+        count = 0
+        if node in edges:
+            for parent in edges[node]:
+                if parent in nodes:
+                    children[parent].append(node)
+                    count += 1
+        in_degree[node] = count
+
+    if deterministic_order:
+        position = dict((node, idx) for idx, node in enumerate(nodes))
+
+    output = Set(node for node in nodes if not in_degree[node])
+
+    remaining = len(nodes)
+    while output:
+        remaining -= len(output)
+
+        # determine the next tier before yielding, as the consumer
+        # may modify the set which is yielded
+        ready = []
+        for node in output:
+            for child in children.get(node, ()):
+                in_degree[child] -= 1
+                if not in_degree[child]:
+                    ready.append(child)
+
+        if deterministic_order:
+            ready.sort(key=position.__getitem__)
+
         yield output
+        output = Set(ready)
+
+    if remaining:
+        raise CircularDependencyError(
+            "Circular dependency detected.",
+            find_cycles(tuples, allitems),
+            _gen_edges(edges),
+        )
 
 
 def sort(tuples, allitems, deterministic_order=False):
@@ -14,6 +14,7 @@ from sqlalchemy import testing
 from sqlalchemy import Unicode
 from sqlalchemy import util
 from sqlalchemy.orm import aliased
+from sqlalchemy.orm import attributes
 from sqlalchemy.orm import clear_mappers
 from sqlalchemy.orm import create_session
 from sqlalchemy.orm import mapper
@@ -259,6 +260,51 @@ class MemUsageTest(EnsureZeroed):
 
         go()
 
+    @testing.requires.python3
+    def test_instance_state_size(self):
+        """test the per-object overhead of a persistent, unmodified
+        object, which is dominated by its InstanceState."""
+
+        import tracemalloc
+
+        class Foo(object):
+            pass
+
+        mapper(
+            Foo,
+            Table(
+                "foo",
+                MetaData(),
+                Column("id", Integer, primary_key=True),
+                Column("data", String(30)),
+            ),
+        )
+        manager = attributes.manager_of_class(Foo)
+
+        def load(num):
+            objs = []
+            for i in range(num):
+                obj = manager.new_instance()
+                state = attributes.instance_state(obj)
+                state.key = (Foo, (i,), None)
+                state.dict.update(id=i, data="data")
+                state._commit_all(state.dict)
+                objs.append(obj)
+            return objs
+
+        load(10)
+
+        tracemalloc.start()
+        try:
+            objs = load(1000)
+            per_object = tracemalloc.get_traced_memory()[0] / len(objs)
+        finally:
+            tracemalloc.stop()
+
+        # roughly 950 bytes on cpython 3 when InstanceState allocated
+        # its bookkeeping collections up front, around 700 otherwise
+        assert per_object < 800, per_object
+
 
 class MemUsageWBackendTest(EnsureZeroed):
 
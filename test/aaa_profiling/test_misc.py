@@ -1,4 +1,10 @@
+import os
+import subprocess
+import sys
+
+import sqlalchemy
 from sqlalchemy import Enum
+from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import profiling
 from sqlalchemy.util import classproperty
@@ -35,3 +41,53 @@ class EnumTest(fixtures.TestBase):
     @profiling.function_call_count()
     def test_create_enum_from_pep_435_w_expensive_members(self):
         Enum(self.SomeEnum)
+
+
+class ImportTest(fixtures.TestBase):
+    __requires__ = ("cpython", "python3")
+
+    _script = """
+import sys
+
+counts = [0]
+
+def profile(frame, event, arg):
+    if event == "c_call" and arg in (exec, eval):
+        if "sqlalchemy" in frame.f_code.co_filename:
+            counts[0] += 1
+
+sys.setprofile(profile)
+import sqlalchemy.orm
+import sqlalchemy.ext.declarative
+sys.setprofile(None)
+
+print(counts[0])
+print(" ".join(sorted(m for m in %r if m in sys.modules)))
+"""
+
+    def _run_import(self, deferred):
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.path.dirname(
+            os.path.dirname(sqlalchemy.__file__)
+        )
+        script = self._script % (deferred,)
+        output = subprocess.check_output(
+            [sys.executable, "-W", "ignore", "-c", script],
+            env=env,
+            universal_newlines=True,
+        )
+        count, loaded = output.split("\n")[0:2]
+        return int(count), loaded.split()
+
+    def test_import_exec_count(self):
+        # functions generated with exec() / eval() at import time, e.g.
+        # by util.decorator and util.public_factory; util.preload_module
+        # doesn't generate any.
+        count, loaded = self._run_import(())
+        assert count <= 200, count
+
+    def test_deferred_stdlib_imports(self):
+        count, loaded = self._run_import(
+            ("configparser", "ConfigParser", "hashlib", "json")
+        )
+        eq_(loaded, [])
@@ -206,6 +206,69 @@ class DependencySortTest(fixtures.TestBase):
         tuples = [(i, i + 1) for i in range(0, 1500, 2)]
         self.assert_sort(tuples)
 
+    def test_large_chain(self):
+        tuples = [(i, i + 1) for i in range(10000)]
+        eq_(list(topological.sort(tuples, range(10001))), list(range(10001)))
+
+    def test_sort_as_subsets(self):
+        tuples = [
+            ("a", "b"),
+            ("a", "c"),
+            ("b", "d"),
+            ("c", "d"),
+            ("x", "d"),
+            ("d", "e"),
+        ]
+        allitems = ["e", "d", "c", "b", "a", "x", "y"]
+        eq_(
+            list(topological.sort_as_subsets(tuples, allitems)),
+            [set(["a", "x", "y"]), set(["b", "c"]), set(["d"]), set(["e"])],
+        )
+
+    def test_sort_as_subsets_deterministic(self):
+        tuples = [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d"), ("x", "d")]
+        allitems = ["d", "c", "y", "b", "x", "a"]
+        eq_(
+            [
+                list(subset)
+                for subset in topological.sort_as_subsets(
+                    tuples, allitems, deterministic_order=True
+                )
+            ],
+            [["y", "x", "a"], ["c", "b"], ["d"]],
+        )
+
+    def test_sort_as_subsets_consumed(self):
+        # the unit of work pops items from each subset as it executes them
+        tuples = [("a", "b"), ("b", "c")]
+        result = []
+        for subset in topological.sort_as_subsets(tuples, ["c", "b", "a"]):
+            while subset:
+                result.append(subset.pop())
+        eq_(result, ["a", "b", "c"])
+
+    def test_sort_as_subsets_ignores_outside_items(self):
+        # dependencies on items which aren't being sorted are ignored
+        tuples = [("a", "b"), ("q", "a"), ("b", "r")]
+        eq_(
+            list(topological.sort_as_subsets(tuples, ["b", "a"])),
+            [set(["a"]), set(["b"])],
+        )
+
+    def test_sort_as_subsets_cycle_after_output(self):
+        tuples = [("a", "b"), ("b", "c"), ("c", "b"), ("c", "d")]
+        allitems = ["a", "b", "c", "d"]
+        gen = topological.sort_as_subsets(tuples, allitems)
+        eq_(next(gen), set(["a"]))
+        assert_raises(exc.CircularDependencyError, next, gen)
+
+    def test_self_referential_cycle(self):
+        assert_raises(
+            exc.CircularDependencyError,
+            list,
+            topological.sort([("a", "a")], ["a"]),
+        )
+
     def test_ticket_1380(self):
 
         # ticket:1380 regression: would raise a KeyError
@@ -1923,6 +1923,35 @@ class PublicFactoryTest(fixtures.TestBase):
         )
 
 
+class ModuleRegistryTest(fixtures.TestBase):
+    def test_preload_module(self):
+        registry = langhelpers._ModuleRegistry("sqlalchemy.")
+
+        @registry.preload_module("sqlalchemy.sql.util")
+        def go():
+            return registry.sql_util
+
+        @registry.preload_module("sqlalchemy.orm.util", "sqlalchemy.util")
+        def go2():
+            pass
+
+        is_(go.__name__, "go")
+        assert "sql_util" not in registry.__dict__
+
+        registry.import_prefix("sqlalchemy.sql")
+        is_(go(), sys.modules["sqlalchemy.sql.util"])
+        assert "orm_util" not in registry.__dict__
+
+        registry.import_prefix("sqlalchemy")
+        is_(registry.orm_util, sys.modules["sqlalchemy.orm.util"])
+        is_(registry.util, sys.modules["sqlalchemy.util"])
+
+    def test_global_registry(self):
+        from sqlalchemy.orm import strategies
+
+        is_(util.preloaded.orm_strategies, strategies)
+
+
 class ArgInspectionTest(fixtures.TestBase):
     def test_get_cls_kwargs(self):
         class A(object):
@@ -1,8 +1,10 @@
+import itertools
 import logging.handlers
 
 import sqlalchemy as tsa
 from sqlalchemy import select
 from sqlalchemy import util
+from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import engines
 from sqlalchemy.testing import eq_
@@ -198,6 +200,95 @@ class LogParamsTest(fixtures.TestBase):
         )
 
 
+class LogSamplingTest(fixtures.TestBase):
+    __only_on__ = "sqlite"
+    __requires__ = ("ad_hoc_engines",)
+
+    def setup(self):
+        self.buf = logging.handlers.BufferingHandler(100)
+        for log in [logging.getLogger("sqlalchemy.engine")]:
+            log.addHandler(self.buf)
+
+    def teardown(self):
+        for log in [logging.getLogger("sqlalchemy.engine")]:
+            log.removeHandler(self.buf)
+
+    def _engine(self, **kw):
+        kw.setdefault("echo", True)
+        eng = engines.testing_engine(options=kw)
+
+        # run first-connect initialization, then start counting fresh
+        eng.connect().close()
+        if eng._echo_sample is not None:
+            eng._echo_counter = itertools.count()
+        del self.buf.buffer[:]
+        return eng
+
+    def _statements(self):
+        return [
+            rec.message
+            for rec in self.buf.buffer
+            if rec.message.startswith("SELECT")
+        ]
+
+    def test_sample(self):
+        eng = self._engine(echo_sample=3)
+        for i in range(7):
+            eng.execute("SELECT %d" % i)
+
+        eq_(self._statements(), ["SELECT 0", "SELECT 3", "SELECT 6"])
+
+    def test_sample_option_engine(self):
+        eng = self._engine(echo_sample=2)
+        opt_eng = eng.execution_options(foo="bar")
+        eng.execute("SELECT 0")
+        opt_eng.execute("SELECT 1")
+        opt_eng.execute("SELECT 2")
+
+        eq_(self._statements(), ["SELECT 0", "SELECT 2"])
+
+    def test_sample_invalid(self):
+        assert_raises_message(
+            tsa.exc.ArgumentError,
+            "echo_sample must be a positive integer",
+            engines.testing_engine,
+            options={"echo": True, "echo_sample": 0},
+        )
+
+    def test_threshold_not_exceeded(self):
+        eng = self._engine(echo_threshold=1000)
+        eng.execute("SELECT 1")
+
+        eq_(self._statements(), [])
+
+    def test_threshold_exceeded(self):
+        eng = self._engine(echo_threshold=0)
+        eng.execute("SELECT ?", (5,))
+
+        eq_(self._statements(), ["SELECT ?"])
+        msg = self.buf.buffer[-1].message
+        eq_regex(msg, r"\(5,\) \[\d+\.\d{5}s elapsed\]")
+
+    def test_threshold_exceeded_error(self):
+        eng = self._engine(echo_threshold=0)
+        assert_raises(
+            tsa.exc.DBAPIError, eng.execute, "SELECT * FROM nonexistent"
+        )
+
+        eq_(self._statements(), ["SELECT * FROM nonexistent"])
+
+    def test_params_not_rendered_when_not_sampled(self):
+        eng = self._engine(echo_sample=2)
+
+        class Param(str):
+            def __repr__(self):
+                raise AssertionError("param was rendered")
+
+        eng.execute("SELECT ?", ("x",))
+        eng.execute("SELECT ?", (Param("y"),))
+        eq_(self._statements(), ["SELECT ?"])
+
+
 class PoolLoggingTest(fixtures.TestBase):
     def setup(self):
         self.existing_level = logging.getLogger("sqlalchemy.pool").level
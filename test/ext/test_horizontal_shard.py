@@ -4,6 +4,7 @@ import os
 from sqlalchemy import Column
 from sqlalchemy import DateTime
 from sqlalchemy import event
+from sqlalchemy import exc
 from sqlalchemy import Float
 from sqlalchemy import ForeignKey
 from sqlalchemy import inspect
@@ -14,6 +15,10 @@ from sqlalchemy import String
 from sqlalchemy import Table
 from sqlalchemy import testing
 from sqlalchemy import util
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.horizontal_shard import HashShardMap
+from sqlalchemy.ext.horizontal_shard import ListShardMap
+from sqlalchemy.ext.horizontal_shard import RangeShardMap
 from sqlalchemy.ext.horizontal_shard import ShardedSession
 from sqlalchemy.orm import clear_mappers
 from sqlalchemy.orm import create_session
@@ -25,6 +30,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import SingletonThreadPool
 from sqlalchemy.sql import operators
+from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import provision
@@ -407,6 +413,137 @@ class ShardTest(object):
         for t in temps:
             assert inspect(t).deleted is (t.temperature >= 80)
 
+    def test_order_by_merged(self):
+        sess = self._fixture_data()
+
+        eq_(
+            [
+                w.id
+                for w in sess.query(WeatherLocation).order_by(
+                    WeatherLocation.id
+                )
+            ],
+            [1, 2, 3, 4, 5, 6, 7],
+        )
+        eq_(
+            [
+                w.id
+                for w in sess.query(WeatherLocation).order_by(
+                    WeatherLocation.continent, WeatherLocation.id.desc()
+                )
+            ],
+            [1, 5, 4, 3, 2, 7, 6],
+        )
+
+    def test_order_by_limit_offset(self):
+        sess = self._fixture_data()
+
+        q = sess.query(WeatherLocation).order_by(WeatherLocation.id.desc())
+        eq_([w.id for w in q.limit(3)], [7, 6, 5])
+        eq_([w.id for w in q.limit(3).offset(2)], [5, 4, 3])
+        eq_([w.id for w in q.offset(5)], [2, 1])
+
+    def test_order_by_column_entities(self):
+        sess = self._fixture_data()
+
+        eq_(
+            sess.query(WeatherLocation.city)
+            .order_by(WeatherLocation.city)
+            .all(),
+            [
+                ("Brasila",),
+                ("Dublin",),
+                ("London",),
+                ("New York",),
+                ("Quito",),
+                ("Tokyo",),
+                ("Toronto",),
+            ],
+        )
+        eq_(
+            sess.query(
+                WeatherLocation.continent.label("c"), WeatherLocation.id
+            )
+            .order_by(sql.desc("c"), WeatherLocation.id)
+            .limit(4)
+            .all(),
+            [
+                ("South America", 6),
+                ("South America", 7),
+                ("North America", 2),
+                ("North America", 3),
+            ],
+        )
+        eq_(
+            sess.query(Report.temperature, WeatherLocation.city)
+            .join(Report.location)
+            .order_by(Report.temperature.nullslast())
+            .all(),
+            [(75.0, "New York"), (80.0, "Tokyo"), (85.0, "Quito")],
+        )
+
+    def test_order_by_merged_row_values(self):
+        sess = self._fixture_data()
+
+        dublin = (
+            sess.query(WeatherLocation)
+            .filter(WeatherLocation.continent == "Europe")
+            .filter(WeatherLocation.city == "Dublin")
+            .one()
+        )
+        dublin.city = "ZDublin"
+
+        with sess.no_autoflush:
+            eq_(
+                [
+                    w.city
+                    for w in sess.query(WeatherLocation).order_by(
+                        WeatherLocation.city
+                    )
+                ],
+                [
+                    "Brasila",
+                    "ZDublin",
+                    "London",
+                    "New York",
+                    "Quito",
+                    "Tokyo",
+                    "Toronto",
+                ],
+            )
+
+    def test_order_by_nulls(self):
+        sess = self._fixture_data()
+        london = (
+            sess.query(WeatherLocation)
+            .filter(WeatherLocation.continent == "Europe")
+            .filter(WeatherLocation.city == "London")
+            .one()
+        )
+        london.reports.append(Report(None))
+        sess.commit()
+
+        q = sess.query(Report.temperature)
+        eq_(
+            q.order_by(Report.temperature.nullsfirst()).all(),
+            [(None,), (75.0,), (80.0,), (85.0,)],
+        )
+        eq_(
+            q.order_by(Report.temperature.nullslast()).all(),
+            [(75.0,), (80.0,), (85.0,), (None,)],
+        )
+        eq_(
+            q.order_by(Report.temperature.desc().nullsfirst()).all(),
+            [(None,), (85.0,), (80.0,), (75.0,)],
+        )
+
+        # without NULLS FIRST / LAST, results are concatenated in
+        # shard order
+        eq_(
+            q.order_by(Report.temperature).all(),
+            [(75.0,), (80.0,), (None,), (85.0,)],
+        )
+
 
 class DistinctEngineShardTest(ShardTest, fixtures.TestBase):
     def _init_dbs(self):
@@ -436,6 +573,52 @@ class DistinctEngineShardTest(ShardTest, fixtures.TestBase):
             os.remove("shard%d_%s.db" % (i, provision.FOLLOWER_IDENT))
 
 
+class ExecutorShardTest(DistinctEngineShardTest):
+    """Query the shards concurrently using an executor."""
+
+    __requires__ = ("sqlite", "python3")
+
+    def _init_dbs(self):
+        self.dbs = [
+            testing_engine(
+                "sqlite:///shard%d_%s.db" % (i, provision.FOLLOWER_IDENT),
+                options=dict(
+                    connect_args={"check_same_thread": False},
+                    # the id generator for db1 relies upon sharing the
+                    # session's connection
+                    poolclass=SingletonThreadPool if i == 1 else None,
+                ),
+            )
+            for i in range(1, 5)
+        ]
+        return self.dbs
+
+    @classmethod
+    def setup_session(cls):
+        from concurrent.futures import ThreadPoolExecutor
+
+        class Executor(ThreadPoolExecutor):
+            submitted = 0
+
+            def submit(self, fn, *args, **kwargs):
+                self.submitted += 1
+                return super(Executor, self).submit(fn, *args, **kwargs)
+
+        super(ExecutorShardTest, cls).setup_session()
+        cls.executor = Executor(4)
+        create_session.configure(executor=cls.executor)
+
+    def teardown(self):
+        self.executor.shutdown()
+        super(ExecutorShardTest, self).teardown()
+
+    def test_executor_used(self):
+        sess = self._fixture_data()
+
+        eq_(len(sess.query(WeatherLocation).all()), 7)
+        eq_(self.executor.submitted, 4)
+
+
 class AttachedFileShardTest(ShardTest, fixtures.TestBase):
     """Use modern schema conventions along with SQLite ATTACH."""
 
@@ -505,6 +688,177 @@ class TableNameConventionShardTest(ShardTest, fixtures.TestBase):
         return db1, db2, db3, db4
 
 
+class ShardMapShardTest(DistinctEngineShardTest):
+    """Use a ShardMap in place of id_chooser and query_chooser."""
+
+    @classmethod
+    def setup_session(cls):
+        super(ShardMapShardTest, cls).setup_session()
+        create_session.configure(
+            id_chooser=None,
+            query_chooser=None,
+            shard_map=ListShardMap(
+                weather_locations.c.continent,
+                {
+                    "North America": "north_america",
+                    "Asia": "asia",
+                    "Europe": "europe",
+                    "South America": "south_america",
+                },
+            ),
+        )
+
+    def test_query_pruned(self):
+        sess = self._fixture_data()
+
+        q = sess.query(WeatherLocation).filter(
+            WeatherLocation.continent.in_(["Europe", "Asia"])
+        )
+        eq_(sess.query_chooser(q), ["asia", "europe"])
+        eq_(set(w.city for w in q), set(["Tokyo", "London", "Dublin"]))
+
+
+class ShardMapTest(fixtures.TestBase):
+    def _fixture(self, shard_map_cls, *arg, **kw):
+        Base = declarative_base()
+
+        class A(Base):
+            __tablename__ = "a"
+            id = Column(Integer, primary_key=True)
+            x = Column(Integer)
+
+        shard_map = shard_map_cls(A.__table__.c.x, *arg, **kw)
+        return A, shard_map, Session()
+
+    def test_list(self):
+        A, shard_map, sess = self._fixture(
+            ListShardMap, {1: "s1", 2: "s2", 3: "s2", 4: "s3"}
+        )
+
+        for criterion, shards in [
+            (A.x == 1, ["s1"]),
+            (A.x == 5, []),
+            (A.x.in_([1, 4]), ["s1", "s3"]),
+            (A.x != 1, ["s1", "s2", "s3"]),
+            (A.id == 1, ["s1", "s2", "s3"]),
+            (sql.or_(A.x == 2, A.x == 4), ["s2", "s3"]),
+            (sql.or_(A.x == 2, A.id == 4), ["s1", "s2", "s3"]),
+            (sql.and_(A.x == 2, A.id == 4), ["s2"]),
+            (sql.and_(A.x.in_([1, 2]), A.x.in_([2, 3])), ["s2"]),
+        ]:
+            eq_(
+                shard_map.query_chooser(sess.query(A).filter(criterion)),
+                shards,
+            )
+
+    def test_list_default(self):
+        A, shard_map, sess = self._fixture(
+            ListShardMap, {1: "s1"}, default="s2"
+        )
+        eq_(shard_map.shards_for_value(1), ["s1"])
+        eq_(shard_map.shards_for_value(5), ["s2"])
+        eq_(shard_map.shard_ids, ["s1", "s2"])
+
+    def test_list_falsy_default(self):
+        A, shard_map, sess = self._fixture(ListShardMap, {1: 1}, default=0)
+        eq_(shard_map.shards_for_value(5), [0])
+        eq_(shard_map.shard_ids, [1, 0])
+        eq_(shard_map.query_chooser(sess.query(A)), [1, 0])
+
+    def test_range(self):
+        A, shard_map, sess = self._fixture(
+            RangeShardMap, ["s1", "s2", "s3"], [10, 20]
+        )
+
+        for criterion, shards in [
+            (A.x == 5, ["s1"]),
+            (A.x == 10, ["s2"]),
+            (A.x < 10, ["s1"]),
+            (A.x <= 10, ["s1", "s2"]),
+            (A.x > 19, ["s2", "s3"]),
+            (A.x >= 20, ["s3"]),
+            (A.x.between(12, 25), ["s2", "s3"]),
+            (sql.and_(A.x > 5, A.x < 15), ["s1", "s2"]),
+            (sql.and_(A.x > 25, A.x < 15), []),
+            (sql.literal(15) < A.x, ["s2", "s3"]),
+            (A.x == sql.bindparam("p"), ["s2"]),
+        ]:
+            eq_(
+                shard_map.query_chooser(
+                    sess.query(A).filter(criterion).params(p=15)
+                ),
+                shards,
+            )
+
+    def test_range_boundaries(self):
+        assert_raises_message(
+            exc.ArgumentError,
+            "Expected 1 boundaries for 2 shard ids; got 2",
+            RangeShardMap,
+            Column("x", Integer),
+            ["s1", "s2"],
+            [1, 2],
+        )
+
+    def test_hash(self):
+        A, shard_map, sess = self._fixture(HashShardMap, ["s1", "s2", "s3"])
+
+        eq_(shard_map.shards_for_value(4), ["s2"])
+        eq_(shard_map.shards_for_value("x"), ["s1"])
+        eq_(
+            shard_map.query_chooser(sess.query(A).filter(A.x.in_([3, 4]))),
+            ["s1", "s2"],
+        )
+        eq_(
+            shard_map.query_chooser(sess.query(A).filter(A.x > 3)),
+            ["s1", "s2", "s3"],
+        )
+
+    def test_id_chooser(self):
+        Base = declarative_base()
+
+        class A(Base):
+            __tablename__ = "a"
+            id = Column(Integer, primary_key=True)
+            x = Column(Integer, primary_key=True)
+
+        shard_map = RangeShardMap(A.__table__.c.x, ["s1", "s2"], [10])
+        q = Session().query(A)
+        eq_(shard_map.id_chooser(q, (5, 15)), ["s2"])
+
+        shard_map = RangeShardMap(A.__table__.c.id, ["s1", "s2"], [10])
+        eq_(shard_map.id_chooser(q, (5, 15)), ["s1"])
+
+    def test_shard_chooser(self):
+        A, shard_map, sess = self._fixture(
+            RangeShardMap, ["s1", "s2"], [10]
+        )
+        eq_(shard_map.shard_chooser(inspect(A), A(x=12)), "s2")
+        eq_(
+            shard_map.shard_chooser(
+                inspect(A), None, clause=A.__table__.select().where(A.x == 3)
+            ),
+            "s1",
+        )
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "Could not determine a single shard for statement based on "
+            "column a.x",
+            shard_map.shard_chooser,
+            inspect(A),
+            None,
+            clause=A.__table__.select(),
+        )
+
+    def test_session_requires_choosers(self):
+        assert_raises_message(
+            exc.ArgumentError,
+            "shard_chooser, id_chooser and query_chooser are required",
+            ShardedSession,
+            query_chooser=lambda query: [],
+        )
+
+
 class SelectinloadRegressionTest(fixtures.DeclarativeMappedTest):
     """test #4175
     """
@@ -5,10 +5,17 @@ from sqlalchemy import event
 from sqlalchemy import ForeignKey
 from sqlalchemy import func
 from sqlalchemy import Integer
+from sqlalchemy import JSON
+from sqlalchemy import MetaData
 from sqlalchemy import String
+from sqlalchemy import testing
 from sqlalchemy import util
+from sqlalchemy.dialects import mysql
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.ext.mutable import MutableComposite
 from sqlalchemy.ext.mutable import MutableDict
+from sqlalchemy.ext.mutable import MutableJSON
 from sqlalchemy.ext.mutable import MutableList
 from sqlalchemy.ext.mutable import MutableSet
 from sqlalchemy.orm import attributes
@@ -20,9 +27,12 @@ from sqlalchemy.orm.instrumentation import ClassManager
 from sqlalchemy.orm.mapper import Mapper
 from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
+from sqlalchemy.testing import AssertsCompiledSQL
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
 from sqlalchemy.testing import mock
+from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
 from sqlalchemy.testing.util import picklers
@@ -918,6 +928,390 @@ class MutableWithScalarJSONTest(_MutableDictTestBase, fixtures.MappedTest):
         self._test_non_mutable()
 
 
+class MutableJSONTest(_MutableDictTestBase, fixtures.MappedTest):
+    __requires__ = ("json_type",)
+
+    @classmethod
+    def _type_fixture(cls):
+        return MutableJSON
+
+    @classmethod
+    def define_tables(cls, metadata):
+        MutableJSON = cls._type_fixture()
+
+        Table(
+            "foo",
+            metadata,
+            Column(
+                "id", Integer, primary_key=True, test_needs_autoincrement=True
+            ),
+            Column("data", MutableJSON.as_mutable(JSON)),
+            Column("non_mutable_data", JSON),
+            Column("unrelated_data", String(50)),
+        )
+
+    def _fixture(self, data):
+        sess = Session()
+        f1 = Foo(data=data)
+        sess.add(f1)
+        sess.commit()
+        return sess, f1
+
+    def _assert_persisted(self, sess, f1, data):
+        eq_(f1.data, data)
+        eq_(sess.query(Foo.data).filter(Foo.id == f1.id).scalar(), data)
+
+    def test_non_mutable(self):
+        self._test_non_mutable()
+
+    def test_nested_dict_mutation(self):
+        sess, f1 = self._fixture({"a": {"b": {"c": 1}, "d": 2}, "e": 3})
+
+        f1.data["a"]["b"]["c"] = 5
+        assert f1 in sess.dirty
+        f1.data["a"]["f"] = {"g": [1, 2]}
+        del f1.data["a"]["d"]
+        sess.commit()
+
+        self._assert_persisted(
+            sess, f1, {"a": {"b": {"c": 5}, "f": {"g": [1, 2]}}, "e": 3}
+        )
+
+    def test_nested_list_mutation(self):
+        sess, f1 = self._fixture({"a": [1, {"b": 2}, [3]]})
+
+        f1.data["a"][1]["b"] = 5
+        f1.data["a"][2].append(4)
+        sess.commit()
+        self._assert_persisted(sess, f1, {"a": [1, {"b": 5}, [3, 4]]})
+
+        f1.data["a"].insert(0, 0)
+        f1.data["a"][2]["c"] = 6
+        f1.data["a"][-1][0] = 7
+        sess.commit()
+        self._assert_persisted(
+            sess, f1, {"a": [0, 1, {"b": 5, "c": 6}, [7, 4]]}
+        )
+
+        f1.data["a"].pop(0)
+        f1.data["a"][1].clear()
+        sess.commit()
+        self._assert_persisted(sess, f1, {"a": [1, {}, [7, 4]]})
+
+    def test_nested_none(self):
+        sess, f1 = self._fixture({"a": {"b": 1}})
+
+        f1.data["a"]["b"] = None
+        f1.data["c"] = None
+        sess.commit()
+        self._assert_persisted(sess, f1, {"a": {"b": None}, "c": None})
+
+    def test_nested_unsafe_keys(self):
+        sess, f1 = self._fixture({"a": {"b c": 1, 'd"': 2}})
+
+        f1.data["a"]["b c"] = 3
+        f1.data["a"]['d"'] = 4
+        f1.data["a"]["null"] = 5
+        sess.commit()
+        self._assert_persisted(
+            sess, f1, {"a": {"b c": 3, 'd"': 4, "null": 5}}
+        )
+
+    def test_nested_mutation_after_replace(self):
+        sess, f1 = self._fixture({"a": {"b": 1}})
+
+        f1.data = {"a": {"b": 2}}
+        f1.data["a"]["c"] = 3
+        sess.commit()
+        self._assert_persisted(sess, f1, {"a": {"b": 2, "c": 3}})
+
+        f1.data["a"]["c"] = 4
+        sess.commit()
+        self._assert_persisted(sess, f1, {"a": {"b": 2, "c": 4}})
+
+    def test_nested_mutation_after_flush(self):
+        sess, f1 = self._fixture({"a": {"b": 1}})
+
+        f1.data["a"]["b"] = 2
+        sess.flush()
+        f1.data["a"]["c"] = 3
+        sess.flush()
+        eq_(f1.data._json_changes, set())
+        sess.commit()
+        self._assert_persisted(sess, f1, {"a": {"b": 2, "c": 3}})
+
+    def test_nested_values_copied(self):
+        sess, f1 = self._fixture({"a": {"b": 1}})
+
+        f1.data["c"] = f1.data["a"]
+        f1.data["c"]["b"] = 2
+        sess.commit()
+        self._assert_persisted(sess, f1, {"a": {"b": 1}, "c": {"b": 2}})
+
+    def test_removed_container_not_tracked(self):
+        sess, f1 = self._fixture({"a": {"b": 1}, "c": [{"d": 2}]})
+
+        a = f1.data.pop("a")
+        c0 = f1.data["c"][0]
+        f1.data["c"][0] = {"d": 3}
+        sess.commit()
+
+        f1.data
+        a["b"] = 2
+        c0["d"] = 4
+        assert f1 not in sess.dirty
+        eq_(f1.data._json_changes, set())
+
+    def test_no_refresh_after_update(self):
+        sess, f1 = self._fixture({"a": {"b": 1}})
+
+        f1.data["a"]["b"] = 2
+        sess.flush()
+        assert "data" in f1.__dict__
+        eq_(f1.data, {"a": {"b": 2}})
+
+    def test_pickle_nested(self):
+        sess, f1 = self._fixture({"a": {"b": [1, {"c": 2}]}})
+
+        for loads, dumps in picklers():
+            data = loads(dumps(f1.data))
+            assert isinstance(data, MutableJSON)
+            eq_(data, {"a": {"b": [1, {"c": 2}]}})
+            data["a"]["b"][1]["c"] = 3
+            eq_(data._json_changes, {("a", "b", 1, "c")})
+
+    def test_deepcopy_nested(self):
+        sess, f1 = self._fixture({"a": {"b": [1, {"c": 2}]}})
+
+        data = copy.deepcopy(f1.data)
+        data["a"]["b"][1]["c"] = 3
+        eq_(f1.data, {"a": {"b": [1, {"c": 2}]}})
+        assert f1 not in sess.dirty
+
+
+class MutableJSONPartialUpdateTest(
+    _MutableDictTestFixture, fixtures.MappedTest
+):
+    __only_on__ = "sqlite"
+    __requires__ = ("json_type",)
+    run_define_tables = "each"
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "foo",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", MutableJSON.as_mutable(JSON)),
+        )
+
+    @classmethod
+    def setup_mappers(cls):
+        mapper(Foo, cls.tables.foo)
+
+    def _fixture(self, data):
+        sess = Session()
+        f1 = Foo(id=1, data=data)
+        sess.add(f1)
+        sess.commit()
+        f1.data
+        return sess, f1
+
+    def test_set_and_remove(self):
+        sess, f1 = self._fixture({"a": {"b": 1, "c": 2}, "d": [1, 2]})
+
+        f1.data["a"]["b"] = 5
+        del f1.data["a"]["c"]
+        f1.data["d"].append(3)
+
+        with self.sql_execution_asserter(testing.db) as asserter:
+            sess.flush()
+        asserter.assert_(
+            CompiledSQL(
+                "UPDATE foo SET data=JSON_SET("
+                "JSON_REMOVE(foo.data, :param_1), "
+                ":param_2, JSON(:param_3), :param_4, JSON(:param_5)) "
+                "WHERE foo.id = :foo_id",
+                [
+                    {
+                        "param_1": ("a", "c"),
+                        "param_2": ("d",),
+                        "param_3": [1, 2, 3],
+                        "param_4": ("a", "b"),
+                        "param_5": 5,
+                        "foo_id": 1,
+                    }
+                ],
+            )
+        )
+        eq_(f1.data, {"a": {"b": 5}, "d": [1, 2, 3]})
+
+    def test_changes_within_changed_element(self):
+        sess, f1 = self._fixture({"a": {"b": {"c": 1}}})
+
+        f1.data["a"]["b"]["c"] = 2
+        f1.data["a"]["b"] = {"c": 3}
+        f1.data["a"]["b"]["d"] = 4
+
+        with self.sql_execution_asserter(testing.db) as asserter:
+            sess.flush()
+        asserter.assert_(
+            CompiledSQL(
+                "UPDATE foo SET data=JSON_SET(foo.data, :param_1, "
+                "JSON(:param_2)) WHERE foo.id = :foo_id",
+                [
+                    {
+                        "param_1": ("a", "b"),
+                        "param_2": {"c": 3, "d": 4},
+                        "foo_id": 1,
+                    }
+                ],
+            )
+        )
+
+    def test_whole_value(self):
+        sess, f1 = self._fixture({"a": 1})
+
+        f1.data.clear()
+        f1.data["b"] = 2
+
+        with self.sql_execution_asserter(testing.db) as asserter:
+            sess.flush()
+        asserter.assert_(
+            CompiledSQL(
+                "UPDATE foo SET data=:data WHERE foo.id = :foo_id",
+                [{"data": {"b": 2}, "foo_id": 1}],
+            )
+        )
+
+    def test_replace(self):
+        sess, f1 = self._fixture({"a": 1})
+
+        f1.data = {"a": 2}
+        f1.data["b"] = 3
+
+        with self.sql_execution_asserter(testing.db) as asserter:
+            sess.flush()
+        asserter.assert_(
+            CompiledSQL(
+                "UPDATE foo SET data=:data WHERE foo.id = :foo_id",
+                [{"data": {"a": 2, "b": 3}, "foo_id": 1}],
+            )
+        )
+
+    def test_flag_modified(self):
+        sess, f1 = self._fixture({"a": 1})
+
+        attributes.flag_modified(f1, "data")
+
+        with self.sql_execution_asserter(testing.db) as asserter:
+            sess.flush()
+        asserter.assert_(
+            CompiledSQL(
+                "UPDATE foo SET data=:data WHERE foo.id = :foo_id",
+                [{"data": {"a": 1}, "foo_id": 1}],
+            )
+        )
+
+
+class MutableJSONExpressionTest(AssertsCompiledSQL, fixtures.TestBase):
+    def _fixture(self, type_):
+        return Table("foo", MetaData(), Column("data", type_)).c.data
+
+    def test_postgresql_jsonb(self):
+        data = MutableJSON({"a": {"b": 1, "c": 2}, "d": [1]})
+        data["a"]["b"] = 5
+        del data["a"]["c"]
+        data["d"].append(2)
+
+        self.assert_compile(
+            data._json_update_expression(
+                self._fixture(postgresql.JSONB), postgresql.dialect()
+            ),
+            "jsonb_set(jsonb_set(foo.data #- %(param_1)s, %(param_2)s, "
+            "CAST(%(param_3)s AS JSONB)), %(param_4)s, "
+            "CAST(%(param_5)s AS JSONB))",
+            checkparams={
+                "param_1": ("a", "c"),
+                "param_2": ("d",),
+                "param_3": [1, 2],
+                "param_4": ("a", "b"),
+                "param_5": 5,
+            },
+            dialect=postgresql.dialect(),
+        )
+
+    def test_postgresql_json(self):
+        data = MutableJSON({"a": 1})
+        data["a"] = 2
+
+        is_(
+            data._json_update_expression(
+                self._fixture(postgresql.JSON), postgresql.dialect()
+            ),
+            None,
+        )
+
+    def test_mysql(self):
+        data = MutableJSON({"a": {"b": 1, "c": 2}, "d": [1]})
+        data["a"]["b"] = 5
+        del data["a"]["c"]
+
+        self.assert_compile(
+            data._json_update_expression(
+                self._fixture(JSON), mysql.dialect()
+            ),
+            "JSON_SET(JSON_REMOVE(foo.data, %s), %s, JSON_EXTRACT(%s, %s))",
+            checkpositional=(("a", "c"), ("a", "b"), 5, "$"),
+            dialect=mysql.dialect(),
+        )
+
+    def test_non_json_type(self):
+        data = MutableJSON({"a": 1})
+        data["a"] = 2
+
+        is_(
+            data._json_update_expression(
+                self._fixture(String), sqlite.dialect()
+            ),
+            None,
+        )
+
+    def test_no_changes(self):
+        data = MutableJSON({"a": 1})
+
+        is_(
+            data._json_update_expression(
+                self._fixture(JSON), sqlite.dialect()
+            ),
+            None,
+        )
+
+    def test_paths(self):
+        data = MutableJSON({"a": {"b": [1, {"c": 2}]}})
+        data["a"]["b"][1]["c"] = 3
+        data["a"]["b"][-2] = 0
+        data["a"]["d e"] = 4
+        data["f"] = {}
+        data["f"]["g"] = 5
+        data["a"]["b"].reverse()
+
+        eq_(
+            data._json_changes,
+            {
+                ("a", "b", 1, "c"),
+                ("a", "b", 0),
+                ("a",),
+                ("f",),
+                ("f", "g"),
+                ("a", "b"),
+            },
+        )
+
+        data[5] = 6
+        eq_(data._json_changes, None)
+
+
 class MutableColumnCopyJSONTest(_MutableDictTestBase, fixtures.MappedTest):
     @classmethod
     def define_tables(cls, metadata):
@@ -165,6 +165,26 @@ class _PolymorphicTestBase(object):
             Boss(name="pointy haired boss", golf_swing="fore"),
         )
 
+    def test_get_many(self):
+        sess = create_session()
+        eq_(
+            sess.query(Person).get_many(
+                [b1.person_id, e1.person_id, m1.person_id]
+            ),
+            [
+                Boss(name="pointy haired boss", golf_swing="fore"),
+                Engineer(name="dilbert", primary_language="java"),
+                Manager(name="dogbert", manager_name="dogbert"),
+            ],
+        )
+
+    def test_get_many_subclass(self):
+        sess = create_session()
+        eq_(
+            sess.query(Manager).get_many([b1.person_id, e1.person_id]),
+            [Boss(name="pointy haired boss", golf_swing="fore"), None],
+        )
+
     def test_multi_join(self):
         sess = create_session()
         e = aliased(Person)
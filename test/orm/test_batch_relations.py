@@ -0,0 +1,253 @@
+import pickle
+
+from sqlalchemy import testing
+from sqlalchemy.orm import attributes
+from sqlalchemy.orm import batchload
+from sqlalchemy.orm import create_session
+from sqlalchemy.orm import mapper
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import strategies
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import mock
+from sqlalchemy.testing.assertsql import CompiledSQL
+from test.orm import _fixtures
+
+
+class BatchLoadTest(_fixtures.FixtureTest, testing.AssertsExecutionResults):
+    run_inserts = "once"
+    run_deletes = None
+
+    def _o2m_fixture(self, lazy="batch"):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+
+        mapper(
+            User,
+            users,
+            properties={
+                "addresses": relationship(
+                    mapper(Address, addresses), lazy=lazy, order_by=Address.id
+                )
+            },
+        )
+        return User, Address
+
+    def _m2o_fixture(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+
+        mapper(
+            Address,
+            addresses,
+            properties={"user": relationship(User, lazy="batch")},
+        )
+        mapper(User, users)
+        return User, Address
+
+    def test_o2m(self):
+        User, Address = self._o2m_fixture()
+
+        sess = create_session()
+        users = sess.query(User).order_by(User.id).all()
+
+        def go():
+            eq_(users, self.static.user_address_result)
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_o2m_sql(self):
+        User, Address = self._o2m_fixture()
+
+        sess = create_session()
+        users = sess.query(User).order_by(User.id).all()
+
+        self.assert_sql_execution(
+            testing.db,
+            lambda: users[1].addresses,
+            CompiledSQL(
+                "SELECT addresses.user_id AS addresses_user_id, "
+                "addresses.id AS addresses_id, "
+                "addresses.email_address AS addresses_email_address "
+                "FROM addresses WHERE addresses.user_id IN "
+                "([EXPANDING_primary_keys]) "
+                "ORDER BY addresses.user_id, addresses.id",
+                [{"primary_keys": [7, 8, 9, 10]}],
+            ),
+        )
+
+    def test_m2o(self):
+        User, Address = self._m2o_fixture()
+
+        sess = create_session()
+        addresses = sess.query(Address).order_by(Address.id).all()
+
+        def go():
+            eq_(
+                [a.user.id for a in addresses],
+                [7, 8, 8, 8, 9],
+            )
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_m2o_identity_map(self):
+        User, Address = self._m2o_fixture()
+
+        sess = create_session()
+        u8 = sess.query(User).get(8)
+        addresses = sess.query(Address).order_by(Address.id).all()
+
+        # the related object is present in the identity map; no SQL
+        # is emitted and the siblings remain unloaded
+        def go():
+            eq_(addresses[1].user, u8)
+
+        self.assert_sql_count(testing.db, go, 0)
+        assert "user" not in addresses[0].__dict__
+
+        def go():
+            eq_(addresses[0].user.id, 7)
+            eq_(addresses[4].user.id, 9)
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_m2m(self):
+        Order, Item = self.classes.Order, self.classes.Item
+        orders, items, order_items = (
+            self.tables.orders,
+            self.tables.items,
+            self.tables.order_items,
+        )
+
+        mapper(Item, items)
+        mapper(
+            Order,
+            orders,
+            properties={
+                "items": relationship(
+                    Item,
+                    secondary=order_items,
+                    lazy="batch",
+                    order_by=items.c.id,
+                )
+            },
+        )
+
+        sess = create_session()
+        result = sess.query(Order).order_by(Order.id).all()
+
+        def go():
+            eq_(
+                [[item.id for item in o.items] for o in result],
+                [[1, 2, 3], [1, 2, 3], [3, 4, 5], [1, 5], [5]],
+            )
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_option(self):
+        User, Address = self._o2m_fixture(lazy="select")
+
+        sess = create_session()
+        users = (
+            sess.query(User)
+            .options(batchload(User.addresses))
+            .order_by(User.id)
+            .all()
+        )
+
+        def go():
+            eq_(users, self.static.user_address_result)
+
+        self.assert_sql_count(testing.db, go, 1)
+
+        # a query without the option lazy loads as usual
+        sess.expunge_all()
+        users = sess.query(User).order_by(User.id).all()
+
+        def go():
+            eq_(users, self.static.user_address_result)
+
+        self.assert_sql_count(testing.db, go, 4)
+
+    def test_separate_results_not_batched(self):
+        User, Address = self._o2m_fixture()
+
+        sess = create_session()
+        u7 = sess.query(User).filter(User.id == 7).one()
+        u8 = sess.query(User).filter(User.id == 8).one()
+
+        def go():
+            eq_(len(u7.addresses), 1)
+            eq_(len(u8.addresses), 3)
+
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_chunking(self):
+        User, Address = self._o2m_fixture()
+
+        sess = create_session()
+        users = sess.query(User).order_by(User.id).all()
+
+        with mock.patch.object(strategies.SelectInLoader, "_chunksize", 3):
+
+            def go():
+                eq_(users, self.static.user_address_result)
+
+            self.assert_sql_count(testing.db, go, 2)
+
+    def test_expired_sibling_loads_individually(self):
+        User, Address = self._o2m_fixture()
+
+        sess = Session(autoflush=False)
+        users = sess.query(User).order_by(User.id).all()
+
+        eq_(len(users[0].addresses), 1)
+        sess.expire(users[1], ["addresses"])
+
+        def go():
+            eq_(len(users[1].addresses), 3)
+
+        self.assert_sql_count(testing.db, go, 1)
+
+        def go():
+            eq_(len(users[2].addresses), 1)
+            eq_(len(users[3].addresses), 0)
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_garbage_collected_sibling(self):
+        User, Address = self._o2m_fixture()
+
+        sess = create_session()
+        users = sess.query(User).order_by(User.id).all()
+        del users[1:3]
+
+        def go():
+            eq_(len(users[0].addresses), 1)
+            eq_(len(users[1].addresses), 0)
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_pickled_loader(self):
+        User, Address = self._o2m_fixture()
+
+        sess = create_session()
+        users = sess.query(User).order_by(User.id).all()
+
+        state = attributes.instance_state(users[1])
+        loader = pickle.loads(pickle.dumps(state.callables["addresses"]))
+        eq_(loader.states, [])
+
+        # without its sibling states, the loader loads individually
+        def go():
+            eq_(len(loader(state)), 3)
+
+        self.assert_sql_count(testing.db, go, 1)
@@ -12,6 +12,7 @@ from sqlalchemy.orm import create_session
 from sqlalchemy.orm import instrumentation
 from sqlalchemy.orm import mapper
 from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session
 import sqlalchemy.orm.collections as collections
 from sqlalchemy.orm.collections import collection
 from sqlalchemy.testing import assert_raises
@@ -21,8 +22,11 @@ from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_false
 from sqlalchemy.testing import is_true
 from sqlalchemy.testing import ne_
+from sqlalchemy.testing.mock import call
+from sqlalchemy.testing.mock import Mock
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
+from test.orm import _fixtures
 
 
 class Canary(object):
@@ -2414,6 +2418,280 @@ class CustomCollectionsTest(fixtures.MappedTest):
         assert len(o) == 3
 
 
+class BulkEventsTest(fixtures.ORMTest):
+    def _fixture(self, typecallable=None):
+        class Foo(object):
+            pass
+
+        class Bar(object):
+            pass
+
+        instrumentation.register_class(Foo)
+        instrumentation.register_class(Bar)
+        attributes.register_attribute(
+            Foo,
+            "attr",
+            uselist=True,
+            useobject=True,
+            typecallable=typecallable,
+        )
+
+        canary = Mock()
+        event.listen(Foo.attr, "append", canary.append)
+        event.listen(Foo.attr, "remove", canary.remove)
+        event.listen(Foo.attr, "bulk_append", canary.bulk_append)
+        event.listen(Foo.attr, "bulk_remove", canary.bulk_remove)
+        return Foo, Bar, canary
+
+    def test_append_single(self):
+        Foo, Bar, canary = self._fixture()
+
+        f1 = Foo()
+        b1 = Bar()
+        f1.attr.append(b1)
+        f1.attr.remove(b1)
+
+        append_token = Foo.attr.impl._append_token
+        remove_token = Foo.attr.impl._remove_token
+        eq_(
+            canary.mock_calls,
+            [
+                call.append(f1, b1, append_token),
+                call.bulk_append(f1, [b1], append_token),
+                call.remove(f1, b1, remove_token),
+                call.bulk_remove(f1, [b1], remove_token),
+            ],
+        )
+
+    def test_list_extend(self):
+        Foo, Bar, canary = self._fixture()
+
+        f1 = Foo()
+        b1, b2, b3 = Bar(), Bar(), Bar()
+        f1.attr.extend([b1, b2])
+        f1.attr += [b3]
+        eq_(f1.attr, [b1, b2, b3])
+
+        token = Foo.attr.impl._append_token
+        eq_(
+            canary.mock_calls,
+            [
+                call.append(f1, b1, token),
+                call.append(f1, b2, token),
+                call.bulk_append(f1, [b1, b2], token),
+                call.append(f1, b3, token),
+                call.bulk_append(f1, [b3], token),
+            ],
+        )
+
+    def test_list_extend_history(self):
+        Foo, Bar, canary = self._fixture()
+
+        f1 = Foo()
+        b1, b2 = Bar(), Bar()
+        f1.attr.extend([b1, b2])
+
+        eq_(
+            attributes.get_state_history(
+                attributes.instance_state(f1), "attr"
+            ),
+            ([b1, b2], [], []),
+        )
+
+    def test_list_extend_empty(self):
+        Foo, Bar, canary = self._fixture()
+
+        f1 = Foo()
+        f1.attr.extend([])
+        eq_(canary.mock_calls, [])
+
+    def test_list_extend_custom_append(self):
+        class MyList(list):
+            def append(self, item):
+                super(MyList, self).append(item)
+                self.append_count = getattr(self, "append_count", 0) + 1
+
+        Foo, Bar, canary = self._fixture(MyList)
+
+        f1 = Foo()
+        b1, b2 = Bar(), Bar()
+        f1.attr.extend([b1, b2])
+        eq_(f1.attr, [b1, b2])
+        eq_(f1.attr.append_count, 2)
+
+        token = Foo.attr.impl._append_token
+        eq_(
+            canary.mock_calls,
+            [
+                call.append(f1, b1, token),
+                call.append(f1, b2, token),
+                call.bulk_append(f1, [b1, b2], token),
+            ],
+        )
+
+    def test_list_extend_instrumented_append(self):
+        class MyList(list):
+            @collection.appender
+            @collection.adds(1)
+            def append(self, item):
+                list.append(self, item)
+
+        Foo, Bar, canary = self._fixture(MyList)
+
+        f1 = Foo()
+        b1, b2 = Bar(), Bar()
+        f1.attr.extend([b1, b2])
+        eq_(f1.attr, [b1, b2])
+
+        token = Foo.attr.impl._append_token
+        eq_(
+            canary.mock_calls,
+            [
+                call.append(f1, b1, token),
+                call.bulk_append(f1, [b1], token),
+                call.append(f1, b2, token),
+                call.bulk_append(f1, [b2], token),
+            ],
+        )
+
+    def test_set_update(self):
+        Foo, Bar, canary = self._fixture(set)
+
+        f1 = Foo()
+        b1, b2, b3 = Bar(), Bar(), Bar()
+        f1.attr.add(b1)
+        canary.reset_mock()
+
+        f1.attr.update([b1, b2, b2])
+        f1.attr |= set([b3])
+        eq_(f1.attr, set([b1, b2, b3]))
+
+        token = Foo.attr.impl._append_token
+        eq_(
+            canary.mock_calls,
+            [
+                call.append(f1, b2, token),
+                call.bulk_append(f1, [b2], token),
+                call.append(f1, b3, token),
+                call.bulk_append(f1, [b3], token),
+            ],
+        )
+
+    def test_bulk_replace(self):
+        Foo, Bar, canary = self._fixture()
+
+        f1 = Foo()
+        b1, b2, b3, b4 = Bar(), Bar(), Bar(), Bar()
+        f1.attr = [b1, b2]
+        canary.reset_mock()
+
+        f1.attr = [b3, b2, b4]
+        eq_(f1.attr, [b3, b2, b4])
+
+        token = Foo.attr.impl._bulk_replace_token
+        eq_(
+            canary.mock_calls,
+            [
+                call.append(f1, b3, token),
+                call.append(f1, b4, token),
+                call.bulk_append(f1, [b3, b4], token),
+                call.remove(f1, b1, token),
+                call.bulk_remove(f1, [b1], token),
+            ],
+        )
+
+    def test_retval_per_item_listener(self):
+        Foo, Bar, canary = self._fixture()
+
+        replacements = {}
+
+        def append(target, value, initiator):
+            replacements[value] = Bar()
+            return replacements[value]
+
+        event.listen(Foo.attr, "append", append, retval=True)
+
+        f1 = Foo()
+        b1, b2, b3 = Bar(), Bar(), Bar()
+        f1.attr.extend([b1, b2])
+        eq_(f1.attr, [replacements[b1], replacements[b2]])
+
+        f1.attr = [b3, replacements[b1]]
+        eq_(f1.attr, [replacements[b3], replacements[b1]])
+
+        eq_(
+            [c[1][1] for c in canary.bulk_append.mock_calls],
+            [[replacements[b1], replacements[b2]], [replacements[b3]]],
+        )
+
+
+class BulkCascadeTest(_fixtures.FixtureTest):
+    run_inserts = None
+
+    def _fixture(self, **kw):
+        users, addresses, User, Address = (
+            self.tables.users,
+            self.tables.addresses,
+            self.classes.User,
+            self.classes.Address,
+        )
+        mapper(
+            User,
+            users,
+            properties={
+                "addresses": relationship(Address, backref="user", **kw)
+            },
+        )
+        mapper(Address, addresses)
+        return User, Address
+
+    def test_extend(self):
+        User, Address = self._fixture()
+
+        sess = Session()
+        u1 = User(name="u1")
+        sess.add(u1)
+
+        a1, a2, a3 = Address(), Address(), Address()
+        u1.addresses.extend([a1, a2, a3])
+
+        for a in (a1, a2, a3):
+            is_true(a in sess)
+            is_true(a.user is u1)
+
+    def test_extend_moves_from_other_parent(self):
+        User, Address = self._fixture()
+
+        u1, u2 = User(name="u1"), User(name="u2")
+        a1, a2 = Address(), Address()
+        u1.addresses.extend([a1, a2])
+        u2.addresses.extend([a1, a2])
+
+        eq_(u1.addresses, [])
+        eq_(u2.addresses, [a1, a2])
+        is_true(a1.user is u2)
+        is_true(a2.user is u2)
+
+    def test_bulk_replace(self):
+        User, Address = self._fixture(cascade="all, delete-orphan")
+
+        sess = Session()
+        u1 = User(name="u1")
+        sess.add(u1)
+
+        a1, a2, a3 = Address(), Address(), Address()
+        u1.addresses = [a1, a2]
+        is_true(a1 in sess)
+        is_true(a2 in sess)
+
+        u1.addresses = [a2, a3]
+        is_true(a1.user is None)
+        is_false(a1 in sess)
+        is_true(a2 in sess)
+        is_true(a3 in sess)
+        is_true(a3.user is u1)
+
+
 class InstrumentationTest(fixtures.ORMTest):
     def test_uncooperative_descriptor_in_sweep(self):
         class DoNotTouch(object):
@@ -944,7 +944,11 @@ class OneToManyManyToOneTest(fixtures.MappedTest):
                 lambda ctx: {"person_id": p.id, "favorite_ball_id": None},
             ),
             # lambda ctx:[{'id': 1L}, {'id': 4L}, {'id': 3L}, {'id': 2L}])
-            CompiledSQL("DELETE FROM ball WHERE ball.id = :id", None),
+            CompiledSQL(
+                "DELETE FROM ball WHERE ball.id IN "
+                "([EXPANDING_primary_keys])",
+                None,
+            ),
             CompiledSQL(
                 "DELETE FROM person WHERE person.id = :id",
                 lambda ctx: [{"id": p.id}],
@@ -1108,13 +1112,9 @@ class OneToManyManyToOneTest(fixtures.MappedTest):
                 lambda ctx: [{"id": p.id}],
             ),
             CompiledSQL(
-                "DELETE FROM ball WHERE ball.id = :id",
-                lambda ctx: [
-                    {"id": b.id},
-                    {"id": b2.id},
-                    {"id": b3.id},
-                    {"id": b4.id},
-                ],
+                "DELETE FROM ball WHERE ball.id IN "
+                "([EXPANDING_primary_keys])",
+                lambda ctx: [{"primary_keys": [b.id, b2.id, b3.id, b4.id]}],
             ),
         )
 
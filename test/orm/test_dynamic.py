@@ -1154,3 +1154,438 @@ class HistoryTest(_DynamicFixture, _fixtures.FixtureTest):
         u1.addresses.remove(a1)
 
         self._assert_history(u1, ([], [], []), compare_passive=([], [], [a1]))
+
+
+class _WriteOnlyFixture(object):
+    def _user_address_fixture(self, addresses_args={}):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+
+        mapper(
+            User,
+            users,
+            properties={
+                "addresses": relationship(
+                    Address, lazy="write_only", **addresses_args
+                )
+            },
+        )
+        mapper(Address, addresses)
+        return User, Address
+
+    def _order_item_fixture(self, items_args={}):
+        items, Order, orders, order_items, Item = (
+            self.tables.items,
+            self.classes.Order,
+            self.tables.orders,
+            self.tables.order_items,
+            self.classes.Item,
+        )
+
+        mapper(
+            Order,
+            orders,
+            properties={
+                "items": relationship(
+                    Item,
+                    secondary=order_items,
+                    lazy="write_only",
+                    **items_args
+                )
+            },
+        )
+        mapper(Item, items)
+        return Order, Item
+
+
+class WriteOnlyTest(
+    _WriteOnlyFixture, _fixtures.FixtureTest, AssertsCompiledSQL
+):
+    def test_select(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        u = sess.query(User).get(7)
+
+        eq_(
+            u.addresses.select().all(),
+            [Address(id=1, email_address="jack@bean.com")],
+        )
+
+    def test_select_statement(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        u = sess.query(User).get(7)
+
+        self.assert_compile(
+            u.addresses.select().statement,
+            "SELECT addresses.id, addresses.user_id, addresses.email_address "
+            "FROM addresses WHERE :param_1 = addresses.user_id",
+            use_default_dialect=True,
+        )
+
+    def test_select_paginated(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        u = sess.query(User).get(8)
+
+        q = u.addresses.select().order_by(Address.id)
+        eq_([a.id for a in q.limit(2).all()], [2, 3])
+        eq_([a.id for a in q.limit(2).offset(2).all()], [4])
+        eq_(q.count(), 3)
+
+    def test_select_order_by(self):
+        User, Address = self._user_address_fixture(
+            addresses_args={"order_by": self.tables.addresses.c.id.desc()}
+        )
+        sess = create_session()
+        u = sess.query(User).get(8)
+
+        eq_([a.id for a in u.addresses.select()], [4, 3, 2])
+
+    def test_select_m2m(self):
+        Order, Item = self._order_item_fixture(
+            items_args={"order_by": self.tables.items.c.id}
+        )
+        sess = create_session()
+        o = sess.query(Order).get(1)
+
+        eq_([i.id for i in o.items.select()], [1, 2, 3])
+        eq_(
+            o.items.select().filter(Item.description == "item 2").all(),
+            [Item(id=2)],
+        )
+
+    def test_not_iterable(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        u = sess.query(User).get(7)
+
+        assert_raises(TypeError, list, u.addresses)
+
+    def test_never_loads(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        u = sess.query(User).get(8)
+        a1 = sess.query(Address).get(1)
+
+        def go():
+            u.addresses.add(Address(email_address="new"))
+            u.addresses.add_all([Address(email_address="new2")])
+            u.addresses.remove(a1)
+            eq_(
+                attributes.instance_state(u).attrs.addresses.history,
+                (
+                    [
+                        Address(email_address="new"),
+                        Address(email_address="new2"),
+                    ],
+                    [],
+                    [a1],
+                ),
+            )
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_detached_raise(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        u = sess.query(User).get(8)
+        sess.expunge(u)
+        assert_raises(orm_exc.DetachedInstanceError, u.addresses.select)
+
+    def test_no_uselist_false(self):
+        User, Address = self._user_address_fixture(
+            addresses_args={"uselist": False}
+        )
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "On relationship User.addresses, 'write_only' loaders cannot be "
+            "used with many-to-one/one-to-one relationships and/or "
+            "uselist=False.",
+            configure_mappers,
+        )
+
+    def test_no_m2o(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+        mapper(
+            Address,
+            addresses,
+            properties={
+                "user": relationship(User, uselist=True, lazy="write_only")
+            },
+        )
+        mapper(User, users)
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "On relationship Address.user, 'write_only' loaders cannot be "
+            "used with many-to-one/one-to-one relationships and/or "
+            "uselist=False.",
+            configure_mappers,
+        )
+
+    def test_no_replace_persistent(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        u = sess.query(User).get(8)
+
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "Attribute User.addresses is a write-only collection; the "
+            "collection of a persistent object can't be replaced.",
+            setattr,
+            u,
+            "addresses",
+            [],
+        )
+
+    def test_no_full_history(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        u = sess.query(User).get(8)
+
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "Attribute User.addresses is a write-only collection; the "
+            "existing contents of the collection can't be loaded",
+            attributes.get_history,
+            u,
+            "addresses",
+        )
+
+
+class WriteOnlyUOWTest(_WriteOnlyFixture, _fixtures.FixtureTest):
+
+    run_inserts = None
+
+    def _user_address_rows(self):
+        addresses = self.tables.addresses
+        return testing.db.execute(
+            select([addresses.c.user_id, addresses.c.email_address]).order_by(
+                addresses.c.id
+            )
+        ).fetchall()
+
+    def test_add_all(self):
+        User, Address = self._user_address_fixture()
+
+        sess = Session()
+        u1 = User(name="jack")
+        sess.add(u1)
+        sess.flush()
+
+        u1.addresses.add_all(
+            [Address(email_address="a%d" % i) for i in range(3)]
+        )
+        sess.commit()
+
+        eq_(
+            self._user_address_rows(),
+            [(u1.id, "a0"), (u1.id, "a1"), (u1.id, "a2")],
+        )
+
+    def test_remove(self):
+        User, Address = self._user_address_fixture()
+
+        sess = Session()
+        a1, a2 = Address(email_address="a1"), Address(email_address="a2")
+        u1 = User(name="jack", addresses=[a1, a2])
+        sess.add(u1)
+        sess.commit()
+
+        u1.addresses.remove(a1)
+        sess.commit()
+
+        eq_(self._user_address_rows(), [(None, "a1"), (u1.id, "a2")])
+
+    def test_remove_delete_orphan(self):
+        User, Address = self._user_address_fixture(
+            addresses_args={"cascade": "all, delete-orphan"}
+        )
+
+        sess = Session()
+        a1, a2 = Address(email_address="a1"), Address(email_address="a2")
+        u1 = User(name="jack", addresses=[a1, a2])
+        sess.add(u1)
+        sess.commit()
+
+        u1.addresses.remove(a1)
+        sess.commit()
+
+        eq_(self._user_address_rows(), [(u1.id, "a2")])
+
+    def test_select_autoflush(self):
+        User, Address = self._user_address_fixture()
+
+        sess = Session()
+        u1 = User(name="jack")
+        sess.add(u1)
+
+        u1.addresses.add(Address(email_address="a1"))
+        eq_(
+            [a.email_address for a in u1.addresses.select()], ["a1"],
+        )
+
+    def test_backref(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+        mapper(
+            User,
+            users,
+            properties={
+                "addresses": relationship(
+                    Address, lazy="write_only", backref="user"
+                )
+            },
+        )
+        mapper(Address, addresses)
+
+        sess = Session()
+        u1, u2 = User(name="jack"), User(name="ed")
+        sess.add_all([u1, u2])
+        sess.commit()
+
+        a1 = Address(email_address="a1", user=u1)
+        eq_(
+            attributes.instance_state(u1).attrs.addresses.history,
+            ([a1], [], []),
+        )
+        sess.commit()
+
+        is_(a1.user, u1)
+        a1.user = u2
+        eq_(
+            attributes.instance_state(u1).attrs.addresses.history,
+            ([], [], [a1]),
+        )
+        sess.commit()
+
+        eq_(self._user_address_rows(), [(u2.id, "a1")])
+
+    def test_delete_parent_requires_passive_deletes(self):
+        User, Address = self._user_address_fixture()
+
+        sess = Session()
+        u1 = User(name="jack", addresses=[Address(email_address="a1")])
+        sess.add(u1)
+        sess.commit()
+
+        sess.delete(u1)
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "configure passive_deletes=True on the relationship",
+            sess.flush,
+        )
+
+    def test_delete_parent_passive_deletes(self):
+        User, Address = self._user_address_fixture(
+            addresses_args={"passive_deletes": True}
+        )
+
+        sess = Session()
+        u1 = User(name="jack", addresses=[Address(email_address="a1")])
+        sess.add(u1)
+        sess.commit()
+
+        sess.delete(u1)
+        sess.commit()
+
+        eq_(sess.query(User).count(), 0)
+
+    def _test_delete_parent_cascade_passive_deletes(self, cascade):
+        User, Address = self._user_address_fixture(
+            addresses_args={"cascade": cascade, "passive_deletes": True}
+        )
+
+        sess = Session()
+        u1 = User(name="jack", addresses=[Address(email_address="a1")])
+        sess.add(u1)
+        sess.commit()
+
+        sess.delete(u1)
+        sess.commit()
+
+        eq_(sess.query(User).count(), 0)
+        eq_(self._user_address_rows(), [(u1.id, "a1")])
+
+    def test_delete_parent_cascade_all_passive_deletes(self):
+        self._test_delete_parent_cascade_passive_deletes("all")
+
+    def test_delete_parent_cascade_delete_orphan_passive_deletes(self):
+        self._test_delete_parent_cascade_passive_deletes(
+            "all, delete-orphan"
+        )
+
+    def test_refresh_expire_cascade(self):
+        User, Address = self._user_address_fixture(
+            addresses_args={"cascade": "all"}
+        )
+        users = self.tables.users
+
+        sess = Session()
+        u1 = User(name="jack", addresses=[Address(email_address="a1")])
+        sess.add(u1)
+        sess.commit()
+
+        sess.execute(users.update().values(name="ed"))
+        sess.refresh(u1)
+        eq_(u1.name, "ed")
+
+        sess.execute(users.update().values(name="fred"))
+        sess.expire(u1)
+        eq_(u1.name, "fred")
+
+    def test_expunge_cascade(self):
+        User, Address = self._user_address_fixture(
+            addresses_args={"cascade": "all"}
+        )
+
+        sess = Session()
+        u1 = User(name="jack", addresses=[Address(email_address="a1")])
+        sess.add(u1)
+        sess.commit()
+
+        a2 = Address(email_address="a2")
+        u1.addresses.add(a2)
+        assert a2 in sess
+
+        sess.expunge(u1)
+        assert u1 not in sess
+        assert a2 not in sess
+
+    def test_m2m(self):
+        Order, Item = self._order_item_fixture()
+        order_items = self.tables.order_items
+
+        sess = Session()
+        i1, i2, i3 = (
+            Item(description="i1"),
+            Item(description="i2"),
+            Item(description="i3"),
+        )
+        o1 = Order(description="o1", items=[i1, i2])
+        sess.add_all([o1, i3])
+        sess.commit()
+
+        o1.items.remove(i1)
+        o1.items.add(i3)
+        sess.commit()
+
+        eq_(
+            sorted(
+                testing.db.execute(select([order_items.c.item_id])).fetchall()
+            ),
+            [(i2.id,), (i3.id,)],
+        )
@@ -0,0 +1,295 @@
+from sqlalchemy import event
+from sqlalchemy import Integer
+from sqlalchemy import PickleType
+from sqlalchemy import testing
+from sqlalchemy.ext.mutable import MutableList
+from sqlalchemy.orm import load_only
+from sqlalchemy.orm import mapper
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.entity_cache import CacheBackend
+from sqlalchemy.orm.entity_cache import EntityCache
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_not_
+from sqlalchemy.testing.schema import Column
+from sqlalchemy.testing.schema import Table
+from test.orm import _fixtures
+
+
+class EntityCacheTest(_fixtures.FixtureTest):
+    @classmethod
+    def setup_mappers(cls):
+        User, users = cls.classes.User, cls.tables.users
+        Address, addresses = cls.classes.Address, cls.tables.addresses
+
+        mapper(User, users)
+        mapper(Address, addresses, properties={"user": relationship(User)})
+
+    def _session(self, cache):
+        return Session(testing.db, entity_cache=cache)
+
+    def test_get(self):
+        User = self.classes.User
+
+        cache = EntityCache()
+        u1 = self._session(cache).query(User).get(7)
+
+        s2 = self._session(cache)
+
+        def go():
+            u2 = s2.query(User).get(7)
+            is_not_(u2, u1)
+            eq_(u2.name, "jack")
+            is_(s2.query(User).get(7), u2)
+
+        self.assert_sql_count(testing.db, go, 0)
+        eq_((cache.hits, cache.misses), (1, 1))
+
+    def test_get_missing(self):
+        User = self.classes.User
+
+        cache = EntityCache()
+        is_(self._session(cache).query(User).get(19), None)
+
+        def go():
+            is_(self._session(cache).query(User).get(19), None)
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_get_many(self):
+        User = self.classes.User
+
+        cache = EntityCache()
+        self._session(cache).query(User).get(8)
+        s = self._session(cache)
+
+        def go():
+            eq_(
+                [u.name for u in s.get_many(User, [7, 8, 9])],
+                ["jack", "ed", "fred"],
+            )
+
+        self.assert_sql_count(testing.db, go, 1)
+
+        s = self._session(cache)
+
+        def go():
+            eq_(
+                [u.name for u in s.get_many(User, [7, 8, 9])],
+                ["jack", "ed", "fred"],
+            )
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_many_to_one(self):
+        User, Address = self.classes.User, self.classes.Address
+
+        cache = EntityCache()
+        self._session(cache).query(Address).get(1).user
+
+        s = self._session(cache)
+        a1 = s.query(Address).filter_by(id=1).one()
+
+        def go():
+            eq_(a1.user.name, "jack")
+            is_(a1.user, s.query(User).get(7))
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_flush_invalidates(self):
+        User = self.classes.User
+
+        cache = EntityCache()
+        s = self._session(cache)
+        u1 = s.query(User).get(7)
+        u1.name = "jack2"
+        s.flush()
+        is_(cache.backend.get(identity_key(User, 7)), None)
+        s.commit()
+
+        s = self._session(cache)
+        eq_(s.query(User).get(7).name, "jack2")
+        eq_(self._session(cache).query(User).get(7).name, "jack2")
+        eq_((cache.hits, cache.misses), (1, 2))
+
+    def test_delete_invalidates(self):
+        User = self.classes.User
+
+        cache = EntityCache()
+        s = self._session(cache)
+        s.delete(s.query(User).get(10))
+        s.commit()
+
+        is_(self._session(cache).query(User).get(10), None)
+
+    def test_no_populate_from_pending_changes(self):
+        User = self.classes.User
+
+        cache = EntityCache()
+        s = self._session(cache)
+        u1 = s.query(User).get(7)
+        u1.name = "jack2"
+        s.flush()
+        s.expunge_all()
+
+        eq_(s.query(User).get(7).name, "jack2")
+        is_(cache.backend.get(identity_key(User, 7)), None)
+
+        s.rollback()
+        eq_(self._session(cache).query(User).get(7).name, "jack")
+
+    def test_transaction_end_invalidates(self):
+        User = self.classes.User
+
+        cache = EntityCache()
+        s = self._session(cache)
+        u1 = s.query(User).get(7)
+        u1.name = "jack2"
+        s.flush()
+
+        # e.g. another session loading the row prior to commit
+        cache.backend.set(identity_key(User, 7), (User, {"name": "jack"}))
+        s.commit()
+
+        is_(cache.backend.get(identity_key(User, 7)), None)
+
+    def test_bulk_update_clears(self):
+        User = self.classes.User
+
+        cache = EntityCache()
+        s = self._session(cache)
+        s.query(User).get(7)
+        s.query(User).filter(User.id == 7).update({"name": "jack2"})
+        is_(cache.backend.get(identity_key(User, 7)), None)
+
+        s.expunge_all()
+        s.query(User).get(7)
+        is_(cache.backend.get(identity_key(User, 7)), None)
+        s.commit()
+
+        eq_(self._session(cache).query(User).get(7).name, "jack2")
+
+    def test_unloaded_attributes_expired(self):
+        User = self.classes.User
+
+        cache = EntityCache()
+        self._session(cache).query(User).options(load_only("id")).get(7)
+
+        s = self._session(cache)
+        loaded = []
+
+        def go():
+            loaded.append(s.query(User).get(7))
+
+        self.assert_sql_count(testing.db, go, 0)
+        u1 = loaded[0]
+        assert "name" not in u1.__dict__
+
+        def go():
+            eq_(u1.name, "jack")
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_load_event(self):
+        User = self.classes.User
+
+        cache = EntityCache()
+        self._session(cache).query(User).get(7)
+
+        canary = []
+        event.listen(User, "load", lambda obj, ctx: canary.append(obj))
+
+        u1 = self._session(cache).query(User).get(7)
+        eq_(canary, [u1])
+
+    def test_backend(self):
+        User = self.classes.User
+
+        class DictBackend(CacheBackend):
+            def __init__(self):
+                self.data = {}
+
+            def get(self, key):
+                return self.data.get(key)
+
+            def set(self, key, value):
+                self.data[key] = value
+
+            def delete_many(self, keys):
+                for key in keys:
+                    self.data.pop(key, None)
+
+            def clear(self):
+                self.data.clear()
+
+        backend = DictBackend()
+        cache = EntityCache(backend)
+        self._session(cache).query(User).get(7)
+        eq_(
+            backend.data,
+            {identity_key(User, 7): (User, {"id": 7, "name": "jack"})},
+        )
+
+        cache.invalidate([identity_key(User, 7)])
+        eq_(backend.data, {})
+
+
+class MutableValueTest(fixtures.MappedTest):
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "foo",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", MutableList.as_mutable(PickleType)),
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class Foo(cls.Basic):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        mapper(cls.classes.Foo, cls.tables.foo)
+
+    @classmethod
+    def insert_data(cls):
+        s = Session(testing.db)
+        s.add(cls.classes.Foo(id=1, data=[1, 2, 3]))
+        s.commit()
+
+    def _session(self, cache):
+        return Session(testing.db, entity_cache=cache)
+
+    def test_mutation_not_shared_on_put(self):
+        Foo = self.classes.Foo
+
+        cache = EntityCache()
+        s1 = self._session(cache)
+        f1 = s1.query(Foo).get(1)
+        f1.data.append(4)
+        s1.rollback()
+
+        f2 = self._session(cache).query(Foo).get(1)
+        eq_(cache.hits, 1)
+        eq_(f2.data, [1, 2, 3])
+
+    def test_mutation_not_shared_on_load(self):
+        Foo = self.classes.Foo
+
+        cache = EntityCache()
+        self._session(cache).query(Foo).get(1)
+
+        s2 = self._session(cache)
+        f2 = s2.query(Foo).get(1)
+        f2.data.append(4)
+        assert f2 in s2.dirty
+        s2.rollback()
+
+        f3 = self._session(cache).query(Foo).get(1)
+        eq_(cache.hits, 2)
+        eq_(f3.data, [1, 2, 3])
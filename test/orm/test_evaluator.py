@@ -2,7 +2,9 @@
 
 from sqlalchemy import and_
 from sqlalchemy import bindparam
+from sqlalchemy import case
 from sqlalchemy import ForeignKey
+from sqlalchemy import func
 from sqlalchemy import inspect
 from sqlalchemy import Integer
 from sqlalchemy import not_
@@ -206,6 +208,222 @@ class EvaluateTest(fixtures.MappedTest):
             ],
         )
 
+    def test_in(self):
+        User = self.classes.User
+
+        eval_eq(
+            User.id.in_([1, 3]),
+            testcases=[
+                (User(id=1), True),
+                (User(id=2), False),
+                (User(id=None), None),
+            ],
+        )
+        eval_eq(
+            User.id.notin_([1, 3]),
+            testcases=[
+                (User(id=1), False),
+                (User(id=2), True),
+                (User(id=None), None),
+            ],
+        )
+        eval_eq(
+            User.id.in_([1, None]),
+            testcases=[(User(id=1), True), (User(id=2), None)],
+        )
+        eval_eq(
+            User.id.in_(bindparam("ids", [1, 3], expanding=True)),
+            testcases=[(User(id=3), True), (User(id=2), False)],
+        )
+
+    def test_empty_in(self):
+        User = self.classes.User
+
+        eval_eq(User.id.in_([]), testcases=[(User(id=1), False)])
+        eval_eq(User.id.notin_([]), testcases=[(User(id=1), True)])
+
+    def test_ilike(self):
+        User = self.classes.User
+
+        eval_eq(
+            User.name.ilike("f_o%"),
+            testcases=[
+                (User(name="foo"), True),
+                (User(name="FOOZ"), True),
+                (User(name="fo"), False),
+                (User(name=None), None),
+            ],
+        )
+        eval_eq(
+            User.name.notilike("f%"),
+            testcases=[(User(name="Foo"), False), (User(name="bar"), True)],
+        )
+        eval_eq(
+            User.name.ilike("100/%", escape="/"),
+            testcases=[(User(name="100%"), True), (User(name="1000"), False)],
+        )
+        eval_eq(
+            User.name.ilike(User.othername),
+            testcases=[
+                (User(name="foo", othername="F%"), True),
+                (User(name="foo", othername="b%"), False),
+                (User(name="foo", othername=None), None),
+            ],
+        )
+
+    def test_like_unevaluatable(self):
+        User = self.classes.User
+
+        for expr in (
+            User.name.like("f%"),
+            User.name.notlike("f%"),
+            User.name.startswith("fo"),
+            User.name.endswith("oo"),
+            User.name.contains("o_o"),
+        ):
+            assert_raises_message(
+                evaluator.UnevaluatableError,
+                "Cannot evaluate BinaryExpression with operator",
+                compiler.process,
+                expr,
+            )
+
+    def test_between(self):
+        User = self.classes.User
+
+        eval_eq(
+            User.id.between(2, 4),
+            testcases=[
+                (User(id=1), False),
+                (User(id=2), True),
+                (User(id=4), True),
+                (User(id=None), None),
+            ],
+        )
+        eval_eq(
+            User.id.between(4, 2, symmetric=True),
+            testcases=[(User(id=3), True), (User(id=5), False)],
+        )
+        eval_eq(
+            ~User.id.between(2, 4),
+            testcases=[(User(id=3), False), (User(id=5), True)],
+        )
+
+    def test_is_null(self):
+        User = self.classes.User
+
+        eval_eq(
+            User.name.is_(None),
+            testcases=[(User(name="foo"), False), (User(name=None), True)],
+        )
+        eval_eq(
+            User.name.isnot(None),
+            testcases=[(User(name="foo"), True), (User(name=None), False)],
+        )
+        eval_eq(
+            User.name.is_distinct_from(User.othername),
+            testcases=[
+                (User(name="foo", othername="foo"), False),
+                (User(name=None, othername=None), False),
+                (User(name="foo", othername=None), True),
+            ],
+        )
+
+    def test_arithmetic(self):
+        User = self.classes.User
+
+        eval_eq(
+            (User.id * 2 + 1) % 4 == 3,
+            testcases=[
+                (User(id=1), True),
+                (User(id=2), False),
+                (User(id=None), None),
+            ],
+        )
+        eval_eq(
+            -User.id == -5,
+            testcases=[(User(id=5), True), (User(id=None), None)],
+        )
+
+    def test_concat(self):
+        User = self.classes.User
+
+        eval_eq(
+            User.name + User.othername == "foobar",
+            testcases=[
+                (User(name="foo", othername="bar"), True),
+                (User(name="foo", othername=None), None),
+            ],
+        )
+
+    def test_case(self):
+        User = self.classes.User
+
+        eval_eq(
+            case([(User.id < 3, "low"), (User.id < 6, "mid")], else_="high")
+            == "mid",
+            testcases=[
+                (User(id=1), False),
+                (User(id=4), True),
+                (User(id=7), False),
+            ],
+        )
+        eval_eq(
+            case({1: "one"}, value=User.id) == "one",
+            testcases=[
+                (User(id=1), True),
+                (User(id=2), None),
+                (User(id=None), None),
+            ],
+        )
+
+    def test_functions(self):
+        User = self.classes.User
+
+        eval_eq(
+            func.lower(User.name) == "foo",
+            testcases=[
+                (User(name="FoO"), True),
+                (User(name="bar"), False),
+                (User(name=None), None),
+            ],
+        )
+        eval_eq(
+            func.upper(User.name) == "FOO",
+            testcases=[(User(name="foo"), True)],
+        )
+        eval_eq(
+            func.coalesce(User.name, User.othername, "x") == "bar",
+            testcases=[
+                (User(name=None, othername="bar"), True),
+                (User(name="foo", othername="bar"), False),
+            ],
+        )
+        eval_eq(
+            func.abs(User.id) == 5,
+            testcases=[(User(id=-5), True), (User(id=4), False)],
+        )
+
+    def test_unsupported_function(self):
+        User = self.classes.User
+
+        assert_raises_message(
+            evaluator.UnevaluatableError,
+            r"Cannot evaluate function now\(\)",
+            compiler.process,
+            User.name == func.now(),
+        )
+
+    def test_in_subquery(self):
+        User = self.classes.User
+
+        assert_raises_message(
+            evaluator.UnevaluatableError,
+            "Cannot evaluate",
+            compiler.process,
+            User.id.in_(Session().query(User.id)),
+        )
+
 
 class M2OEvaluateTest(fixtures.DeclarativeMappedTest):
     @classmethod
@@ -240,3 +458,23 @@ class M2OEvaluateTest(fixtures.DeclarativeMappedTest):
         session.query(Child).filter(Child.parent == p).delete("evaluate")
 
         is_(inspect(c).deleted, True)
+
+    def test_delete_comparisons(self):
+        Parent, Child = self.classes("Parent", "Child")
+
+        session = Session()
+
+        p1, p2 = Parent(id=1), Parent(id=2)
+        c1 = Child(name="foo", parent=p1)
+        c2 = Child(name="bar", parent=p2)
+        session.add_all([c1, c2])
+        session.commit()
+
+        session.query(Child).filter(Child.parent != p1).delete("evaluate")
+        is_(inspect(c1).deleted, False)
+        is_(inspect(c2).deleted, True)
+
+        session.query(Child).filter(
+            Child._id_parent.in_([p1.id]), Child.name.ilike("f%")
+        ).delete("evaluate")
+        is_(inspect(c1).deleted, True)
@@ -581,9 +581,9 @@ class MapperEventsTest(_RemoveListeners, _fixtures.FixtureTest):
         within this configure run.    The "new mappers" flag will remain set in
         this case and the configure operation will occur again.
 
-        This event, and its return value, make it possible to query one base
-        while a different one still needs configuration, which cannot be
-        completed at this time.
+        This event, and its return value, make it possible to query a
+        hierarchy while one of its mappers still needs configuration, which
+        cannot be completed at this time.
         """
 
         User, users = self.classes.User, self.tables.users
@@ -613,12 +613,17 @@ class MapperEventsTest(_RemoveListeners, _fixtures.FixtureTest):
         unconfigured = [m for m in _mapper_registry if not m.configured]
         eq_(1, len(unconfigured))
 
-        # Now try to query User, which is internally consistent. This query
+        # User doesn't depend on Mammal, so it can be queried without
+        # configuring Mammal:
+        Session().query(User)
+        assert not Mammal.__mapper__.configured
+
+        # Now try to query Animal, which is internally consistent. This query
         # fails by default because Mammal needs to be configured, and cannot
         # be:
         def probe():
             s = Session()
-            s.query(User)
+            s.query(Animal)
 
         assert_raises(sa.exc.InvalidRequestError, probe)
 
@@ -24,6 +24,9 @@ from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import mock
+from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
 from sqlalchemy.testing.util import gc_collect
@@ -1337,6 +1340,35 @@ class PolymorphicExpireTest(fixtures.MappedTest):
             polymorphic_identity="engineer",
         )
 
+    def test_refresh_all(self):
+        Person = self.classes.Person
+
+        sess = create_session()
+        p1, e1, e2 = sess.query(Person).order_by(Person.person_id).all()
+        e1.status = "foo"
+
+        sess.refresh_all([p1, e1, e2])
+        eq_(
+            [p.name for p in (p1, e1, e2)],
+            ["person1", "engineer1", "engineer2"],
+        )
+        eq_([e1.status, e2.status], ["new engineer", "old engineer"])
+
+    def test_bulk_load_expired(self):
+        Person = self.classes.Person
+
+        sess = Session(bulk_load_expired=True)
+        p1, e1, e2 = sess.query(Person).order_by(Person.person_id).all()
+        sess.expire_all()
+
+        def go():
+            eq_(e1.status, "new engineer")
+            eq_([e1.name, e2.name], ["engineer1", "engineer2"])
+            eq_(e2.status, "old engineer")
+
+        self.assert_sql_count(testing.db, go, 1)
+        eq_(p1.name, "person1")
+
     def test_poly_deferred(self):
         Person, people, Engineer = (
             self.classes.Person,
@@ -1836,3 +1868,248 @@ class RefreshTest(_fixtures.FixtureTest):
         assert u.name == "Justin"
 
         s.refresh(u)
+
+
+class BulkRefreshTest(_fixtures.FixtureTest):
+    @classmethod
+    def setup_mappers(cls):
+        users, Address, addresses, User = (
+            cls.tables.users,
+            cls.classes.Address,
+            cls.tables.addresses,
+            cls.classes.User,
+        )
+
+        mapper(
+            User,
+            users,
+            properties={"addresses": relationship(Address, backref="user")},
+        )
+        mapper(Address, addresses)
+
+    def _users_in(self, ids):
+        return CompiledSQL(
+            "SELECT users.id AS users_id, users.name AS users_name "
+            "FROM users WHERE users.id IN ([EXPANDING_primary_keys])",
+            [{"primary_keys": ids}],
+        )
+
+    def test_refresh_all(self):
+        User, users = self.classes.User, self.tables.users
+
+        s = Session()
+        u7, u8, u9 = s.query(User).filter(User.id.in_([7, 8, 9])).all()
+        u7.name = "foo"
+        s.execute(users.update().where(users.c.id == 8).values(name="bar"))
+
+        with self.sql_execution_asserter(testing.db) as asserter:
+            s.refresh_all([u7, u8, u9])
+            eq_([u7.name, u8.name, u9.name], ["jack", "bar", "fred"])
+
+        asserter.assert_(self._users_in([7, 8, 9]))
+        assert u7 not in s.dirty
+
+    def test_refresh_all_attribute_names(self):
+        User = self.classes.User
+
+        s = Session()
+        u7, u8 = s.query(User).filter(User.id.in_([7, 8])).all()
+        u8.addresses
+        u7.name = "foo"
+
+        with self.sql_execution_asserter(testing.db) as asserter:
+            s.refresh_all([u7, u8], ["name"])
+            eq_([u7.name, u8.name], ["jack", "ed"])
+            eq_(len(u8.addresses), 3)
+
+        asserter.assert_(
+            CompiledSQL(
+                "SELECT users.id AS users_id, users.name AS users_name "
+                "FROM users WHERE users.id IN ([EXPANDING_primary_keys])",
+                [{"primary_keys": [7, 8]}],
+            )
+        )
+
+    def test_refresh_all_mappers(self):
+        User, Address = self.classes.User, self.classes.Address
+
+        s = Session()
+        u7 = s.query(User).get(7)
+        u8 = s.query(User).get(8)
+        a1 = s.query(Address).get(1)
+
+        with self.sql_execution_asserter(testing.db) as asserter:
+            s.refresh_all([u7, a1, u8])
+            eq_(a1.email_address, "jack@bean.com")
+
+        asserter.assert_(
+            self._users_in([7, 8]),
+            CompiledSQL(
+                "SELECT addresses.id AS addresses_id, addresses.user_id "
+                "AS addresses_user_id, addresses.email_address AS "
+                "addresses_email_address FROM addresses "
+                "WHERE addresses.id IN ([EXPANDING_primary_keys])",
+                [{"primary_keys": [1]}],
+            ),
+        )
+
+    def test_refresh_all_chunks(self):
+        User = self.classes.User
+
+        s = Session()
+        users = s.query(User).order_by(User.id).all()
+
+        with mock.patch(
+            "sqlalchemy.orm.loading._load_on_pk_identities_chunksize", 3
+        ):
+            with self.sql_execution_asserter(testing.db) as asserter:
+                s.refresh_all(users)
+
+        asserter.assert_(self._users_in([7, 8, 9]), self._users_in([10]))
+
+    def test_refresh_all_deleted(self):
+        User, users = self.classes.User, self.tables.users
+
+        s = Session()
+        u7, u8 = s.query(User).filter(User.id.in_([7, 8])).all()
+        s.execute(users.delete().where(users.c.id == 8))
+
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            "Could not refresh instance",
+            s.refresh_all,
+            [u7, u8],
+        )
+
+    def test_refresh_all_unmapped(self):
+        s = Session()
+        assert_raises(
+            orm_exc.UnmappedInstanceError, s.refresh_all, [object()]
+        )
+
+    def test_refresh_all_not_persistent(self):
+        User = self.classes.User
+
+        s = Session()
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            "is not persistent within this Session",
+            s.refresh_all,
+            [User(name="u1")],
+        )
+
+    def test_bulk_load_expired(self):
+        User = self.classes.User
+
+        s = Session(bulk_load_expired=True)
+        users = s.query(User).order_by(User.id).all()
+        s.commit()
+
+        with self.sql_execution_asserter(testing.db) as asserter:
+            eq_(users[1].name, "ed")
+            eq_(
+                [u.name for u in users], ["jack", "ed", "fred", "chuck"]
+            )
+
+        asserter.assert_(self._users_in([7, 8, 9, 10]))
+
+    def test_bulk_load_expired_default(self):
+        User = self.classes.User
+
+        s = Session()
+        users = s.query(User).order_by(User.id).all()
+        s.commit()
+
+        with self.sql_execution_asserter(testing.db) as asserter:
+            eq_(
+                [u.name for u in users], ["jack", "ed", "fred", "chuck"]
+            )
+
+        asserter.assert_(
+            *[
+                CompiledSQL(
+                    "SELECT users.id AS users_id, users.name AS users_name "
+                    "FROM users WHERE users.id = :param_1",
+                    [{"param_1": id_}],
+                )
+                for id_ in [7, 8, 9, 10]
+            ]
+        )
+
+    def test_bulk_load_expired_attributes(self):
+        User = self.classes.User
+
+        s = Session(bulk_load_expired=True)
+        u7, u8, u9 = s.query(User).filter(User.id.in_([7, 8, 9])).all()
+        s.expire(u7, ["name"])
+        s.expire(u8, ["name"])
+
+        with self.sql_execution_asserter(testing.db) as asserter:
+            eq_(u8.name, "ed")
+            eq_(u7.name, "jack")
+            eq_(u9.name, "fred")
+
+        asserter.assert_(
+            CompiledSQL(
+                "SELECT users.id AS users_id, users.name AS users_name "
+                "FROM users WHERE users.id IN ([EXPANDING_primary_keys])",
+                [{"primary_keys": [7, 8]}],
+            )
+        )
+
+    def test_bulk_load_expired_no_identity_map_scan(self):
+        User = self.classes.User
+
+        s = Session(bulk_load_expired=True)
+        users = s.query(User).order_by(User.id).all()
+        s.commit()
+
+        with mock.patch.object(
+            s.identity_map, "all_states", side_effect=AssertionError
+        ):
+            eq_(
+                [u.name for u in users], ["jack", "ed", "fred", "chuck"]
+            )
+            s.expire(users[2], ["name"])
+            eq_(users[2].name, "fred")
+
+    def test_bulk_load_expired_loaded_elsewhere(self):
+        User = self.classes.User
+
+        s = Session(bulk_load_expired=True)
+        users = s.query(User).order_by(User.id).all()
+        s.rollback()
+
+        # u8 and u9 are loaded by a query ahead of the attribute access
+        s.query(User).filter(User.id.in_([8, 9])).all()
+
+        with self.sql_execution_asserter(testing.db) as asserter:
+            eq_(
+                [u.name for u in users], ["jack", "ed", "fred", "chuck"]
+            )
+
+        asserter.assert_(self._users_in([7, 10]))
+
+    def test_bulk_load_expired_modified(self):
+        User = self.classes.User
+
+        s = Session(bulk_load_expired=True)
+        u7, u8 = s.query(User).filter(User.id.in_([7, 8])).all()
+        s.commit()
+        u8.name = "foo"
+
+        eq_(u7.name, "jack")
+        eq_(u8.name, "foo")
+        assert u8 in s.dirty
+
+    def test_bulk_load_expired_deleted(self):
+        User, users = self.classes.User, self.tables.users
+
+        s = Session(bulk_load_expired=True)
+        u7, u8 = s.query(User).filter(User.id.in_([7, 8])).all()
+        s.commit()
+        s.execute(users.delete().where(users.c.id == 7))
+
+        assert_raises(orm_exc.ObjectDeletedError, getattr, u7, "name")
+        eq_(u8.name, "ed")
+        is_(s.query(User).get(7), None)
@@ -1,12 +1,22 @@
+from sqlalchemy import event
 from sqlalchemy import exc
+from sqlalchemy import inspect
 from sqlalchemy import select
 from sqlalchemy.orm import aliased
+from sqlalchemy.orm import defer
+from sqlalchemy.orm import immediateload
+from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import loading
+from sqlalchemy.orm import noload
+from sqlalchemy.orm import selectinload
 from sqlalchemy.orm import Session
+from sqlalchemy.orm import subqueryload
 from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertions import assert_raises
 from sqlalchemy.testing.assertions import assert_raises_message
 from sqlalchemy.testing.assertions import eq_
+from sqlalchemy.testing.assertions import is_
+from sqlalchemy.testing.assertions import is_not_
 from sqlalchemy.util import KeyedTuple
 from . import _fixtures
 
@@ -53,6 +63,263 @@ class InstancesTest(_fixtures.FixtureTest):
         )
 
 
+class CompiledPopulatorsTest(_fixtures.FixtureTest):
+    run_setup_mappers = "once"
+    run_inserts = "once"
+    run_deletes = None
+
+    @classmethod
+    def setup_mappers(cls):
+        cls._setup_stock_mapping()
+
+    def _assert_same(self, q):
+        uncompiled = q.with_session(Session()).all()
+        compiled = (
+            q.with_session(Session())
+            .execution_options(compile_populators=True)
+            .all()
+        )
+        eq_(compiled, uncompiled)
+        return compiled
+
+    def test_plain(self):
+        User = self.classes.User
+
+        users = self._assert_same(Session().query(User).order_by(User.id))
+        eq_(users, self.static.user_result)
+
+    def test_deferred(self):
+        User = self.classes.User
+
+        users = self._assert_same(
+            Session().query(User).options(defer(User.name)).order_by(User.id)
+        )
+        assert "name" not in users[0].__dict__
+        eq_(users[0].name, "jack")
+
+    def test_joined_eager(self):
+        User = self.classes.User
+
+        users = self._assert_same(
+            Session()
+            .query(User)
+            .options(joinedload(User.addresses))
+            .order_by(User.id)
+        )
+        assert "addresses" in users[0].__dict__
+        eq_(users, self.static.user_address_result)
+
+    def test_populate_existing(self):
+        User = self.classes.User
+
+        sess = Session()
+        u1 = sess.query(User).order_by(User.id).first()
+        u1.name = "modified"
+
+        sess.query(User).populate_existing().execution_options(
+            compile_populators=True
+        ).all()
+        eq_(u1.name, "jack")
+        assert not sess.is_modified(u1)
+
+    def test_factory_cached_per_shape(self):
+        User = self.classes.User
+
+        loading._populate_full_factories.clear()
+        for i in range(3):
+            sess = Session()
+            sess.query(User).execution_options(compile_populators=True).all()
+        eq_(len(loading._populate_full_factories), 1)
+
+        sess = Session()
+        sess.query(User).options(defer(User.name)).execution_options(
+            compile_populators=True
+        ).all()
+        eq_(len(loading._populate_full_factories), 2)
+
+
+class ReadonlyEntitiesTest(_fixtures.FixtureTest):
+    run_setup_mappers = "once"
+    run_inserts = "once"
+    run_deletes = None
+
+    @classmethod
+    def setup_mappers(cls):
+        cls._setup_stock_mapping()
+
+    def _query(self, *entities):
+        sess = Session()
+        return sess, sess.query(*entities).execution_options(
+            readonly_entities=True
+        )
+
+    def _assert_user_addresses(self, users):
+        eq_(
+            [(u.id, [a.email_address for a in u.addresses]) for u in users],
+            [
+                (7, ["jack@bean.com"]),
+                (8, ["ed@wood.com", "ed@bettyboop.com", "ed@lala.com"]),
+                (9, ["fred@fred.com"]),
+                (10, []),
+            ],
+        )
+
+    def _assert_readonly(self, sess, obj):
+        assert "_sa_instance_state" not in obj.__dict__
+        eq_(len(sess.identity_map), 0)
+
+    def test_plain(self):
+        User = self.classes.User
+
+        sess, q = self._query(User)
+        users = q.order_by(User.id).all()
+        eq_(
+            [(u.id, u.name) for u in users],
+            [(7, "jack"), (8, "ed"), (9, "fred"), (10, "chuck")],
+        )
+        self._assert_readonly(sess, users[0])
+
+    def test_rows_unique(self):
+        User = self.classes.User
+
+        sess, q = self._query(User)
+        users = q.join(User.addresses).order_by(User.id).all()
+        eq_([u.id for u in users], [7, 8, 9])
+
+    def test_not_loaded(self):
+        User = self.classes.User
+
+        sess, q = self._query(User)
+        u1 = q.options(defer(User.name)).order_by(User.id).first()
+        assert "name" not in u1.__dict__
+        assert "addresses" not in u1.__dict__
+        assert_raises(AttributeError, getattr, u1, "addresses")
+
+    def test_no_modify(self):
+        User = self.classes.User
+
+        sess, q = self._query(User)
+        u1 = q.order_by(User.id).first()
+        assert_raises(AttributeError, setattr, u1, "name", "ed")
+
+    def test_no_load_event(self):
+        User = self.classes.User
+
+        canary = mock.Mock()
+        event.listen(User, "load", canary)
+        try:
+            sess, q = self._query(User)
+            q.all()
+        finally:
+            event.remove(User, "load", canary)
+        eq_(canary.mock_calls, [])
+
+    def test_joined_eager(self):
+        User = self.classes.User
+
+        sess, q = self._query(User)
+        users = q.options(joinedload(User.addresses)).order_by(User.id).all()
+        self._assert_user_addresses(users)
+        self._assert_readonly(sess, users[0].addresses[0])
+
+    def test_joined_eager_many_to_one(self):
+        Address = self.classes.Address
+
+        sess, q = self._query(Address)
+        addresses = (
+            q.options(joinedload(Address.user)).order_by(Address.id).all()
+        )
+        eq_(
+            [(a.id, a.user.id) for a in addresses],
+            [(1, 7), (2, 8), (3, 8), (4, 8), (5, 9)],
+        )
+        is_(addresses[1].user, addresses[2].user)
+
+    def test_subquery_eager(self):
+        User = self.classes.User
+
+        sess, q = self._query(User)
+        users = (
+            q.options(subqueryload(User.addresses)).order_by(User.id).all()
+        )
+        self._assert_user_addresses(users)
+        self._assert_readonly(sess, users[0].addresses[0])
+
+    def test_selectin_eager(self):
+        User = self.classes.User
+
+        sess, q = self._query(User)
+        users = (
+            q.options(selectinload(User.addresses)).order_by(User.id).all()
+        )
+        self._assert_user_addresses(users)
+        self._assert_readonly(sess, users[0].addresses[0])
+
+    def test_get(self):
+        User = self.classes.User
+
+        sess, q = self._query(User)
+        u1 = q.get(7)
+        eq_(u1.name, "jack")
+        self._assert_readonly(sess, u1)
+
+        eq_(
+            [u and u.name for u in q.get_many([8, 19, 7])],
+            ["ed", None, "jack"],
+        )
+
+    def test_get_not_from_identity_map(self):
+        User = self.classes.User
+
+        sess, q = self._query(User)
+        u7 = sess.query(User).get(7)
+
+        u1 = q.get(7)
+        is_not_(u1, u7)
+        assert "_sa_instance_state" not in u1.__dict__
+
+        users = q.get_many([7, 8])
+        is_not_(users[0], u7)
+        eq_([u.name for u in users], ["jack", "ed"])
+        assert "_sa_instance_state" not in users[0].__dict__
+
+    def test_unsupported_loader(self):
+        User = self.classes.User
+
+        for opt in (immediateload(User.addresses), noload(User.addresses)):
+            sess, q = self._query(User)
+            assert_raises_message(
+                exc.InvalidRequestError,
+                "Loading of attribute\\(s\\) 'addresses' of mapped class "
+                "User->users is not supported with the readonly_entities "
+                "execution option",
+                q.options(opt).all,
+            )
+
+    def _test_cached_query(self, readonly_first):
+        User = self.classes.User
+
+        for readonly in (readonly_first, not readonly_first):
+            sess = Session()
+            q = sess.query(User).options(selectinload(User.addresses))
+            if readonly:
+                q = q.execution_options(readonly_entities=True)
+            users = q.order_by(User.id).all()
+            self._assert_user_addresses(users)
+            if readonly:
+                self._assert_readonly(sess, users[0])
+                self._assert_readonly(sess, users[0].addresses[0])
+            else:
+                is_(inspect(users[0]).session, sess)
+                eq_(len(sess.identity_map), 9)
+
+    def test_cached_query_readonly_first(self):
+        self._test_cached_query(True)
+
+    def test_cached_query_plain_first(self):
+        self._test_cached_query(False)
+
+
 class MergeResultTest(_fixtures.FixtureTest):
     run_setup_mappers = "once"
     run_inserts = "once"
@@ -4,6 +4,7 @@ from sqlalchemy import Integer
 from sqlalchemy import String
 from sqlalchemy import testing
 from sqlalchemy.orm import backref
+from sqlalchemy.orm import dependency
 from sqlalchemy.orm import exc as orm_exc
 from sqlalchemy.orm import mapper
 from sqlalchemy.orm import relationship
@@ -12,6 +13,8 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import mock
+from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
 
@@ -530,3 +533,190 @@ class AssortedPersistenceTests(fixtures.MappedTest):
         eq_(a1.bs, [B(data="b1")])
         eq_(b2.a, None)
         eq_(sess.query(secondary).count(), 1)
+
+
+class BatchedSecondaryTest(
+    fixtures.MappedTest, testing.AssertsExecutionResults
+):
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "left",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(30)),
+        )
+
+        Table(
+            "right",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(30)),
+        )
+
+        Table(
+            "secondary",
+            metadata,
+            Column(
+                "left_id", Integer, ForeignKey("left.id"), primary_key=True
+            ),
+            Column(
+                "right_id", Integer, ForeignKey("right.id"), primary_key=True
+            ),
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class A(cls.Comparable):
+            pass
+
+        class B(cls.Comparable):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        A, B = cls.classes.A, cls.classes.B
+        mapper(
+            A,
+            cls.tables.left,
+            properties={
+                "bs": relationship(
+                    B,
+                    secondary=cls.tables.secondary,
+                    backref="as_",
+                    order_by=cls.tables.right.c.id,
+                )
+            },
+        )
+        mapper(B, cls.tables.right)
+
+    def _fixture(self):
+        A, B = self.classes.A, self.classes.B
+        sess = Session()
+        a1 = A(id=1, bs=[B(id=i) for i in range(1, 6)])
+        a2 = A(id=2, bs=[a1.bs[0]])
+        sess.add_all([a1, a2])
+        sess.commit()
+        return sess, a1, a2
+
+    def _secondary_rows(self, sess):
+        secondary = self.tables.secondary
+        return (
+            sess.query(secondary.c.left_id, secondary.c.right_id)
+            .order_by(secondary.c.left_id, secondary.c.right_id)
+            .all()
+        )
+
+    def test_delete_in(self):
+        sess, a1, a2 = self._fixture()
+
+        a1.bs = a1.bs[0:1]
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "DELETE FROM secondary WHERE secondary.left_id = :left_id "
+                "AND secondary.right_id IN ([EXPANDING_related_keys])",
+                [{"left_id": 1, "related_keys": [2, 3, 4, 5]}],
+            ),
+        )
+        eq_(self._secondary_rows(sess), [(1, 1), (2, 1)])
+
+    def test_delete_single_row(self):
+        sess, a1, a2 = self._fixture()
+
+        a1.bs.pop(0)
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "DELETE FROM secondary WHERE secondary.left_id = :left_id "
+                "AND secondary.right_id = :right_id",
+                [{"left_id": 1, "right_id": 1}],
+            ),
+        )
+        eq_(
+            self._secondary_rows(sess),
+            [(1, 2), (1, 3), (1, 4), (1, 5), (2, 1)],
+        )
+
+    def test_delete_chunks(self):
+        sess, a1, a2 = self._fixture()
+
+        a1.bs = []
+        with mock.patch.object(dependency.ManyToManyDP, "_chunksize", 2):
+            self.assert_sql_execution(
+                testing.db,
+                sess.flush,
+                CompiledSQL(
+                    "DELETE FROM secondary WHERE secondary.left_id = :left_id "
+                    "AND secondary.right_id IN ([EXPANDING_related_keys])",
+                    [{"left_id": 1, "related_keys": [1, 2]}],
+                ),
+                CompiledSQL(
+                    "DELETE FROM secondary WHERE secondary.left_id = :left_id "
+                    "AND secondary.right_id IN ([EXPANDING_related_keys])",
+                    [{"left_id": 1, "related_keys": [3, 4]}],
+                ),
+                CompiledSQL(
+                    "DELETE FROM secondary WHERE secondary.left_id = :left_id "
+                    "AND secondary.right_id IN ([EXPANDING_related_keys])",
+                    [{"left_id": 1, "related_keys": [5]}],
+                ),
+            )
+        eq_(self._secondary_rows(sess), [(2, 1)])
+
+    @testing.requires.sane_rowcount
+    def test_delete_stale(self):
+        sess, a1, a2 = self._fixture()
+
+        a1.bs
+        sess.execute(
+            self.tables.secondary.delete().where(
+                self.tables.secondary.c.right_id > 3
+            )
+        )
+        a1.bs = []
+        assert_raises_message(
+            orm_exc.StaleDataError,
+            r"DELETE statement on table 'secondary' expected to "
+            r"delete 5 row\(s\); Only 3 were matched.",
+            sess.flush,
+        )
+
+    @testing.requires.multivalues_inserts
+    def test_insert_multivalues(self):
+        A, B = self.classes.A, self.classes.B
+        sess = Session()
+        sess.add_all([B(id=i) for i in range(1, 6)])
+        sess.flush()
+
+        a1 = A(id=1, bs=sess.query(B).order_by(B.id).all())
+        sess.add(a1)
+
+        # one INSERT for "left", one multiple-VALUES INSERT for "secondary"
+        self.assert_sql_count(testing.db, sess.flush, 2)
+        eq_(
+            self._secondary_rows(sess),
+            [(1, 1), (1, 2), (1, 3), (1, 4), (1, 5)],
+        )
+
+    def test_insert_chunks(self):
+        A, B = self.classes.A, self.classes.B
+        sess = Session()
+        sess.add_all([B(id=i) for i in range(1, 6)])
+        sess.flush()
+
+        a1 = A(id=1, bs=sess.query(B).order_by(B.id).all())
+        sess.add(a1)
+
+        with mock.patch.object(dependency.ManyToManyDP, "_chunksize", 4):
+            if testing.db.dialect.supports_multivalues_insert:
+                # chunks of two rows, two columns each
+                self.assert_sql_count(testing.db, sess.flush, 4)
+            else:
+                self.assert_sql_count(testing.db, sess.flush, 2)
+        eq_(
+            self._secondary_rows(sess),
+            [(1, 1), (1, 2), (1, 3), (1, 4), (1, 5)],
+        )
@@ -4,6 +4,7 @@ import logging
 import logging.handlers
 
 import sqlalchemy as sa
+from sqlalchemy import event
 from sqlalchemy import ForeignKey
 from sqlalchemy import func
 from sqlalchemy import Integer
@@ -28,6 +29,7 @@ from sqlalchemy.orm import reconstructor
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import synonym
+from sqlalchemy.orm.events import MapperEvents
 from sqlalchemy.orm.persistence import _sort_states
 from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
@@ -35,6 +37,7 @@ from sqlalchemy.testing import AssertsCompiledSQL
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
+from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
@@ -540,6 +543,144 @@ class MapperTest(_fixtures.FixtureTest, AssertsCompiledSQL):
         )
         assert m.get_property("addresses")
 
+    def test_configure_on_use_dependencies_only(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+        Order, orders = self.classes.Order, self.tables.orders
+        Keyword, keywords = self.classes.Keyword, self.tables.keywords
+
+        m = mapper(
+            User, users, properties={"addresses": relationship(Address)}
+        )
+        mapper(Address, addresses)
+        mapper(
+            Order,
+            orders,
+            properties={"user": relationship(User, backref="orders")},
+        )
+        mapper(Keyword, keywords)
+
+        assert m.get_property("orders")
+        eq_(
+            [
+                class_mapper(cls, configure=False).configured
+                for cls in (User, Address, Order, Keyword)
+            ],
+            [True, True, True, False],
+        )
+        assert sa.orm.mapperlib.Mapper._new_mappers is True
+
+        configure_mappers()
+        assert class_mapper(Keyword, configure=False).configured
+        assert sa.orm.mapperlib.Mapper._new_mappers is False
+
+    def test_configure_on_use_unrelated_mappers(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+        Order, orders = self.classes.Order, self.tables.orders
+        Item, items = self.classes.Item, self.tables.items
+        order_items = self.tables.order_items
+
+        mapper(
+            User,
+            users,
+            properties={"addresses": relationship(Address, backref="user")},
+        )
+        mapper(Address, addresses)
+        om = mapper(
+            Order,
+            orders,
+            properties={
+                "items": relationship(
+                    Item, secondary=order_items, backref="orders"
+                )
+            },
+        )
+        im = mapper(Item, items)
+
+        User()
+        assert class_mapper(Address, configure=False).configured
+        assert not om.configured
+        assert not im.configured
+
+    @testing.teardown_events(MapperEvents)
+    def test_configure_on_use_configured_events(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+        Keyword, keywords = self.classes.Keyword, self.tables.keywords
+
+        m = mapper(
+            User, users, properties={"addresses": relationship(Address)}
+        )
+        mapper(Address, addresses)
+        km = mapper(Keyword, keywords)
+
+        canary = mock.Mock()
+        event.listen(mapper, "before_configured", canary.before_configured)
+
+        @event.listens_for(mapper, "after_configured", once=True)
+        def after_configured():
+            canary.after_configured(km.configured)
+
+        # with these events present, all mappers are configured
+        # on first use
+        assert m.get_property("addresses")
+        eq_(
+            canary.mock_calls,
+            [mock.call.before_configured(), mock.call.after_configured(True)],
+        )
+
+        configure_mappers()
+        eq_(len(canary.mock_calls), 2)
+
+    def test_configure_on_use_inheritance(self):
+        users, User = self.tables.users, self.classes.User
+        Keyword, keywords = self.classes.Keyword, self.tables.keywords
+
+        class SubUser(User):
+            pass
+
+        mapper(User, users)
+        sm = mapper(SubUser, inherits=User)
+        km = mapper(Keyword, keywords)
+
+        User()
+        assert sm.configured
+        assert not km.configured
+
+    def test_configure_on_use_new_mapper(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+
+        m = mapper(User, users)
+        assert m.get_property("name")
+        assert sa.orm.mapperlib.Mapper._new_mappers is False
+
+        am = mapper(
+            Address,
+            addresses,
+            properties={"user": relationship(User, backref="addresses")},
+        )
+        assert not am.configured
+        assert m.get_property("addresses")
+        assert am.configured
+
     def test_info(self):
         users = self.tables.users
         Address = self.classes.Address
@@ -1907,7 +2048,7 @@ class MapperTest(_fixtures.FixtureTest, AssertsCompiledSQL):
             AttributeError,
             "'Table' object has no attribute 'wrong'",
             class_mapper,
-            Address,
+            User,
         )
 
     def test_key_error_raised_class_mapper(self):
@@ -1928,7 +2069,7 @@ class MapperTest(_fixtures.FixtureTest, AssertsCompiledSQL):
             },
         )
         mapper(Address, addresses)
-        assert_raises_message(KeyError, "wrong", class_mapper, Address)
+        assert_raises_message(KeyError, "wrong", class_mapper, User)
 
     def test_unmapped_subclass_error_postmap(self):
         users = self.tables.users
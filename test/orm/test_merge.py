@@ -1633,6 +1633,152 @@ class MergeTest(_fixtures.FixtureTest):
         eq_(sess.query(Address).one(), Address(id=1, email_address="c"))
 
 
+class MergeAllTest(_fixtures.FixtureTest):
+    """Session.merge_all() functionality"""
+
+    run_setup_mappers = "once"
+
+    @classmethod
+    def setup_mappers(cls):
+        User, users = cls.classes.User, cls.tables.users
+        Address, addresses = cls.classes.Address, cls.tables.addresses
+
+        mapper(
+            User,
+            users,
+            properties={
+                "addresses": relationship(
+                    Address, backref="user", order_by=addresses.c.id
+                )
+            },
+        )
+        mapper(Address, addresses)
+
+    def test_one_select_per_level(self):
+        User, Address = self.classes.User, self.classes.Address
+
+        sess = Session()
+        users = [
+            User(
+                id=7,
+                name="jack2",
+                addresses=[Address(id=1, email_address="jack2@bean.com")],
+            ),
+            User(id=8, name="ed2"),
+            User(
+                id=15,
+                name="new",
+                addresses=[Address(id=15, email_address="new@bean.com")],
+            ),
+        ]
+
+        merged = []
+
+        def go():
+            merged.extend(sess.merge_all(users))
+
+        # users, their addresses via selectin, then the remaining
+        # address which isn't present in the identity map
+        self.assert_sql_count(testing.db, go, 3)
+
+        eq_([u.name for u in merged], ["jack2", "ed2", "new"])
+        for user, merged_user in zip(users, merged):
+            assert merged_user is not user
+            in_(merged_user, sess)
+        in_(merged[2], sess.new)
+        in_(merged[0], sess.dirty)
+        eq_(
+            [a.email_address for a in merged[0].addresses],
+            ["jack2@bean.com"],
+        )
+        sess.flush()
+        sess.expunge_all()
+
+        eq_(
+            sess.query(User).order_by(User.id).all(),
+            [
+                User(
+                    id=7,
+                    name="jack2",
+                    addresses=[Address(email_address="jack2@bean.com")],
+                ),
+                User(
+                    id=8,
+                    name="ed2",
+                    addresses=[Address(id=2), Address(id=3), Address(id=4)],
+                ),
+                User(id=9),
+                User(id=10),
+                User(
+                    id=15,
+                    name="new",
+                    addresses=[Address(email_address="new@bean.com")],
+                ),
+            ],
+        )
+
+    def test_many_to_one(self):
+        User, Address = self.classes.User, self.classes.Address
+
+        sess = Session()
+        addresses = [
+            Address(id=1, user=User(id=7, name="jack2")),
+            Address(id=2, user=User(id=8, name="ed2")),
+            Address(id=3, user=User(id=8, name="ed2")),
+        ]
+
+        merged = []
+
+        def go():
+            merged.extend(sess.merge_all(addresses))
+
+        # addresses, users, and the users' addresses collections, which
+        # the backref populated on the given users
+        self.assert_sql_count(testing.db, go, 3)
+        eq_([a.user.name for a in merged], ["jack2", "ed2", "ed2"])
+        assert merged[1].user is merged[2].user
+
+    def test_missing_rows_not_reloaded(self):
+        User = self.classes.User
+
+        sess = Session()
+
+        def go():
+            merged = sess.merge_all(
+                [User(id=id_, name="u%d" % id_) for id_ in range(20, 40)]
+            )
+            eq_(len(sess.new), 20)
+            eq_(merged[5].name, "u25")
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_existing_in_identity_map(self):
+        User = self.classes.User
+
+        sess = Session()
+        u7 = sess.query(User).get(7)
+
+        def go():
+            merged = sess.merge_all([User(id=7, name="jack2")])
+            assert merged[0] is u7
+
+        self.assert_sql_count(testing.db, go, 0)
+        eq_(u7.name, "jack2")
+
+    def test_no_load(self):
+        User = self.classes.User
+
+        sess = Session()
+        u1 = Session().query(User).get(7)
+
+        def go():
+            merged = sess.merge_all([u1], load=False)
+            eq_(merged[0].name, "jack")
+            in_(merged[0], sess)
+
+        self.assert_sql_count(testing.db, go, 0)
+
+
 class M2ONoUseGetLoadingTest(fixtures.MappedTest):
     """Merge a one-to-many.  The many-to-one on the other side is set up
     so that use_get is False.   See if skipping the "m2o" merge
@@ -884,6 +884,173 @@ class GetTest(QueryTest):
         assert u.orders[1].items[2].description == "item 5"
 
 
+class GetManyTest(QueryTest):
+    def test_get_many(self):
+        User = self.classes.User
+
+        s = Session()
+        u7, u9 = s.query(User).get_many([7, 9])
+        eq_((u7.id, u9.id), (7, 9))
+
+        eq_(s.query(User).get_many([9, 19, 7, 9]), [u9, None, u7, u9])
+
+    def test_get_many_coerced_identifiers(self):
+        User = self.classes.User
+
+        s = Session()
+        users = s.query(User).get_many(["7", "8", "19"])
+        eq_([u and u.id for u in users], [7, 8, None])
+
+        eq_(s.query(User).get_many([7, "8"]), users[0:2])
+
+    def test_get_many_empty(self):
+        User = self.classes.User
+
+        s = Session()
+        eq_(s.query(User).get_many([]), [])
+
+    def test_get_many_single_select(self):
+        User = self.classes.User
+
+        s = Session()
+
+        with self.sql_execution_asserter(testing.db) as asserter:
+            users = s.query(User).get_many([8, 10, 7])
+
+        eq_([u.id for u in users], [8, 10, 7])
+        asserter.assert_(
+            CompiledSQL(
+                "SELECT users.id AS users_id, users.name AS users_name "
+                "FROM users WHERE users.id IN ([EXPANDING_primary_keys])",
+                [{"primary_keys": [8, 10, 7]}],
+            )
+        )
+
+    def test_get_many_identity_map(self):
+        User = self.classes.User
+
+        s = Session()
+        u7 = s.query(User).get(7)
+        u8 = s.query(User).get(8)
+
+        with self.sql_execution_asserter(testing.db) as asserter:
+            eq_(s.query(User).get_many([8, 7, 8]), [u8, u7, u8])
+            users = s.query(User).get_many([9, 7, 10])
+
+        eq_(users[1], u7)
+        eq_([u.id for u in users], [9, 7, 10])
+        asserter.assert_(
+            CompiledSQL(
+                "SELECT users.id AS users_id, users.name AS users_name "
+                "FROM users WHERE users.id IN ([EXPANDING_primary_keys])",
+                [{"primary_keys": [9, 10]}],
+            )
+        )
+
+    def test_get_many_populate_existing(self):
+        User = self.classes.User
+
+        s = Session()
+        u7 = s.query(User).get(7)
+        u7.name = "foo"
+
+        eq_(s.query(User).populate_existing().get_many([7]), [u7])
+        eq_(u7.name, "jack")
+
+    def test_get_many_chunks(self):
+        User = self.classes.User
+
+        s = Session()
+
+        with mock.patch(
+            "sqlalchemy.orm.loading._load_on_pk_identities_chunksize", 2
+        ):
+            with self.sql_execution_asserter(testing.db) as asserter:
+                users = s.query(User).get_many([10, 9, 8, 7, 6])
+
+        eq_([u and u.id for u in users], [10, 9, 8, 7, None])
+        asserter.assert_(
+            CompiledSQL(
+                "SELECT users.id AS users_id, users.name AS users_name "
+                "FROM users WHERE users.id IN ([EXPANDING_primary_keys])",
+                [{"primary_keys": [10, 9]}],
+            ),
+            CompiledSQL(
+                "SELECT users.id AS users_id, users.name AS users_name "
+                "FROM users WHERE users.id IN ([EXPANDING_primary_keys])",
+                [{"primary_keys": [8, 7]}],
+            ),
+            CompiledSQL(
+                "SELECT users.id AS users_id, users.name AS users_name "
+                "FROM users WHERE users.id IN ([EXPANDING_primary_keys])",
+                [{"primary_keys": [6]}],
+            ),
+        )
+
+    @testing.requires.tuple_in
+    def test_get_many_composite_pk(self):
+        CompositePk = self.classes.CompositePk
+
+        s = Session()
+        one_one = s.query(CompositePk).get((1, 1))
+
+        with self.sql_execution_asserter(testing.db) as asserter:
+            result = s.query(CompositePk).get_many(
+                [(2, 2), {"i": 1, "j": 1}, (1, 2), (5, 5)]
+            )
+
+        eq_(
+            [r and (r.i, r.j, r.k) for r in result],
+            [(2, 2, 6), (1, 1, 5), (1, 2, 3), None],
+        )
+        is_(result[1], one_one)
+        asserter.assert_(
+            CompiledSQL(
+                "SELECT composite_pk_table.i AS composite_pk_table_i, "
+                "composite_pk_table.j AS composite_pk_table_j, "
+                "composite_pk_table.k AS composite_pk_table_k "
+                "FROM composite_pk_table WHERE "
+                "(composite_pk_table.i, composite_pk_table.j) "
+                "IN ([EXPANDING_primary_keys])",
+                [{"primary_keys": [(2, 2), (1, 2), (5, 5)]}],
+            )
+        )
+
+    def test_get_many_wrong_identifier(self):
+        User = self.classes.User
+        CompositePk = self.classes.CompositePk
+
+        s = Session()
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            r"Incorrect number of values in identifier to formulate "
+            r"primary key for query.get_many\(\)",
+            s.query(User).get_many,
+            [7, (8, 9)],
+        )
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            r"Incorrect names of values in identifier to formulate "
+            r"primary key for query.get_many\(\)",
+            s.query(CompositePk).get_many,
+            [{"i": 1, "k": 2}],
+        )
+
+    def test_get_many_filtered(self):
+        User = self.classes.User
+
+        s = Session()
+        q = s.query(User).filter(User.id == 7)
+        assert_raises(sa_exc.InvalidRequestError, q.get_many, [7])
+
+    def test_session_get_many(self):
+        User = self.classes.User
+
+        s = Session()
+        u7 = s.query(User).get(7)
+        eq_(s.get_many(User, [7, 19]), [u7, None])
+
+
 class InvalidGenerationsTest(QueryTest, AssertsCompiledSQL):
     def test_no_limit_offset(self):
         User = self.classes.User
@@ -5723,3 +5890,189 @@ class QueryClsTest(QueryTest):
 
     def test_fn_m2o_lazyload(self):
         self._test_m2o_lazyload(self._fn_fixture)
+
+
+class CompileCacheTest(QueryTest):
+    @contextlib.contextmanager
+    def _compile_counter(self):
+        canary = mock.Mock()
+        real_compile_context = Query._compile_context
+
+        def _compile_context(*arg, **kw):
+            canary()
+            return real_compile_context(*arg, **kw)
+
+        with mock.patch.object(Query, "_compile_context", _compile_context):
+            yield canary
+
+    def _clear_cache(self):
+        inspect(self.classes.User)._query_cache.clear()
+        inspect(self.classes.User)._query_compiled_cache.clear()
+
+    def test_statement_reused(self):
+        User = self.classes.User
+        self._clear_cache()
+
+        with self._compile_counter() as canary:
+            for id_, name in [(7, "jack"), (8, "ed"), (9, "fred")]:
+                sess = Session()
+                eq_(sess.query(User).filter(User.id == id_).one().name, name)
+
+        eq_(canary.call_count, 1)
+
+    def test_operators_distinguished(self):
+        User = self.classes.User
+        self._clear_cache()
+        sess = Session()
+
+        eq_(
+            [u.id for u in sess.query(User).filter(User.id > 8)],
+            [9, 10],
+        )
+        eq_(sess.query(User).filter(User.id < 8).all(), [User(id=7)])
+        eq_(
+            sess.query(User.name).filter(User.name.like("%e%")).all(),
+            [("ed",), ("fred",)],
+        )
+        eq_(
+            sess.query(User.name).filter(~User.name.like("%e%")).all(),
+            [("jack",), ("chuck",)],
+        )
+
+    def test_column_entities(self):
+        User = self.classes.User
+        self._clear_cache()
+        sess = Session()
+
+        with self._compile_counter() as canary:
+            for name in ("jack", "fred"):
+                eq_(
+                    sess.query(User.name, func.count(User.id))
+                    .filter(User.name == name)
+                    .group_by(User.name)
+                    .all(),
+                    [(name, 1)],
+                )
+        eq_(canary.call_count, 1)
+
+    def test_in_differing_lengths(self):
+        User = self.classes.User
+        self._clear_cache()
+        sess = Session()
+
+        eq_(
+            sess.query(User.id).filter(User.id.in_([7, 8])).order_by(User.id)
+            .all(),
+            [(7,), (8,)],
+        )
+        eq_(
+            sess.query(User.id).filter(User.id.in_([8, 9, 10]))
+            .order_by(User.id).all(),
+            [(8,), (9,), (10,)],
+        )
+
+    def test_explicit_params(self):
+        User = self.classes.User
+        self._clear_cache()
+        sess = Session()
+
+        with self._compile_counter() as canary:
+            for id_ in (7, 8):
+                eq_(
+                    sess.query(User)
+                    .filter(User.id == bindparam("uid"))
+                    .params(uid=id_)
+                    .one()
+                    .id,
+                    id_,
+                )
+        eq_(canary.call_count, 1)
+
+    def test_limit_offset(self):
+        User = self.classes.User
+        self._clear_cache()
+        sess = Session()
+
+        q = sess.query(User.id).order_by(User.id)
+        eq_(q.limit(2).all(), [(7,), (8,)])
+        eq_(q.limit(2).offset(1).all(), [(8,), (9,)])
+        eq_(q.limit(1).all(), [(7,)])
+
+    def test_get(self):
+        User = self.classes.User
+        self._clear_cache()
+
+        with self._compile_counter() as canary:
+            for id_, name in [(7, "jack"), (8, "ed")]:
+                eq_(Session().query(User).get(id_).name, name)
+        eq_(canary.call_count, 1)
+
+    def test_options_part_of_key(self):
+        User = self.classes.User
+        self._clear_cache()
+        sess = Session()
+
+        u1 = sess.query(User).options(joinedload(User.addresses)).first()
+        assert "addresses" in u1.__dict__
+        sess.close()
+
+        u1 = sess.query(User).first()
+        assert "addresses" not in u1.__dict__
+
+    def test_aliased_not_cached(self):
+        User = self.classes.User
+        self._clear_cache()
+        sess = Session()
+
+        ua = aliased(User)
+        with self._compile_counter() as canary:
+            for id_ in (7, 8):
+                eq_(sess.query(ua).filter(ua.id == id_).one().id, id_)
+        eq_(canary.call_count, 2)
+        eq_(len(inspect(User)._query_cache), 0)
+
+    def test_compiled_cache_separate(self):
+        User = self.classes.User
+        self._clear_cache()
+
+        for id_ in (7, 8):
+            eq_(Session().query(User).filter(User.id == id_).one().id, id_)
+
+        query_cache = inspect(User)._query_cache
+        compiled_cache = inspect(User)._query_compiled_cache
+        eq_(len(query_cache), 1)
+        eq_(len(compiled_cache), 1)
+        assert not set(query_cache).intersection(compiled_cache)
+
+    def test_user_compiled_cache(self):
+        User = self.classes.User
+        self._clear_cache()
+
+        cache = {}
+        sizes = []
+        for id_ in (7, 8, 9):
+            eq_(
+                Session()
+                .query(User)
+                .execution_options(compiled_cache=cache)
+                .filter(User.id == id_)
+                .one()
+                .id,
+                id_,
+            )
+            sizes.append(len(cache))
+
+        assert sizes[0]
+        eq_(sizes[1], sizes[2])
+        eq_(len(inspect(User)._query_compiled_cache), 0)
+
+    def test_session_flag_disables(self):
+        User = self.classes.User
+        self._clear_cache()
+
+        with self._compile_counter() as canary:
+            for id_ in (7, 8):
+                sess = Session(enable_baked_queries=False)
+                eq_(sess.query(User).filter(User.id == id_).one().id, id_)
+        eq_(canary.call_count, 2)
+        eq_(len(inspect(User)._query_cache), 0)
@@ -1,3 +1,5 @@
+import functools
+
 import sqlalchemy as sa
 from sqlalchemy import event
 from sqlalchemy import ForeignKey
@@ -10,6 +12,7 @@ from sqlalchemy.orm import backref
 from sqlalchemy.orm import close_all_sessions
 from sqlalchemy.orm import create_session
 from sqlalchemy.orm import exc as orm_exc
+from sqlalchemy.orm import identity
 from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import make_transient
 from sqlalchemy.orm import make_transient_to_detached
@@ -1465,6 +1468,92 @@ class WeakIdentityMapTest(_fixtures.FixtureTest):
         assert not sess.identity_map.contains_state(u2._sa_instance_state)
 
 
+class LRUIdentityMapTest(_fixtures.FixtureTest):
+    run_inserts = None
+
+    def _fixture(self, capacity=3):
+        users, User = self.tables.users, self.classes.User
+
+        mapper(User, users)
+
+        s = Session(
+            identity_map_cls=functools.partial(
+                identity.LRUInstanceDict, capacity=capacity
+            )
+        )
+        s.add_all([User(id=i, name="user %d" % i) for i in range(1, 11)])
+        s.commit()
+        s.close()
+        return s, User
+
+    @testing.requires.predictable_gc
+    def test_bounded(self):
+        s, User = self._fixture()
+
+        s.query(User).order_by(User.id).all()
+        gc_collect()
+
+        eq_(sorted(key[1] for key in s.identity_map), [(8,), (9,), (10,)])
+
+    @testing.requires.predictable_gc
+    def test_lookup_maintains_reference(self):
+        s, User = self._fixture()
+
+        s.query(User).order_by(User.id).all()
+        s.query(User).get(8)
+        s.query(User).filter(User.id.in_([4, 5])).all()
+        gc_collect()
+
+        eq_(sorted(key[1] for key in s.identity_map), [(4,), (5,), (8,)])
+
+    @testing.requires.predictable_gc
+    def test_modified_not_discarded(self):
+        s, User = self._fixture()
+
+        s.query(User).get(1).name = "modified"
+        with s.no_autoflush:
+            s.query(User).order_by(User.id).all()
+        gc_collect()
+
+        eq_(
+            sorted(key[1] for key in s.identity_map),
+            [(1,), (8,), (9,), (10,)],
+        )
+        s.commit()
+        eq_(s.query(User.name).filter_by(id=1).scalar(), "modified")
+
+    def test_expunge(self):
+        s, User = self._fixture()
+
+        u1 = s.query(User).get(1)
+        s.expunge(u1)
+        eq_(len(s.identity_map._strong_refs), 0)
+
+    def test_hit_rate(self):
+        s, User = self._fixture()
+
+        is_(s.identity_map.hit_rate, None)
+
+        u1 = s.query(User).get(1)
+        is_(s.query(User).get(1), u1)
+        s.query(User).filter_by(id=1).one()
+
+        # the initial get() misses both for the get() itself as
+        # well as for the loading of the row
+        eq_(s.identity_map.misses, 2)
+        eq_(s.identity_map.hits, 2)
+        eq_(s.identity_map.hit_rate, 0.5)
+
+    def test_new_map_on_expunge_all(self):
+        s, User = self._fixture()
+
+        s.query(User).get(1)
+        s.expunge_all()
+
+        assert isinstance(s.identity_map, identity.LRUInstanceDict)
+        eq_(len(s.identity_map), 0)
+
+
 class IsModifiedTest(_fixtures.FixtureTest):
     run_inserts = None
 
@@ -1655,7 +1744,7 @@ class SessionInterface(fixtures.TestBase):
     def _public_session_methods(self):
         Session = sa.orm.session.Session
 
-        blacklist = set(("begin", "query"))
+        blacklist = set(("begin", "query", "get_many"))
 
         ok = set()
         for meth in Session.public_methods:
@@ -1725,6 +1814,8 @@ class SessionInterface(fixtures.TestBase):
 
         raises_("refresh", user_arg)
 
+        raises_("refresh_all", (user_arg,))
+
         instance_methods = (
             self._public_session_methods()
             - self._class_methods
@@ -1,3 +1,5 @@
+import itertools
+
 from sqlalchemy import cast
 from sqlalchemy import event
 from sqlalchemy import exc
@@ -14,9 +16,11 @@ from sqlalchemy import text
 from sqlalchemy import util
 from sqlalchemy.orm import attributes
 from sqlalchemy.orm import backref
+from sqlalchemy.orm import class_mapper
 from sqlalchemy.orm import create_session
 from sqlalchemy.orm import exc as orm_exc
 from sqlalchemy.orm import mapper
+from sqlalchemy.orm import persistence
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import unitofwork
@@ -117,8 +121,9 @@ class RudimentaryFlushTest(UOWTest):
             testing.db,
             sess.flush,
             CompiledSQL(
-                "DELETE FROM addresses WHERE addresses.id = :id",
-                [{"id": a1.id}, {"id": a2.id}],
+                "DELETE FROM addresses WHERE addresses.id IN "
+                "([EXPANDING_primary_keys])",
+                [{"primary_keys": [a1.id, a2.id]}],
             ),
             CompiledSQL(
                 "DELETE FROM users WHERE users.id = :id", {"id": u1.id}
@@ -147,10 +152,9 @@ class RudimentaryFlushTest(UOWTest):
             sess.flush,
             CompiledSQL(
                 "UPDATE addresses SET user_id=:user_id WHERE "
-                "addresses.id = :addresses_id",
+                "addresses.id IN ([EXPANDING_primary_keys])",
                 lambda ctx: [
-                    {"addresses_id": a1.id, "user_id": None},
-                    {"addresses_id": a2.id, "user_id": None},
+                    {"user_id": None, "primary_keys": [a1.id, a2.id]}
                 ],
             ),
             CompiledSQL(
@@ -222,8 +226,9 @@ class RudimentaryFlushTest(UOWTest):
             testing.db,
             sess.flush,
             CompiledSQL(
-                "DELETE FROM addresses WHERE addresses.id = :id",
-                [{"id": a1.id}, {"id": a2.id}],
+                "DELETE FROM addresses WHERE addresses.id IN "
+                "([EXPANDING_primary_keys])",
+                [{"primary_keys": [a1.id, a2.id]}],
             ),
             CompiledSQL(
                 "DELETE FROM users WHERE users.id = :id", {"id": u1.id}
@@ -257,10 +262,9 @@ class RudimentaryFlushTest(UOWTest):
             sess.flush,
             CompiledSQL(
                 "UPDATE addresses SET user_id=:user_id WHERE "
-                "addresses.id = :addresses_id",
+                "addresses.id IN ([EXPANDING_primary_keys])",
                 lambda ctx: [
-                    {"addresses_id": a1.id, "user_id": None},
-                    {"addresses_id": a2.id, "user_id": None},
+                    {"user_id": None, "primary_keys": [a1.id, a2.id]}
                 ],
             ),
             CompiledSQL(
@@ -339,8 +343,9 @@ class RudimentaryFlushTest(UOWTest):
                     lambda ctx: {"param_1": pid},
                 ),
                 CompiledSQL(
-                    "DELETE FROM addresses WHERE addresses.id = :id",
-                    lambda ctx: [{"id": c1id}, {"id": c2id}],
+                    "DELETE FROM addresses WHERE addresses.id IN "
+                    "([EXPANDING_primary_keys])",
+                    lambda ctx: [{"primary_keys": [c1id, c2id]}],
                 ),
                 CompiledSQL(
                     "DELETE FROM users WHERE users.id = :id",
@@ -409,8 +414,9 @@ class RudimentaryFlushTest(UOWTest):
                 ),
             ),
             CompiledSQL(
-                "DELETE FROM addresses WHERE addresses.id = :id",
-                lambda ctx: [{"id": c1id}, {"id": c2id}],
+                "DELETE FROM addresses WHERE addresses.id IN "
+                "([EXPANDING_primary_keys])",
+                lambda ctx: [{"primary_keys": [c1id, c2id]}],
             ),
         )
 
@@ -473,8 +479,9 @@ class RudimentaryFlushTest(UOWTest):
                 ),
             ),
             CompiledSQL(
-                "DELETE FROM addresses WHERE addresses.id = :id",
-                lambda ctx: [{"id": c1id}, {"id": c2id}],
+                "DELETE FROM addresses WHERE addresses.id IN "
+                "([EXPANDING_primary_keys])",
+                lambda ctx: [{"primary_keys": [c1id, c2id]}],
             ),
         )
 
@@ -828,10 +835,9 @@ class SingleCycleTest(UOWTest):
             AllOf(
                 CompiledSQL(
                     "UPDATE nodes SET parent_id=:parent_id "
-                    "WHERE nodes.id = :nodes_id",
+                    "WHERE nodes.id IN ([EXPANDING_primary_keys])",
                     lambda ctx: [
-                        {"nodes_id": n3.id, "parent_id": None},
-                        {"nodes_id": n2.id, "parent_id": None},
+                        {"parent_id": None, "primary_keys": [n2.id, n3.id]}
                     ],
                 )
             ),
@@ -1323,11 +1329,12 @@ class SingleCycleM2MTest(
             CompiledSQL(
                 "DELETE FROM node_to_nodes WHERE "
                 "node_to_nodes.left_node_id = :left_node_id AND "
-                "node_to_nodes.right_node_id = :right_node_id",
+                "node_to_nodes.right_node_id IN ([EXPANDING_related_keys])",
                 lambda ctx: [
-                    {"right_node_id": n2.id, "left_node_id": n1.id},
-                    {"right_node_id": n3.id, "left_node_id": n1.id},
-                    {"right_node_id": n4.id, "left_node_id": n1.id},
+                    {
+                        "left_node_id": n1.id,
+                        "related_keys": sorted([n2.id, n3.id, n4.id]),
+                    }
                 ],
             ),
             CompiledSQL(
@@ -1347,16 +1354,31 @@ class SingleCycleM2MTest(
         self.assert_sql_execution(
             testing.db,
             sess.flush,
-            CompiledSQL(
-                "DELETE FROM node_to_nodes WHERE node_to_nodes.left_node_id "
-                "= :left_node_id AND node_to_nodes.right_node_id = "
-                ":right_node_id",
-                lambda ctx: [
-                    {"right_node_id": n5.id, "left_node_id": n3.id},
-                    {"right_node_id": n4.id, "left_node_id": n3.id},
-                    {"right_node_id": n3.id, "left_node_id": n2.id},
-                    {"right_node_id": n5.id, "left_node_id": n2.id},
-                ],
+            AllOf(
+                CompiledSQL(
+                    "DELETE FROM node_to_nodes WHERE "
+                    "node_to_nodes.left_node_id = :left_node_id AND "
+                    "node_to_nodes.right_node_id IN "
+                    "([EXPANDING_related_keys])",
+                    lambda ctx: [
+                        {
+                            "left_node_id": n3.id,
+                            "related_keys": sorted([n4.id, n5.id]),
+                        }
+                    ],
+                ),
+                CompiledSQL(
+                    "DELETE FROM node_to_nodes WHERE "
+                    "node_to_nodes.left_node_id = :left_node_id AND "
+                    "node_to_nodes.right_node_id IN "
+                    "([EXPANDING_related_keys])",
+                    lambda ctx: [
+                        {
+                            "left_node_id": n2.id,
+                            "related_keys": sorted([n3.id, n5.id]),
+                        }
+                    ],
+                ),
             ),
             CompiledSQL(
                 "DELETE FROM nodes WHERE nodes.id = :id",
@@ -1369,6 +1391,110 @@ class SingleCycleM2MTest(
         )
 
 
+class FlushPlanTest(UOWTest):
+    def _o2m_fixture(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+
+        mapper(User, users, properties={"addresses": relationship(Address)})
+        mapper(Address, addresses)
+        return User, Address
+
+    def _self_referential_fixture(self):
+        Node, nodes = self.classes.Node, self.tables.nodes
+
+        mapper(Node, nodes, properties={"children": relationship(Node)})
+        return Node
+
+    def test_plan_reused(self):
+        User, Address = self._o2m_fixture()
+
+        with patch.object(
+            unitofwork.topological,
+            "find_cycles",
+            Mock(side_effect=unitofwork.topological.find_cycles),
+        ) as find_cycles:
+            for i in range(3):
+                sess = create_session()
+                sess.add(
+                    User(
+                        name="u%d" % i, addresses=[Address(email_address="e")]
+                    )
+                )
+                sess.flush()
+
+        eq_(find_cycles.call_count, 1)
+
+        sess = create_session()
+        eq_(
+            [
+                (u.name, len(u.addresses))
+                for u in sess.query(User).order_by(User.id)
+            ],
+            [("u0", 1), ("u1", 1), ("u2", 1)],
+        )
+
+    def test_plan_per_operation(self):
+        User, Address = self._o2m_fixture()
+
+        def plans():
+            return len(
+                class_mapper(User)._memoized_values[("flush_plans",)]
+            )
+
+        sess = create_session()
+        u1 = User(name="u1", addresses=[Address(email_address="e")])
+        sess.add(u1)
+        sess.flush()
+        eq_(plans(), 1)
+
+        # a different set of mappers
+        u1.name = "u1 modified"
+        sess.flush()
+        eq_(plans(), 2)
+
+        u1.name = "u1 modified again"
+        sess.flush()
+        eq_(plans(), 2)
+
+        # deleting involves the same actions and dependencies as the
+        # first flush, which are sorted in the same way
+        sess.delete(u1)
+        sess.flush()
+        eq_(plans(), 2)
+        eq_(sess.query(User).count(), 0)
+        eq_(sess.query(Address.user_id).all(), [(None,)])
+
+    def test_plan_with_cycles(self):
+        Node = self._self_referential_fixture()
+
+        with patch.object(
+            unitofwork.topological,
+            "find_cycles",
+            Mock(side_effect=unitofwork.topological.find_cycles),
+        ) as find_cycles:
+            for i in range(3):
+                sess = create_session()
+                sess.add(Node(data="n%d" % i, children=[Node(data="c")]))
+                sess.flush()
+
+        eq_(find_cycles.call_count, 1)
+
+        sess = create_session()
+        eq_(
+            sorted(
+                (n.data, len(n.children))
+                for n in sess.query(Node)
+                if n.data != "c"
+            ),
+            [("n0", 1), ("n1", 1), ("n2", 1)],
+        )
+
+
 class RowswitchAccountingTest(fixtures.MappedTest):
     @classmethod
     def define_tables(cls, metadata):
@@ -1840,9 +1966,13 @@ class BasicStaleChecksTest(fixtures.MappedTest):
         # if the dialect reports supports_sane_multi_rowcount as false,
         # if there were more than one row deleted, need to ensure the
         # rowcount result is ignored.  psycopg2 + batch mode reports the
-        # wrong number, not -1. see issue #4661
+        # wrong number, not -1. see issue #4661.  a batched DELETE .. IN
+        # is a single statement whose rowcount is checked, so use the
+        # executemany form here.
         with patch.object(
             config.db.dialect, "supports_sane_multi_rowcount", False
+        ), patch.object(
+            persistence, "_use_batched_delete", return_value=False
         ):
             # no warning
             sess.flush()
@@ -1862,6 +1992,389 @@ class BasicStaleChecksTest(fixtures.MappedTest):
         sess.flush()
 
 
+class BatchDeletesTest(fixtures.MappedTest, testing.AssertsExecutionResults):
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "t",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(50)),
+        )
+        Table(
+            "ct",
+            metadata,
+            Column("id1", Integer, primary_key=True),
+            Column("id2", Integer, primary_key=True),
+            Column("data", String(50)),
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class T(cls.Basic):
+            pass
+
+        class CT(cls.Basic):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        mapper(cls.classes.T, cls.tables.t)
+        mapper(cls.classes.CT, cls.tables.ct)
+
+    def _t_fixture(self, num):
+        T = self.classes.T
+        sess = Session()
+        objects = [T(id=i, data="t%d" % i) for i in range(1, num + 1)]
+        sess.add_all(objects)
+        sess.flush()
+        for obj in objects:
+            sess.delete(obj)
+        return sess
+
+    def test_delete_in(self):
+        sess = self._t_fixture(3)
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "DELETE FROM t WHERE t.id IN ([EXPANDING_primary_keys])",
+                [{"primary_keys": [1, 2, 3]}],
+            ),
+        )
+        eq_(sess.query(self.classes.T).count(), 0)
+
+    def test_delete_single_row(self):
+        sess = self._t_fixture(1)
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL("DELETE FROM t WHERE t.id = :id", [{"id": 1}]),
+        )
+
+    def test_delete_chunks(self):
+        sess = self._t_fixture(5)
+
+        with patch.object(persistence, "_batched_delete_chunksize", 2):
+            self.assert_sql_execution(
+                testing.db,
+                sess.flush,
+                CompiledSQL(
+                    "DELETE FROM t WHERE t.id IN ([EXPANDING_primary_keys])",
+                    [{"primary_keys": [1, 2]}],
+                ),
+                CompiledSQL(
+                    "DELETE FROM t WHERE t.id IN ([EXPANDING_primary_keys])",
+                    [{"primary_keys": [3, 4]}],
+                ),
+                CompiledSQL(
+                    "DELETE FROM t WHERE t.id IN ([EXPANDING_primary_keys])",
+                    [{"primary_keys": [5]}],
+                ),
+            )
+        eq_(sess.query(self.classes.T).count(), 0)
+
+    def test_delete_no_sane_rowcount(self):
+        sess = self._t_fixture(2)
+
+        with patch.object(config.db.dialect, "supports_sane_rowcount", False):
+            self.assert_sql_execution(
+                testing.db,
+                sess.flush,
+                CompiledSQL(
+                    "DELETE FROM t WHERE t.id = :id", [{"id": 1}, {"id": 2}]
+                ),
+            )
+
+    def test_delete_stale_no_sane_multi_rowcount(self):
+        sess = self._t_fixture(3)
+        sess.execute(self.tables.t.delete().where(self.tables.t.c.id == 2))
+
+        with patch.object(
+            config.db.dialect, "supports_sane_multi_rowcount", False
+        ):
+            with testing.expect_warnings(
+                r"DELETE statement on table 't' expected to delete 3 "
+                r"row\(s\); 2 were matched."
+            ):
+                sess.flush()
+
+    def _ct_fixture(self):
+        CT = self.classes.CT
+        sess = Session()
+        objects = [
+            CT(id1=1, id2=1, data="c1"),
+            CT(id1=1, id2=2, data="c2"),
+            CT(id1=2, id2=1, data="c3"),
+        ]
+        sess.add_all(objects)
+        sess.flush()
+        for obj in objects:
+            sess.delete(obj)
+        return sess
+
+    @testing.requires.tuple_in
+    def test_delete_composite_in(self):
+        sess = self._ct_fixture()
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "DELETE FROM ct WHERE (ct.id1, ct.id2) IN "
+                "([EXPANDING_primary_keys])",
+                [{"primary_keys": [(1, 1), (1, 2), (2, 1)]}],
+            ),
+        )
+        eq_(sess.query(self.classes.CT).count(), 0)
+
+    def test_delete_composite_no_tuple_in(self):
+        sess = self._ct_fixture()
+
+        with patch.object(config.db.dialect, "supports_tuple_in", False):
+            self.assert_sql_execution(
+                testing.db,
+                sess.flush,
+                CompiledSQL(
+                    "DELETE FROM ct WHERE ct.id1 = :id1 AND ct.id2 = :id2",
+                    [
+                        {"id1": 1, "id2": 1},
+                        {"id1": 1, "id2": 2},
+                        {"id1": 2, "id2": 1},
+                    ],
+                ),
+            )
+        eq_(sess.query(self.classes.CT).count(), 0)
+
+
+class CoalescedUpdatesTest(
+    fixtures.MappedTest, testing.AssertsExecutionResults
+):
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "t",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(50)),
+            Column("status", String(50)),
+        )
+        Table(
+            "ct",
+            metadata,
+            Column("id1", Integer, primary_key=True),
+            Column("id2", Integer, primary_key=True),
+            Column("status", String(50)),
+        )
+
+        def row_label(context):
+            params = context.get_current_parameters()
+            return "%s-%s" % (params["status"], params["ctx_t_id"])
+
+        Table(
+            "ctx_t",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("status", String(50)),
+            Column("label", String(50), onupdate=row_label),
+        )
+
+        counter = itertools.count()
+        Table(
+            "counter_t",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("status", String(50)),
+            Column("counter", Integer, onupdate=lambda: next(counter)),
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class T(cls.Basic):
+            pass
+
+        class CT(cls.Basic):
+            pass
+
+        class CtxT(cls.Basic):
+            pass
+
+        class CounterT(cls.Basic):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        mapper(cls.classes.T, cls.tables.t)
+        mapper(cls.classes.CT, cls.tables.ct)
+        mapper(cls.classes.CtxT, cls.tables.ctx_t)
+        mapper(cls.classes.CounterT, cls.tables.counter_t)
+
+    def _t_fixture(self, num):
+        T = self.classes.T
+        sess = Session()
+        objects = [T(id=i, data="t%d" % i) for i in range(1, num + 1)]
+        sess.add_all(objects)
+        sess.flush()
+        return sess, objects
+
+    def test_update_in(self):
+        sess, objects = self._t_fixture(3)
+        for obj in objects:
+            obj.status = "archived"
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "UPDATE t SET status=:status WHERE t.id IN "
+                "([EXPANDING_primary_keys])",
+                [{"status": "archived", "primary_keys": [1, 2, 3]}],
+            ),
+        )
+        eq_(
+            sess.query(self.classes.T.status).distinct().all(),
+            [("archived",)],
+        )
+
+    def test_update_distinct_values(self):
+        sess, objects = self._t_fixture(3)
+        for obj in objects:
+            obj.status = "s%d" % obj.id
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "UPDATE t SET status=:status WHERE t.id = :t_id",
+                [
+                    {"status": "s1", "t_id": 1},
+                    {"status": "s2", "t_id": 2},
+                    {"status": "s3", "t_id": 3},
+                ],
+            ),
+        )
+
+    def test_update_runs(self):
+        sess, objects = self._t_fixture(5)
+        for obj, status in zip(objects, ["a", "a", "b", "a", "a"]):
+            obj.status = status
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "UPDATE t SET status=:status WHERE t.id IN "
+                "([EXPANDING_primary_keys])",
+                [{"status": "a", "primary_keys": [1, 2]}],
+            ),
+            CompiledSQL(
+                "UPDATE t SET status=:status WHERE t.id = :t_id",
+                [{"status": "b", "t_id": 3}],
+            ),
+            CompiledSQL(
+                "UPDATE t SET status=:status WHERE t.id IN "
+                "([EXPANDING_primary_keys])",
+                [{"status": "a", "primary_keys": [4, 5]}],
+            ),
+        )
+
+    def test_update_chunks(self):
+        sess, objects = self._t_fixture(5)
+        for obj in objects:
+            obj.status = "archived"
+
+        with patch.object(persistence, "_batched_update_chunksize", 2):
+            self.assert_sql_execution(
+                testing.db,
+                sess.flush,
+                CompiledSQL(
+                    "UPDATE t SET status=:status WHERE t.id IN "
+                    "([EXPANDING_primary_keys])",
+                    [{"status": "archived", "primary_keys": [1, 2]}],
+                ),
+                CompiledSQL(
+                    "UPDATE t SET status=:status WHERE t.id IN "
+                    "([EXPANDING_primary_keys])",
+                    [{"status": "archived", "primary_keys": [3, 4]}],
+                ),
+                CompiledSQL(
+                    "UPDATE t SET status=:status WHERE t.id IN "
+                    "([EXPANDING_primary_keys])",
+                    [{"status": "archived", "primary_keys": [5]}],
+                ),
+            )
+
+    def test_update_stale(self):
+        sess, objects = self._t_fixture(3)
+        sess.execute(self.tables.t.delete().where(self.tables.t.c.id == 2))
+        for obj in objects:
+            obj.status = "archived"
+
+        assert_raises_message(
+            orm_exc.StaleDataError,
+            r"UPDATE statement on table 't' expected to update 3 row\(s\); "
+            "2 were matched.",
+            sess.flush,
+        )
+
+    @testing.requires.tuple_in
+    def test_update_composite_in(self):
+        CT = self.classes.CT
+        sess = Session()
+        objects = [CT(id1=1, id2=1), CT(id1=1, id2=2), CT(id1=2, id2=1)]
+        sess.add_all(objects)
+        sess.flush()
+        for obj in objects:
+            obj.status = "archived"
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "UPDATE ct SET status=:status WHERE (ct.id1, ct.id2) IN "
+                "([EXPANDING_primary_keys])",
+                [
+                    {
+                        "status": "archived",
+                        "primary_keys": [(1, 1), (1, 2), (2, 1)],
+                    }
+                ],
+            ),
+        )
+
+    def test_no_coalesce_context_onupdate(self):
+        CtxT = self.classes.CtxT
+        sess = Session()
+        objects = [CtxT(id=i) for i in range(1, 4)]
+        sess.add_all(objects)
+        sess.flush()
+        for obj in objects:
+            obj.status = "archived"
+        sess.flush()
+
+        eq_(
+            sess.query(CtxT.label).order_by(CtxT.id).all(),
+            [("archived-1",), ("archived-2",), ("archived-3",)],
+        )
+
+    def test_no_coalesce_callable_onupdate(self):
+        CounterT = self.classes.CounterT
+        sess = Session()
+        objects = [CounterT(id=i) for i in range(1, 4)]
+        sess.add_all(objects)
+        sess.flush()
+        for obj in objects:
+            obj.status = "archived"
+        sess.flush()
+
+        counters = [
+            c for (c,) in sess.query(CounterT.counter).order_by(CounterT.id)
+        ]
+        eq_(counters, [counters[0], counters[0] + 1, counters[0] + 2])
+
+
 class BatchInsertsTest(fixtures.MappedTest, testing.AssertsExecutionResults):
     @classmethod
     def define_tables(cls, metadata):
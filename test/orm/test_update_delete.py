@@ -4,6 +4,7 @@ from sqlalchemy import column
 from sqlalchemy import exc
 from sqlalchemy import ForeignKey
 from sqlalchemy import func
+from sqlalchemy import inspect
 from sqlalchemy import Integer
 from sqlalchemy import or_
 from sqlalchemy import select
@@ -670,6 +671,155 @@ class UpdateDeleteTest(fixtures.MappedTest):
         )
         assert john not in sess
 
+    def _returning_fixture(self, q, rows):
+        result = mock.Mock(
+            rowcount=len(rows), fetchall=mock.Mock(return_value=rows)
+        )
+        return (
+            mock.patch.object(
+                q, "_crud_returning_supported", return_value=True
+            ),
+            mock.patch.object(q, "_execute_crud", return_value=result),
+        )
+
+    def test_fetch_update_returning_refreshes(self):
+        User = self.classes.User
+
+        sess = Session()
+        john, jack = (
+            sess.query(User).filter(User.id.in_([1, 2])).order_by(User.id)
+        )
+
+        q = sess.query(User)
+        returning_supported, execute_crud = self._returning_fixture(
+            q, [(1, 30)]
+        )
+        with returning_supported, execute_crud as exec_:
+            q.filter(User.id == 1).update(
+                {"age": 30}, synchronize_session="fetch"
+            )
+
+        eq_(
+            [c.key for c in exec_.mock_calls[0][1][0]._returning],
+            ["id", "age_int"],
+        )
+
+        def go():
+            eq_(john.age, 30)
+            eq_(jack.age, 47)
+            assert john not in sess.dirty
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_fetch_update_returning_expires_modified(self):
+        User = self.classes.User
+
+        sess = Session(autoflush=False)
+        john = sess.query(User).filter_by(id=1).one()
+        john.age = 50
+
+        q = sess.query(User).autoflush(False)
+        returning_supported, execute_crud = self._returning_fixture(
+            q, [(1, 30)]
+        )
+        with returning_supported, execute_crud:
+            q.filter(User.id == 1).update(
+                {"age": 30}, synchronize_session="fetch"
+            )
+
+        assert "age" not in john.__dict__
+
+    def test_fetch_delete_returning(self):
+        User = self.classes.User
+
+        sess = Session()
+        john, jack = (
+            sess.query(User).filter(User.id.in_([1, 2])).order_by(User.id)
+        )
+
+        q = sess.query(User)
+        returning_supported, execute_crud = self._returning_fixture(
+            q, [(1,)]
+        )
+        with returning_supported, execute_crud as exec_:
+            q.filter(User.id == 1).delete(synchronize_session="fetch")
+
+        eq_(
+            [c.key for c in exec_.mock_calls[0][1][0]._returning], ["id"]
+        )
+        assert john not in sess
+        assert jack in sess
+
+    def test_fetch_update_pk_no_returning(self):
+        User = self.classes.User
+
+        sess = Session()
+        john = sess.query(User).filter_by(id=1).one()
+
+        q = sess.query(User)
+        returning_supported, execute_crud = self._returning_fixture(
+            q, [(1,)]
+        )
+        with returning_supported, execute_crud as exec_:
+            q.filter(User.id == 1).update(
+                {"id": 10, "age": 30}, synchronize_session="fetch"
+            )
+
+        # the primary key is SELECTed ahead of the UPDATE instead
+        is_(exec_.mock_calls[0][1][0]._returning, None)
+        assert "age" not in john.__dict__
+
+    def test_returning_supported_implicit_returning(self):
+        User = self.classes.User
+        users = self.tables.users
+
+        sess = Session()
+        q = sess.query(User)
+        dialect = sess.get_bind(User).dialect
+        with mock.patch.object(dialect, "full_returning", True):
+            is_(q._crud_returning_supported(inspect(User), users), True)
+            with mock.patch.object(users, "implicit_returning", False):
+                is_(
+                    q._crud_returning_supported(inspect(User), users),
+                    False,
+                )
+
+    @testing.requires.full_returning
+    def test_fetch_update_returning_backend(self):
+        User = self.classes.User
+
+        sess = Session()
+        john, jack, jill, jane = sess.query(User).order_by(User.id).all()
+
+        def go():
+            sess.query(User).filter(User.age > 29).update(
+                {"age": User.age - 10}, synchronize_session="fetch"
+            )
+
+        # no SELECT is emitted ahead of the UPDATE
+        self.assert_sql_count(testing.db, go, 1)
+
+        def go():
+            eq_([john.age, jack.age, jill.age, jane.age], [25, 37, 29, 27])
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    @testing.requires.full_returning
+    def test_fetch_delete_returning_backend(self):
+        User = self.classes.User
+
+        sess = Session()
+        john, jack, jill, jane = sess.query(User).order_by(User.id).all()
+
+        def go():
+            sess.query(User).filter(User.age > 29).delete(
+                synchronize_session="fetch"
+            )
+
+        self.assert_sql_count(testing.db, go, 1)
+        assert john in sess and jill in sess
+        assert jack not in sess and jane not in sess
+
     def test_update_unordered_dict(self):
         User = self.classes.User
         session = Session()